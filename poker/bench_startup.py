@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark the startup time of the poker command-line tools.
+
+Each target is imported in a fresh interpreter several times and the median
+wall time is reported, so the numbers reflect what a short-lived CLI pays
+before it can do any work.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Modules imported by the entry points, roughly from lightest to heaviest
+TARGETS = [
+    "poker_game",
+    "poker_game.main",
+    "poker_game.equity",
+    "poker_game.cards",
+    "poker_game.hand_evaluator",
+    "poker_game.game",
+    "poker_game.server",
+]
+
+
+def time_import(module: str, runs: int) -> float:
+    """Return the median milliseconds to start Python and import a module."""
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", f"import {module}"], env=env, check=True)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    """Time each target and print a table (or JSON)."""
+    parser = argparse.ArgumentParser(description="Measure poker CLI startup time.")
+    parser.add_argument("modules", nargs="*", default=TARGETS, help="modules to import")
+    parser.add_argument("--runs", type=int, default=10, help="interpreter launches per module")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+    
+    baseline = time_import("sys", args.runs)
+    results = {module: time_import(module, args.runs) for module in args.modules}
+    
+    if args.json:
+        print(json.dumps({"baseline_ms": baseline, "imports_ms": results}, indent=2))
+        return
+    
+    print(f"{'module':<28} {'total ms':>9} {'import ms':>10}")
+    print(f"{'(bare interpreter)':<28} {baseline:>9.1f} {0:>10.1f}")
+    for module, total in results.items():
+        print(f"{module:<28} {total:>9.1f} {total - baseline:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,37 @@
 """
 Poker game package.
+
+Public names are imported lazily on first access so that short-lived tools
+(for example an equity query) only pay for the modules they actually use.
 """
-from .game import PokerGame
-from .player import HumanPlayer, AIPlayer
-from .cards import Card, Deck, Rank, Suit
-from .hand_evaluator import PokerHand, HandRank
+import importlib
+from typing import Any
+
+_EXPORTS = {
+    'PokerGame': '.game',
+    'HumanPlayer': '.player',
+    'AIPlayer': '.player',
+    'Card': '.cards',
+    'Deck': '.cards',
+    'Rank': '.cards',
+    'Suit': '.cards',
+    'PokerHand': '.hand_evaluator',
+    'HandRank': '.hand_evaluator',
+}
 
 __all__ = ['PokerGame', 'HumanPlayer', 'AIPlayer', 'Card', 'Deck', 'Rank', 'Suit', 'PokerHand', 'HandRank']
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names from their modules on first use."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include the lazily imported names in ``dir()``."""
+    return sorted(list(globals()) + __all__)
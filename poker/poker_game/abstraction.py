@@ -0,0 +1,449 @@
+"""
+Card abstraction: equity-histogram buckets keyed by canonical hands.
+
+Solvers and learned strategies cannot tell apart every hand, so hands that
+play alike are grouped into buckets.  A hand is described by the histogram
+of its river equity (against one random hand) over the cards still to
+come, and hands are clustered with k-means on the cumulative histograms,
+which makes the distance between two hands close to the earth mover's
+distance between their histograms.  Buckets are numbered from the weakest
+mean equity to the strongest.
+
+Suit isomorphic hands (A♥K♥ on Q♥7♦2♣ and A♠K♠ on Q♠7♣2♦, say) always land
+in the same bucket, so every hand is stored under a canonical key: the
+cards relabelled with the suit permutation that gives the smallest board
+and then the smallest hole cards.
+
+The expensive part is the river equity of every hole pair on a board.  One
+sweep over the 1,081 hole pairs a river board allows, sorted by strength,
+gives all of them at once (``river_equities``), and every hole pair on a
+flop shares the same runouts, so a flop costs one sweep per sampled runout
+no matter how many hands it holds.  Preflop (169 hands) and all 1,286,792
+canonical flop hands are built in full (the command line can spread the
+1,755 canonical flops over worker processes; the lazy table is built in the
+calling process, so it is safe inside servers and pool workers); the turn
+and river are too large to store, so their centroids are trained on sampled
+boards and hands there are assigned when asked for, from runouts sampled in
+the canonical suits.  The tables are sorted arrays of keys with one small bucket
+number each, looked up by binary search::
+    
+    python -m poker_game.abstraction --processes 8
+
+NumPy is an optional dependency: install ``poker-game[solver]``.
+"""
+import argparse
+import functools
+import itertools
+import os
+import random
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError("The card abstraction needs NumPy: install poker-game[solver]") from e
+
+from .cards import Card
+from .evaluator import evaluate_masks, from_cards
+from .outs import add_rank, hand_masks
+from .tables import LazyTable
+
+STREETS = ("preflop", "flop", "turn", "river")
+BOARD_SIZES = (0, 3, 4, 5)
+SUIT_PERMUTATIONS = list(itertools.permutations(range(4)))
+# Each suit permutation as a card-to-card map
+_RELABEL = [[card & ~3 | permutation[card & 3] for card in range(52)] for permutation in SUIT_PERMUTATIONS]
+
+COMBO_COUNT = 1326
+COMBOS = [(a, b) for a in range(52) for b in range(a)]
+
+
+class AbstractionConfig(NamedTuple):
+    """How the abstraction is built."""
+    buckets: Tuple[int, ...] = (10, 50, 50, 50)
+    bins: int = 10
+    preflop_boards: int = 1000
+    flop_runouts: int = 48
+    turn_boards: int = 100
+    turn_runouts: int = 12
+    river_boards: int = 200
+    seed: int = 0
+
+
+class BucketTable(NamedTuple):
+    """One street's buckets: sorted canonical keys, their buckets and the cluster centres."""
+    keys: "np.ndarray"
+    buckets: "np.ndarray"
+    centroids: "np.ndarray"
+
+
+def combo_index(first: int, second: int) -> int:
+    """Return the index (0-1325) of a pair of distinct cards."""
+    if first < second:
+        first, second = second, first
+    return first * (first - 1) // 2 + second
+
+
+def canonical_hand(hole: Sequence[int], board: Sequence[int] = ()) -> Tuple[List[int], List[int]]:
+    """Return the hole cards and board, highest card first, relabelled to their canonical suits."""
+    board_cards, hole_cards = min(
+        (sorted([relabel[card] for card in board], reverse=True),
+         sorted([relabel[card] for card in hole], reverse=True))
+        for relabel in _RELABEL
+    )
+    return hole_cards, board_cards
+
+
+def canonical_key(hole: Sequence[int], board: Sequence[int] = ()) -> int:
+    """Return the same integer for every suit-isomorphic version of a hand."""
+    hole, board = canonical_hand(hole, board)
+    return _encode(board + hole)
+
+
+def _encode(cards: Sequence[int]) -> int:
+    """Pack up to ten cards into one integer, six bits each."""
+    key = 0
+    for card in cards:
+        key = key << 6 | card
+    return key
+
+
+def canonical_flops() -> List[Tuple[int, int, int]]:
+    """Return one flop (highest card first) for each of the 1,755 suit-isomorphism classes."""
+    flops = set()
+    for flop in itertools.combinations(range(51, -1, -1), 3):
+        best = min(
+            tuple(sorted((card & ~3 | permutation[card & 3] for card in flop), reverse=True))
+            for permutation in SUIT_PERMUTATIONS
+        )
+        flops.add(best)
+    return sorted(flops, reverse=True)
+
+
+def river_equities(board: Sequence[int]) -> "np.ndarray":
+    """
+    Return the river equity against one random hand of every hole pair on a five-card board.
+    
+    The result is indexed by ``combo_index``; pairs that use a board card
+    are NaN.  Hole pairs are evaluated once each and swept in order of
+    strength, counting for every card how many weaker and tied pairs hold
+    it, so blocked opponents are removed without a second pass.
+    """
+    seen, pairs, trips, quads, suit_masks = hand_masks(board)
+    used = set(board)
+    live = [card for card in range(52) if card not in used]
+    
+    hands = []
+    for i, first in enumerate(live):
+        first_bit = 1 << (first >> 2)
+        first_masks = add_rank(seen, pairs, trips, quads, first_bit)
+        first_suits = list(suit_masks)
+        first_suits[first & 3] |= first_bit
+        for second in live[:i]:
+            bit = 1 << (second >> 2)
+            suits = list(first_suits)
+            suits[second & 3] |= bit
+            strength = evaluate_masks(*add_rank(*first_masks, bit), suits)
+            hands.append((strength, first, second))
+    hands.sort()
+    
+    opponents = len(hands) - 2 * (len(live) - 1) + 1
+    equities = np.full(COMBO_COUNT, np.nan)
+    beaten = 0
+    beaten_with = [0] * 52
+    start = 0
+    while start < len(hands):
+        end = start
+        while end < len(hands) and hands[end][0] == hands[start][0]:
+            end += 1
+        group = hands[start:end]
+        tied_with = [0] * 52
+        for _, first, second in group:
+            tied_with[first] += 1
+            tied_with[second] += 1
+        for _, first, second in group:
+            wins = beaten - beaten_with[first] - beaten_with[second]
+            ties = len(group) - tied_with[first] - tied_with[second] + 1
+            equities[first * (first - 1) // 2 + second] = (wins + ties / 2) / opponents
+        beaten += len(group)
+        for _, first, second in group:
+            beaten_with[first] += 1
+            beaten_with[second] += 1
+        start = end
+    return equities
+
+
+def _board_histograms(board: Sequence[int], runouts: Sequence[Sequence[int]], bins: int) -> "np.ndarray":
+    """
+    Return every hole pair's equity histogram on a board over some runouts.
+    
+    Rows are indexed by ``combo_index`` and hold counts, not frequencies;
+    pairs blocked by the board (or by every runout) are all zero.
+    """
+    counts = np.zeros((COMBO_COUNT, bins))
+    rows = np.arange(COMBO_COUNT)
+    for runout in runouts:
+        equities = river_equities(list(board) + list(runout))
+        live = ~np.isnan(equities)
+        columns = np.minimum((equities[live] * bins).astype(int), bins - 1)
+        np.add.at(counts, (rows[live], columns), 1)
+    return counts
+
+
+def _merge(keys: "np.ndarray", counts: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Sum the histograms of equal keys and normalise them; returns sorted keys."""
+    unique, inverse = np.unique(keys, return_inverse=True)
+    merged = np.zeros((len(unique), counts.shape[1]))
+    np.add.at(merged, inverse, counts)
+    totals = merged.sum(axis=1, keepdims=True)
+    np.divide(merged, totals, out=merged, where=totals > 0)
+    return unique, merged.astype(np.float32)
+
+
+def _preflop_histograms(config: AbstractionConfig) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Return the canonical keys and histograms of the 169 starting hands."""
+    rng = random.Random(f"{config.seed}:preflop")
+    boards = [rng.sample(range(52), 5) for _ in range(config.preflop_boards)]
+    counts = _board_histograms([], boards, config.bins)
+    keys = np.array([canonical_key(combo) for combo in COMBOS], dtype=np.int64)
+    return _merge(keys, counts)
+
+
+def _flop_histograms(flop: Tuple[int, int, int], config: AbstractionConfig) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Return the canonical keys and histograms of every hand on one canonical flop."""
+    rng = random.Random(f"{config.seed}:{_encode(flop)}")
+    live = [card for card in range(52) if card not in flop]
+    runouts = list(itertools.combinations(live, 2))
+    if config.flop_runouts < len(runouts):
+        runouts = rng.sample(runouts, config.flop_runouts)
+    counts = _board_histograms(flop, runouts, config.bins)
+    
+    # Only the suit permutations that keep the flop canonical can lower a hand's key
+    stabiliser = [
+        permutation for permutation in SUIT_PERMUTATIONS
+        if sorted((card & ~3 | permutation[card & 3] for card in flop), reverse=True) == list(flop)
+    ]
+    prefix = _encode(flop) << 12
+    indices = []
+    keys = []
+    for first, second in itertools.combinations(live, 2):
+        best = min(
+            tuple(sorted((card & ~3 | permutation[card & 3] for card in (first, second)), reverse=True))
+            for permutation in stabiliser
+        )
+        indices.append(combo_index(first, second))
+        keys.append(prefix | best[0] << 6 | best[1])
+    return _merge(np.array(keys, dtype=np.int64), counts[indices])
+
+
+def _sampled_histograms(street: int, config: AbstractionConfig) -> "np.ndarray":
+    """Return histograms of hands on sampled turn or river boards, for training centroids."""
+    rng = random.Random(f"{config.seed}:{STREETS[street]}")
+    boards, runouts_per_board = (config.turn_boards, config.turn_runouts) if street == 2 else (config.river_boards, 1)
+    histograms = []
+    for _ in range(boards):
+        board = rng.sample(range(52), BOARD_SIZES[street])
+        live = [card for card in range(52) if card not in board]
+        runouts = [[card] for card in rng.sample(live, runouts_per_board)] if street == 2 else [[]]
+        counts = _board_histograms(board, runouts, config.bins)
+        totals = counts.sum(axis=1)
+        histograms.append(counts[totals > 0] / totals[totals > 0, None])
+    return np.concatenate(histograms).astype(np.float32)
+
+
+def kmeans(points: "np.ndarray", k: int, iterations: int = 30, seed: int = 0,
+           chunk: int = 65536) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Cluster rows with k-means (k-means++ seeding) and return the centroids and labels.
+    
+    Distances are computed ``chunk`` rows at a time, so memory stays at
+    ``chunk * k`` floats however many points there are.
+    """
+    rng = np.random.default_rng(seed)
+    k = min(k, len(points))
+    sample = points[rng.choice(len(points), min(len(points), 20000), replace=False)]
+    centroids = [sample[rng.integers(len(sample))]]
+    closest = ((sample - centroids[0]) ** 2).sum(axis=1)
+    for _ in range(1, k):
+        total = closest.sum()
+        index = rng.choice(len(sample), p=closest / total) if total > 0 else rng.integers(len(sample))
+        centroids.append(sample[index])
+        closest = np.minimum(closest, ((sample - sample[index]) ** 2).sum(axis=1))
+    centres = np.array(centroids, dtype=np.float64)
+    
+    labels = np.zeros(len(points), dtype=np.int64)
+    for _ in range(iterations):
+        sums = np.zeros_like(centres)
+        sizes = np.zeros(k)
+        for start in range(0, len(points), chunk):
+            block = points[start:start + chunk]
+            labels[start:start + chunk] = _nearest(block, centres)
+            np.add.at(sums, labels[start:start + chunk], block)
+            sizes += np.bincount(labels[start:start + chunk], minlength=k)
+        moved = np.divide(sums, sizes[:, None], out=centres.copy(), where=sizes[:, None] > 0)
+        if np.allclose(moved, centres):
+            break
+        centres = moved
+    return centres.astype(np.float32), labels
+
+
+def _nearest(points: "np.ndarray", centres: "np.ndarray") -> "np.ndarray":
+    """Return the index of the nearest centre for each row."""
+    distances = (centres ** 2).sum(axis=1)[None, :] - 2 * points @ centres.T
+    return distances.argmin(axis=1)
+
+
+def _table(keys: "np.ndarray", histograms: "np.ndarray", k: int, seed: int) -> BucketTable:
+    """Cluster one street's histograms into a table with buckets ordered by mean equity."""
+    cumulative = np.cumsum(histograms, axis=1)
+    centroids, labels = kmeans(cumulative, k, seed=seed)
+    # Mean equity falls as the cumulative histogram rises, so order by its sum
+    order = np.argsort(-centroids.sum(axis=1), kind="stable")
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    dtype = np.uint8 if len(order) <= 256 else np.uint16
+    return BucketTable(keys, rank[labels].astype(dtype), centroids[order])
+
+
+def build(config: Optional[AbstractionConfig] = None, processes: int = 1,
+          flops: Optional[Sequence[Tuple[int, int, int]]] = None) -> "Abstraction":
+    """
+    Build the bucket tables for every street.
+    
+    ``flops`` restricts the flop table to some canonical flops (hands on the
+    others are then assigned on demand, like turn hands).  Only the command
+    line passes ``processes > 1``, as with ``distribution.build``.
+    """
+    config = config or AbstractionConfig()
+    flops = canonical_flops() if flops is None else list(flops)
+    
+    tables = {}
+    keys, histograms = _preflop_histograms(config)
+    tables["preflop"] = _table(keys, histograms, config.buckets[0], config.seed)
+    
+    work = functools.partial(_flop_histograms, config=config)
+    if processes > 1:
+        import multiprocessing
+        
+        with multiprocessing.Pool(processes) as pool:
+            parts = list(pool.imap(work, flops, chunksize=4))
+    else:
+        parts = [work(flop) for flop in flops]
+    keys = np.concatenate([part[0] for part in parts])
+    histograms = np.concatenate([part[1] for part in parts])
+    order = np.argsort(keys)
+    tables["flop"] = _table(keys[order], histograms[order], config.buckets[1], config.seed)
+    
+    for street in (2, 3):
+        histograms = _sampled_histograms(street, config)
+        table = _table(np.zeros(0, dtype=np.int64), histograms, config.buckets[street], config.seed)
+        tables[STREETS[street]] = BucketTable(table.keys, np.zeros(0, dtype=np.uint8), table.centroids)
+    return Abstraction(config, tables)
+
+
+class Abstraction:
+    """Built bucket tables, which look up (or compute) the bucket of any hand."""
+    
+    def __init__(self, config: AbstractionConfig, tables: Dict[str, BucketTable]):
+        """Wrap the tables built with ``config``."""
+        self.config = config
+        self.tables = tables
+    
+    def buckets(self, street: str) -> int:
+        """Return the number of buckets on a street."""
+        return len(self.tables[street].centroids)
+    
+    def bucket(self, hole: Sequence[int], board: Sequence[int] = ()) -> int:
+        """Return a hand's bucket on the current street (0 is the weakest)."""
+        if len(set(hole) | set(board)) != len(hole) + len(board):
+            raise ValueError("Duplicate card in hand")
+        street = STREETS[BOARD_SIZES.index(len(board))]
+        table = self.tables[street]
+        key = canonical_key(hole, board)
+        index = int(np.searchsorted(table.keys, key))
+        if index < len(table.keys) and table.keys[index] == key:
+            return int(table.buckets[index])
+        return self.assign(street, histogram(hole, board, self.config))
+    
+    def bucket_cards(self, hole_cards: Sequence[Card], community_cards: Sequence[Card] = ()) -> int:
+        """Return ``bucket`` for ``Card`` objects."""
+        return self.bucket(from_cards(hole_cards), from_cards(community_cards))
+    
+    def assign(self, street: str, histogram: "np.ndarray") -> int:
+        """Return the bucket whose centroid is nearest to a histogram."""
+        cumulative = np.cumsum(histogram)[None, :]
+        return int(_nearest(cumulative, self.tables[street].centroids.astype(np.float64))[0])
+
+
+ABSTRACTION = LazyTable("card_abstraction", build, cached=True)
+
+
+def histogram(hole: Sequence[int], board: Sequence[int], config: Optional[AbstractionConfig] = None) -> "np.ndarray":
+    """
+    Return one hand's normalised equity histogram.
+    
+    Flop and turn hands use up to ``flop_runouts`` and ``turn_runouts``
+    sampled runouts (so a turn hand costs that many river sweeps); river
+    hands have a single equity.  The hand is relabelled to its canonical
+    suits first, so every suit-isomorphic version samples the same runouts.
+    """
+    config = config or AbstractionConfig()
+    hole, board = canonical_hand(hole, board)
+    rng = random.Random(f"{config.seed}:{_encode(board + hole)}")
+    used = set(hole) | set(board)
+    live = [card for card in range(52) if card not in used]
+    to_come = 5 - len(board)
+    if to_come == 5:
+        runouts: List[Sequence[int]] = [rng.sample(live, 5) for _ in range(config.preflop_boards)]
+    else:
+        runouts = list(itertools.combinations(live, to_come))
+        limit = config.flop_runouts if to_come == 2 else config.turn_runouts
+        if to_come and len(runouts) > limit:
+            runouts = rng.sample(runouts, limit)
+    counts = np.zeros(config.bins)
+    index = combo_index(hole[0], hole[1])
+    for runout in runouts:
+        equity = river_equities(list(board) + list(runout))[index]
+        counts[min(int(equity * config.bins), config.bins - 1)] += 1
+    return counts / counts.sum()
+
+
+def _sizes(abstraction: Abstraction) -> Iterator[Tuple[str, int, int, int]]:
+    """Yield each street's name, stored hands, buckets and table bytes."""
+    for street in STREETS:
+        table = abstraction.tables[street]
+        nbytes = table.keys.nbytes + table.buckets.nbytes + table.centroids.nbytes
+        yield street, len(table.keys), len(table.centroids), nbytes
+
+
+def main() -> None:
+    """Build (or load) the abstraction and describe it."""
+    parser = argparse.ArgumentParser(description="Equity-histogram card abstraction.")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--rebuild", action="store_true", help="ignore the cached tables")
+    parser.add_argument("--flop-runouts", type=int, default=AbstractionConfig().flop_runouts,
+                        help="turn and river cards sampled per flop")
+    parser.add_argument("--buckets", default=",".join(map(str, AbstractionConfig().buckets)),
+                        help="buckets per street, preflop to river")
+    args = parser.parse_args()
+    
+    if args.rebuild or not os.path.exists(ABSTRACTION.path):
+        config = AbstractionConfig(buckets=tuple(int(n) for n in args.buckets.split(",")),
+                                   flop_runouts=args.flop_runouts)
+        started = time.perf_counter()
+        abstraction = ABSTRACTION.store(build(config, args.processes))
+        print(f"Built in {time.perf_counter() - started:.1f}s")
+    else:
+        abstraction = ABSTRACTION.get()
+    
+    print(f"{'Street':<8} {'Hands':>10} {'Buckets':>8} {'Bytes':>12}")
+    for street, hands, buckets, nbytes in _sizes(abstraction):
+        print(f"{street:<8} {hands or 'on demand':>10} {buckets:>8} {nbytes:>12,}")
+
+
+if __name__ == "__main__":
+    # Run the imported module so the cached tables pickle as poker_game.abstraction objects
+    from poker_game.abstraction import main as _main
+    
+    _main()
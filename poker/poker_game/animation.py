@@ -0,0 +1,152 @@
+"""
+Central animation scheduler for the poker game's visual effects.
+
+Every timed effect in the game is played through a single scheduler so the
+whole experience can be slowed down, sped up or made instant in one place.
+The time scale multiplies every frame interval: ``1.0`` is normal speed,
+``0.5`` is twice as fast and ``0`` skips straight to the final frame.  The
+default can be set with the ``POKER_ANIMATION_SCALE`` environment variable.
+"""
+import os
+import queue
+import threading
+import time
+from typing import Callable, List, Optional, Sequence
+
+Frame = Callable[[], None]
+
+
+class _Effect:
+    """A queued sequence of frames with its timing."""
+
+    def __init__(self, frames: Sequence[Frame], interval: float, final: Optional[Frame]):
+        self.frames = list(frames)
+        self.interval = interval
+        self.final = final
+
+
+class AnimationScheduler:
+    """Plays frame-based terminal effects against a globally scaled clock."""
+
+    def __init__(self, time_scale: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """Initialize the scheduler with a time scale (0 = instant)."""
+        self.time_scale = max(0.0, time_scale)
+        self.frames_played = 0
+        self.frames_skipped = 0
+        self._clock = clock
+        self._sleep = sleep
+        self._queue: "queue.Queue[_Effect]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    @property
+    def instant(self) -> bool:
+        """Return True if effects are rendered without any delay."""
+        return self.time_scale <= 0
+
+    def scaled(self, seconds: float) -> float:
+        """Return a duration adjusted by the current time scale."""
+        return seconds * self.time_scale
+
+    def pause(self, seconds: float) -> None:
+        """Sleep for a dramatic pause, scaled by the time scale."""
+        self.wait()
+        delay = self.scaled(seconds)
+        if delay > 0:
+            self._sleep(delay)
+
+    def play(self, frames: Sequence[Frame], interval: float,
+             final: Optional[Frame] = None, blocking: bool = True) -> None:
+        """
+        Play frames one interval apart, then the optional final frame.
+
+        With ``blocking=False`` the effect is queued on a background thread
+        and this call returns immediately; effects always play in the order
+        they were queued.  Call ``wait()`` before printing anything that must
+        appear after the effect.
+        """
+        effect = _Effect(frames, interval, final)
+        if blocking:
+            self.wait()
+            self._run(effect)
+        else:
+            self._ensure_worker()
+            self._queue.put(effect)
+
+    def wait(self) -> None:
+        """Block until every queued effect has finished rendering."""
+        if self._worker is not None:
+            self._queue.join()
+
+    def _run(self, effect: _Effect) -> None:
+        """Render an effect, skipping frames if the terminal falls behind."""
+        frames = effect.frames
+        step = self.scaled(effect.interval)
+
+        if step <= 0:
+            # Instant mode: only the last frame is worth drawing
+            self.frames_skipped += max(len(frames) - 1, 0)
+            if frames:
+                frames[-1]()
+                self.frames_played += 1
+        else:
+            start = self._clock()
+            last = len(frames) - 1
+            for index, frame in enumerate(frames):
+                due = start + index * step
+                now = self._clock()
+                if index < last and now >= due + step:
+                    # The next frame is already due - drop this one to catch up
+                    self.frames_skipped += 1
+                    continue
+                if now < due:
+                    self._sleep(due - now)
+                frame()
+                self.frames_played += 1
+
+            # Hold the last frame for its full interval
+            remaining = start + len(frames) * step - self._clock()
+            if remaining > 0:
+                self._sleep(remaining)
+
+        if effect.final is not None:
+            effect.final()
+
+    def _ensure_worker(self) -> None:
+        """Start the background playback thread on first use."""
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._work, name="animation", daemon=True)
+                self._worker.start()
+
+    def _work(self) -> None:
+        """Background loop that plays queued effects in order."""
+        while True:
+            effect = self._queue.get()
+            try:
+                self._run(effect)
+            finally:
+                self._queue.task_done()
+
+
+def _scale_from_environment() -> float:
+    """Read the default time scale from ``POKER_ANIMATION_SCALE``."""
+    try:
+        return float(os.environ.get("POKER_ANIMATION_SCALE", "1"))
+    except ValueError:
+        return 1.0
+
+
+_scheduler = AnimationScheduler(_scale_from_environment())
+
+
+def get_scheduler() -> AnimationScheduler:
+    """Return the global animation scheduler."""
+    return _scheduler
+
+
+def set_time_scale(time_scale: float) -> None:
+    """Set the global animation time scale (0 = instant, 1 = normal)."""
+    _scheduler.time_scale = max(0.0, time_scale)
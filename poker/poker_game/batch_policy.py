@@ -0,0 +1,147 @@
+"""
+The AI's betting rule evaluated for many seats at once.
+
+``AIPlayer.choose_action`` and ``AIPlayer.choose_raise`` decide for one
+seat with Python branches and ``random`` calls; ``decide`` applies the same
+rule to whole arrays of seats (across any number of tables) with a handful
+of NumPy operations, so bulk simulations are not held up by the per-seat
+loop.  The per-seat methods stay the reference: given the same uniform
+draws both produce the same actions and raise amounts for every raise range
+the game can ask for (``min_raise <= max_raise``).
+
+Each seat uses up to four uniform draws, ``draws[0]`` to raise a strong
+hand, ``draws[1]`` to bet when checked to, and ``draws[2]`` and
+``draws[3]`` to pick the raise size; the reference consumes them in that
+order, skipping ``draws[0]`` for hands that are not strong.
+
+NumPy is an optional dependency: install ``poker-game[solver]``.
+"""
+import argparse
+import random
+import time
+from typing import NamedTuple, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError("The batch policy needs NumPy: install poker-game[solver]") from e
+
+FOLD, CHECK, CALL, RAISE = 0, 1, 2, 3
+ACTIONS = ("fold", "check", "call", "raise")
+
+ArrayLike = Union["np.ndarray", float, int]
+
+
+class BatchDecision(NamedTuple):
+    """Action codes (indices into ``ACTIONS``) and raise amounts (0 unless raising) per seat."""
+    actions: "np.ndarray"
+    raise_amounts: "np.ndarray"
+
+
+def raise_bounds(current_bet: ArrayLike, player_bet: ArrayLike, chips: ArrayLike,
+                 big_blind: int = 20) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Return the game's minimum and maximum raise for arrays of seats."""
+    current_bet = np.asarray(current_bet)
+    player_bet = np.asarray(player_bet)
+    min_raise = np.maximum(current_bet * 2 - player_bet, current_bet + big_blind - player_bet)
+    return min_raise, np.asarray(chips)
+
+
+def decide(strength: ArrayLike, to_call: ArrayLike, min_raise: ArrayLike, max_raise: ArrayLike,
+           bet_frequency: ArrayLike = 0.3, call_threshold: ArrayLike = 0.4,
+           rng: Optional["np.random.Generator"] = None, draws: Optional["np.ndarray"] = None) -> BatchDecision:
+    """
+    Decide for every seat at once.
+    
+    All arguments broadcast against each other, so ``bet_frequency`` and
+    ``call_threshold`` may be scalars or per-seat opponent adjustments.
+    ``draws`` (shape ``(4,) + seats``) replaces the generator's uniforms.
+    """
+    strength = np.asarray(strength, dtype=np.float64)
+    to_call = np.asarray(to_call)
+    min_raise = np.asarray(min_raise, dtype=np.int64)
+    max_raise = np.asarray(max_raise, dtype=np.int64)
+    shape = np.broadcast_shapes(strength.shape, to_call.shape, min_raise.shape, max_raise.shape,
+                                np.shape(bet_frequency), np.shape(call_threshold))
+    if draws is None:
+        draws = (rng or np.random.default_rng()).random((4,) + shape)
+    
+    facing = to_call > 0
+    actions = np.where(facing, np.where(strength > call_threshold, CALL, FOLD),
+                       np.where(draws[1] < bet_frequency, RAISE, CHECK))
+    actions = np.where((strength > 0.7) & (draws[0] < 0.6), RAISE, actions)
+    actions = np.where(facing & (strength < np.minimum(0.3, call_threshold)), FOLD, actions).astype(np.int8)
+    
+    # Mostly small raises: the bottom third of the range 70% of the time, else the rest
+    range_size = max_raise - min_raise
+    third = range_size // 3
+    small = draws[2] < 0.7
+    low = np.where(small, 0, third)
+    high = np.where(small, third, range_size)
+    amounts = min_raise + low + np.floor(draws[3] * (high - low + 1)).astype(np.int64)
+    amounts = np.where(range_size > 0, amounts, min_raise)
+    return BatchDecision(actions, np.where(actions == RAISE, amounts, 0))
+
+
+class _Draws:
+    """Feeds a seat's uniforms to the reference methods in the order they ask for them."""
+    
+    def __init__(self, values: "np.ndarray"):
+        """Take one seat's draws."""
+        self.values = [float(value) for value in values]
+    
+    def random(self) -> float:
+        """Return the next uniform."""
+        return self.values.pop(0)
+    
+    def randint(self, low: int, high: int) -> int:
+        """Return an integer from ``low`` to ``high`` using the next uniform."""
+        return low + int(self.random() * (high - low + 1))
+
+
+def reference(strength: float, to_call: int, min_raise: int, max_raise: int, draws: "np.ndarray",
+              bet_frequency: float = 0.3, call_threshold: float = 0.4) -> Tuple[str, int]:
+    """Decide for one seat with ``AIPlayer``'s methods, consuming ``draws`` like ``decide``."""
+    from .player import AIPlayer
+    
+    values = draws[0:] if strength > 0.7 else draws[1:]
+    action = AIPlayer.choose_action(strength, to_call, bet_frequency, call_threshold, _Draws(values[:2]))
+    if action != "raise":
+        return action, 0
+    return action, AIPlayer.choose_raise(min_raise, max_raise, _Draws(draws[2:]))
+
+
+def main() -> None:
+    """Time the vectorised policy against the per-seat methods on random seats."""
+    parser = argparse.ArgumentParser(description="Benchmark the vectorised AI policy.")
+    parser.add_argument("--seats", type=int, default=100000, help="seats to decide for")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(args.seed)
+    strength = rng.random(args.seats)
+    to_call = np.where(rng.random(args.seats) < 0.5, rng.integers(10, 200, args.seats), 0)
+    min_raise, max_raise = raise_bounds(to_call, 0, rng.integers(400, 4000, args.seats))
+    draws = rng.random((4, args.seats))
+    
+    started = time.perf_counter()
+    batch = decide(strength, to_call, min_raise, max_raise, draws=draws)
+    vectorised = time.perf_counter() - started
+    
+    from .player import AIPlayer
+    
+    started = time.perf_counter()
+    for i in range(args.seats):
+        if AIPlayer.choose_action(strength[i], to_call[i], rng=random) == "raise":
+            AIPlayer.choose_raise(int(min_raise[i]), int(max_raise[i]), random)
+    looped = time.perf_counter() - started
+    
+    print(f"{'Per seat':<10} {looped * 1e3:>9.1f} ms  {args.seats / looped:>12,.0f} seats/s")
+    print(f"{'Batched':<10} {vectorised * 1e3:>9.1f} ms  {args.seats / vectorised:>12,.0f} seats/s")
+    print(f"Speed-up {looped / vectorised:.0f}x")
+    counts = np.bincount(batch.actions, minlength=len(ACTIONS))
+    print("  ".join(f"{name} {count / args.seats:.1%}" for name, count in zip(ACTIONS, counts)))
+
+
+if __name__ == "__main__":
+    main()
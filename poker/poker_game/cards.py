@@ -54,6 +54,24 @@ class Card(NamedTuple):
         """Return a simple string representation without colors."""
         return f"{self.rank.display}{self.suit.symbol}"
     
+    def code(self) -> str:
+        """Return the two-character code for the card, e.g. 'Ah' or 'Td'."""
+        rank = "T" if self.rank is Rank.TEN else self.rank.display
+        return f"{rank}{self.suit.name[0].lower()}"
+    
+    @classmethod
+    def from_code(cls, code: str) -> 'Card':
+        """Parse a card code such as 'Ah', 'Td' or '10d'."""
+        code = code.strip()
+        rank_part, suit_part = code[:-1].upper(), code[-1:].lower()
+        if rank_part == "10":
+            rank_part = "T"
+        rank = next((r for r in Rank if (r.display if r is not Rank.TEN else "T") == rank_part), None)
+        suit = next((s for s in Suit if s.name[0].lower() == suit_part), None)
+        if rank is None or suit is None:
+            raise ValueError(f"Invalid card code: {code!r}")
+        return cls(rank, suit)
+    
     def ascii_card(self) -> List[str]:
         """Return enhanced ASCII art representation of the card."""
         rank_display = self.rank.display.ljust(2)
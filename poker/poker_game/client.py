@@ -0,0 +1,120 @@
+"""
+Asyncio client for the poker server, used for scripted and bot players.
+"""
+import argparse
+import asyncio
+from typing import Any, Callable, Dict, Optional
+
+from .protocol import decode, encode
+
+Message = Dict[str, Any]
+Policy = Callable[[Message], Message]
+
+
+def calling_station(message: Message) -> Message:
+    """A scripted policy that checks or calls every time and never raises."""
+    if message["type"] == "raise":
+        return {"type": "amount", "amount": message["min"]}
+    action = "call" if "call" in message["options"] else "check"
+    return {"type": "action", "action": action}
+
+
+class PokerClient:
+    """Plays one seat on a poker server using a policy callable."""
+    
+    def __init__(self, name: str, policy: Policy = calling_station,
+                 on_message: Optional[Callable[[Message], None]] = None):
+        """
+        Initialize a client.
+        
+        ``policy`` is called with every ``act`` and ``raise`` request and must
+        return the reply message.  ``on_message`` sees every message received.
+        """
+        self.name = name
+        self.policy = policy
+        self.on_message = on_message
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.table: Optional[int] = None
+        self.hands_seen = 0
+    
+    async def connect(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        """Connect to a server over TCP and ask for a seat."""
+        self.reader, self.writer = await asyncio.open_connection(host, port, limit=2 ** 16)
+        await self.send({"type": "join", "name": self.name})
+    
+    async def connect_unix(self, path: str) -> None:
+        """Connect to a server over a Unix socket and ask for a seat."""
+        self.reader, self.writer = await asyncio.open_unix_connection(path, limit=2 ** 16)
+        await self.send({"type": "join", "name": self.name})
+    
+    async def send(self, message: Message) -> None:
+        """Send a message to the server."""
+        assert self.writer is not None, "connect() first"
+        self.writer.write(encode(message))
+        await self.writer.drain()
+    
+    async def play(self) -> Optional[Message]:
+        """Play until the table closes; returns the ``game_over`` message."""
+        assert self.reader is not None, "connect() first"
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                return None
+            message = decode(line)
+            if self.on_message is not None:
+                self.on_message(message)
+            
+            kind = message["type"]
+            if kind in ("act", "raise"):
+                reply = self.policy(message)
+                if "id" in message:
+                    reply["id"] = message["id"]
+                await self.send(reply)
+            elif kind == "welcome":
+                self.table = message["table"]
+            elif kind == "hand_start":
+                self.hands_seen += 1
+            elif kind == "game_over":
+                return message
+    
+    async def close(self) -> None:
+        """Disconnect from the server."""
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def _run_client(args: argparse.Namespace) -> None:
+    """Connect a single calling-station client and report the result."""
+    client = PokerClient(args.name)
+    if args.unix:
+        await client.connect_unix(args.unix)
+    else:
+        await client.connect(args.host, args.port)
+    try:
+        result = await client.play()
+    finally:
+        await client.close()
+    
+    if result is None:
+        print(f"{client.name}: connection closed by server")
+    else:
+        print(f"{client.name}: table {client.table}, {result['hands']} hands, {result['chips']} chips")
+
+
+def main() -> None:
+    """Connect a scripted calling-station client to a running server."""
+    parser = argparse.ArgumentParser(description="Play a scripted seat on a poker server.")
+    parser.add_argument("--host", default="127.0.0.1", help="server host")
+    parser.add_argument("--port", type=int, default=8765, help="server TCP port")
+    parser.add_argument("--unix", metavar="PATH", help="connect over a Unix socket instead of TCP")
+    parser.add_argument("--name", default="Bot", help="player name")
+    asyncio.run(_run_client(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Exact hand-rank distribution and strength percentiles over all seven-card hands.
+
+All 133,784,560 seven-card hands are counted by evaluator strength.  Rather
+than evaluating every hand, the counts are built combinatorially:
+
+* hands with five or more cards of one suit are always a flush (or better),
+  and their strength depends only on the suited ranks, so each set of 5-7
+  suited ranks is evaluated once and weighted by the ways to pick the rest;
+* every other hand is decided by its ranks alone, so each multiset of seven
+  ranks is evaluated once and weighted by its suit assignments that do not
+  contain a flush.
+
+The command line can spread the rank multisets over worker processes; the
+lazy table is always built in the calling process, which takes about a
+second and is safe inside servers and pool workers.  ``enumerate_all``
+evaluates every hand one by one instead, which takes several CPU-minutes and
+is only useful to check the combinatorial tables.
+
+The tables are built on first use and cached on disk (see ``tables``), after
+which ``percentile`` turns any strength into its standing among all hands.
+"""
+import argparse
+import bisect
+import itertools
+import math
+import os
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .evaluator import CATEGORY_NAMES, evaluate, evaluate_masks, hand_name, tiebreakers
+from .tables import LazyTable
+
+TOTAL_HANDS = math.comb(52, 7)
+
+Multiplicities = Tuple[int, ...]
+
+
+def _rank_multisets(remaining: int = 7, rank: int = 12) -> Iterator[Multiplicities]:
+    """Yield the multiplicities of every multiset of seven ranks (at most four of each)."""
+    if rank < 0:
+        if remaining == 0:
+            yield ()
+        return
+    for count in range(min(4, remaining), -1, -1):
+        for rest in _rank_multisets(remaining - count, rank - 1):
+            yield (count,) + rest
+
+
+def _count_multisets(batch: Sequence[Multiplicities]) -> Counter:
+    """Count the non-flush hands of some rank multisets by strength."""
+    counts: Counter = Counter()
+    for multiplicities in batch:
+        seen = pairs = trips = quads = 0
+        support = []
+        for index, count in enumerate(multiplicities):
+            if count:
+                bit = 1 << (12 - index)
+                seen |= bit
+                if count >= 2:
+                    pairs |= bit
+                if count >= 3:
+                    trips |= bit
+                if count == 4:
+                    quads |= bit
+                support.append(count)
+        
+        total = math.prod(math.comb(4, count) for count in support)
+        # Suit assignments with five or more cards in one suit (at most one suit can)
+        flushes = 0
+        for size in range(5, len(support) + 1):
+            for suited in itertools.combinations(range(len(support)), size):
+                ways = 1
+                for i, count in enumerate(support):
+                    ways *= math.comb(3, count - 1) if i in suited else math.comb(3, count)
+                flushes += ways
+        hands = total - 4 * flushes
+        if hands:
+            counts[evaluate_masks(seen, pairs, trips, quads, (0, 0, 0, 0))] += hands
+    return counts
+
+
+def _count_flushes() -> Counter:
+    """Count the hands holding five or more cards of one suit by strength."""
+    counts: Counter = Counter()
+    for size in (5, 6, 7):
+        ways = 4 * math.comb(39, 7 - size)
+        for ranks in itertools.combinations(range(13), size):
+            counts[evaluate(rank * 4 for rank in ranks)] += ways
+    return counts
+
+
+def build(processes: int = 1) -> Dict[str, List[int]]:
+    """
+    Count every seven-card hand by strength.
+    
+    Returns the distinct strengths in increasing order with the number of
+    hands at each, plus the number of hands per category (index 1-10).
+    Only the command line passes ``processes > 1``: a pool started from the
+    lazy table would fork in the middle of a game, or fail outright inside a
+    daemonic pool worker.
+    """
+    multisets = list(_rank_multisets())
+    counts = _count_flushes()
+    if processes > 1:
+        import multiprocessing
+        
+        batches = [multisets[i::processes * 4] for i in range(processes * 4)]
+        with multiprocessing.Pool(processes) as pool:
+            for partial in pool.imap_unordered(_count_multisets, batches):
+                counts.update(partial)
+    else:
+        counts.update(_count_multisets(multisets))
+    return _table(counts)
+
+
+def enumerate_all(processes: Optional[int] = None) -> Dict[str, List[int]]:
+    """Build the same table by evaluating all 133,784,560 hands (slow)."""
+    processes = processes or os.cpu_count() or 1
+    import multiprocessing
+    
+    counts: Counter = Counter()
+    with multiprocessing.Pool(processes) as pool:
+        for partial in pool.imap_unordered(_enumerate_from, range(46)):
+            counts.update(partial)
+    return _table(counts)
+
+
+def _enumerate_from(first: int) -> Counter:
+    """Evaluate every hand whose lowest card is ``first``."""
+    counts: Counter = Counter()
+    for rest in itertools.combinations(range(first + 1, 52), 6):
+        counts[evaluate((first,) + rest)] += 1
+    return counts
+
+
+def _table(counts: Counter) -> Dict[str, List[int]]:
+    """Turn strength counts into the sorted lookup table."""
+    strengths = sorted(counts)
+    categories = [0] * 11
+    for strength, count in counts.items():
+        categories[strength >> 20] += count
+    if sum(categories) != TOTAL_HANDS:
+        raise RuntimeError(f"Counted {sum(categories):,} hands instead of {TOTAL_HANDS:,}")
+    
+    below = []
+    running = 0
+    for strength in strengths:
+        below.append(running)
+        running += counts[strength]
+    return {
+        "strengths": strengths,
+        "counts": [counts[strength] for strength in strengths],
+        "below": below,
+        "categories": categories,
+    }
+
+
+DISTRIBUTION = LazyTable("hand_distribution", build, cached=True)
+
+
+def percentile(strength: int) -> float:
+    """
+    Return the fraction of all seven-card hands that a strength beats.
+    
+    Ties count as half a win, so the weakest possible hand scores just above
+    0 and a royal flush just below 1.
+    """
+    table = DISTRIBUTION.get()
+    strengths = table["strengths"]
+    index = bisect.bisect_left(strengths, strength)
+    if index < len(strengths) and strengths[index] == strength:
+        return (table["below"][index] + table["counts"][index] / 2) / TOTAL_HANDS
+    if index == len(strengths):
+        return 1.0
+    return table["below"][index] / TOTAL_HANDS
+
+
+def category_frequencies() -> Dict[str, int]:
+    """Return how many seven-card hands fall in each category, weakest first."""
+    categories = DISTRIBUTION.get()["categories"]
+    return {CATEGORY_NAMES[category]: categories[category] for category in range(1, 11)}
+
+
+def strength_at(fraction: float) -> int:
+    """Return the strength found at a percentile (the inverse of ``percentile``)."""
+    table = DISTRIBUTION.get()
+    target = fraction * TOTAL_HANDS
+    index = bisect.bisect_right(table["below"], target) - 1
+    return table["strengths"][max(index, 0)]
+
+
+def main() -> None:
+    """Build (or load) the tables and print the category and percentile tables."""
+    parser = argparse.ArgumentParser(description="Seven-card hand-rank distribution and percentiles.")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--rebuild", action="store_true", help="ignore the cached tables")
+    parser.add_argument("--brute-force", action="store_true",
+                        help="also evaluate every hand and check it against the tables (slow)")
+    args = parser.parse_args()
+    
+    if args.rebuild or not os.path.exists(DISTRIBUTION.path):
+        table = DISTRIBUTION.store(build(args.processes))
+    else:
+        table = DISTRIBUTION.get()
+    
+    print(f"{'Hand':<16} {'Hands':>14} {'Frequency':>10}")
+    for name, count in reversed(list(category_frequencies().items())):
+        print(f"{name:<16} {count:>14,} {count / TOTAL_HANDS:>10.4%}")
+    print(f"{'Total':<16} {TOTAL_HANDS:>14,}\n")
+    
+    print(f"{'Percentile':>10}  Strength")
+    for fraction in (0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99):
+        strength = strength_at(fraction)
+        ranks = "-".join(str(rank) for rank in tiebreakers(strength))
+        print(f"{fraction:>10.0%}  {hand_name(strength)} ({ranks})")
+    
+    if args.brute_force:
+        checked = enumerate_all(args.processes)
+        print("\nBrute force:", "matches" if checked == table else "DOES NOT MATCH")
+
+
+if __name__ == "__main__":
+    main()
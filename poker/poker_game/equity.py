@@ -0,0 +1,359 @@
+"""
+Batch equity and hand-ranking queries for the ``poker-equity`` command.
+
+A query lists two or more hands or ranges, optionally followed by ``@`` and
+the board::
+    
+    AhKh QsQd                    all-in preflop, hand against hand
+    AKs QQ+,AKo @ Qh7d2c         range against range on the flop
+    AhKh @ Qh7d2cJh              a single hand: report its made hand
+
+Hands are card codes (``AhKh``).  Ranges are comma-separated lists of
+``QQ``, ``QQ+``, ``22-66``, ``AK``, ``AKs``, ``AKo``, ``ATs+`` and
+``KTs-K7s`` style terms, or explicit hands.
+
+Queries are taken from the command line or read one per line from stdin,
+and each produces one JSON line on stdout (queries that fail produce an
+``error`` line instead, so a batch never stops half-way).  Runouts are
+enumerated exactly when every player holds a single hand and there are at
+most ``--trials`` of them; otherwise ``--trials`` random runouts are sampled.
+The evaluator tables stay loaded across the whole batch, and ``--processes``
+spreads queries over worker processes while keeping the output in order.
+"""
+import argparse
+import functools
+import itertools
+import json
+import math
+import random
+import re
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import evaluator
+from .evaluator import RANKS, evaluate, parse_card, parse_cards
+from .tables import LazyTable
+
+Combo = Tuple[int, int]
+
+_SPAN = re.compile(r"^([2-9TJQKA])([2-9TJQKA])([so]?)-([2-9TJQKA])([2-9TJQKA])([so]?)$")
+_TERM = re.compile(r"^([2-9TJQKA])([2-9TJQKA])([so]?)(\+?)$")
+
+
+def rank_combos(high: int, low: int, kind: str = "") -> List[Combo]:
+    """Return the card combos for two rank indices ('s' suited, 'o' offsuit, '' both)."""
+    if high == low:
+        return [(high * 4 + a, high * 4 + b) for a, b in itertools.combinations(range(4), 2)]
+    combos = []
+    for a in range(4):
+        for b in range(4):
+            if (kind == "s" and a != b) or (kind == "o" and a == b):
+                continue
+            combos.append((high * 4 + a, low * 4 + b))
+    return combos
+
+
+def parse_range(text: str) -> List[Combo]:
+    """Parse a hand or comma-separated range into its distinct card combos."""
+    combos = set()
+    for term in text.split(","):
+        term = term.strip()
+        if not term:
+            continue
+        if len(term) == 4 and term[1].lower() in evaluator.SUITS:
+            first, second = parse_card(term[:2]), parse_card(term[2:])
+            if first == second:
+                raise ValueError(f"Duplicate card in {term!r}")
+            combos.add((max(first, second), min(first, second)))
+            continue
+        for high, low, kind in _expand_term(term.upper().replace("S", "s").replace("O", "o")):
+            combos.update(rank_combos(high, low, kind))
+    if not combos:
+        raise ValueError(f"Empty range: {text!r}")
+    return sorted(combos)
+
+
+def _expand_term(term: str) -> Iterator[Tuple[int, int, str]]:
+    """Expand one range term into (high rank, low rank, kind) triples."""
+    span = _SPAN.match(term)
+    if span:
+        first, second, kind, last_first, last_second, last_kind = span.groups()
+        a, b, c, d = (RANKS.index(r) for r in (first, second, last_first, last_second))
+        if kind != last_kind:
+            raise ValueError(f"Invalid range term: {term!r}")
+        if a == b and c == d:
+            for rank in range(min(a, c), max(a, c) + 1):
+                yield rank, rank, ""
+            return
+        if a == c and a > max(b, d):
+            for low in range(min(b, d), max(b, d) + 1):
+                yield a, low, kind
+            return
+        raise ValueError(f"Invalid range term: {term!r}")
+    
+    match = _TERM.match(term)
+    if not match:
+        raise ValueError(f"Invalid range term: {term!r}")
+    first, second, kind, plus = match.groups()
+    high, low = sorted((RANKS.index(first), RANKS.index(second)), reverse=True)
+    if high == low:
+        if kind:
+            raise ValueError(f"Pairs cannot be suited or offsuit: {term!r}")
+        for rank in range(high, 13 if plus else high + 1):
+            yield rank, rank, ""
+    else:
+        for kicker in range(low, high if plus else low + 1):
+            yield high, kicker, kind
+
+
+def parse_query(query: str) -> Tuple[List[List[Combo]], List[int]]:
+    """Split a query into each player's combos and the board cards."""
+    players_text, _, board_text = query.partition("@")
+    board = parse_cards(board_text) if board_text.strip() else []
+    if len(board) > 5 or len(set(board)) != len(board):
+        raise ValueError("The board must be up to five distinct cards")
+    players = [parse_range(token) for token in players_text.split()]
+    if not players:
+        raise ValueError("No hands given")
+    
+    # Drop combos that collide with the board or with another player's fixed hand
+    dead = set(board)
+    for combos in players:
+        if len(combos) == 1:
+            if dead & set(combos[0]):
+                raise ValueError("The same card appears twice")
+            dead.update(combos[0])
+    for i, combos in enumerate(players):
+        if len(combos) > 1:
+            players[i] = [combo for combo in combos if not dead & set(combo)]
+            if not players[i]:
+                raise ValueError("A range has no hands left once dead cards are removed")
+    return players, board
+
+
+def rank_hand(cards: List[int]) -> Dict[str, Any]:
+    """Describe the best hand made by the given cards."""
+    strength = evaluate(cards)
+    return {
+        "hand": evaluator.hand_name(strength),
+        "tiebreakers": evaluator.tiebreakers(strength),
+        "strength": strength,
+    }
+
+
+def equity(players: List[List[Combo]], board: List[int], trials: int = 20000,
+           rng: Optional[random.Random] = None) -> Dict[str, Any]:
+    """Return each player's equity, win and tie shares over the board runouts."""
+    if trials < 1:
+        raise ValueError("Trials must be at least 1")
+    rng = rng or random.Random()
+    needed = 5 - len(board)
+    shares = [0.0] * len(players)
+    wins = [0] * len(players)
+    ties = [0] * len(players)
+    
+    fixed = all(len(combos) == 1 for combos in players)
+    if fixed:
+        used = set(board).union(*(combos[0] for combos in players))
+        deck = [card for card in range(52) if card not in used]
+        exact = math.comb(len(deck), needed) <= trials
+    else:
+        exact = False
+    
+    if exact:
+        hands = [list(combos[0]) + board for combos in players]
+        runouts: Iterable[Tuple[List[List[int]], Iterable[int]]] = (
+            (hands, runout) for runout in itertools.combinations(deck, needed)
+        )
+    else:
+        runouts = (_sample(players, board, needed, rng) for _ in range(trials))
+    
+    count = 0
+    for hands, runout in runouts:
+        strengths = [evaluate(itertools.chain(hand, runout)) for hand in hands]
+        best = max(strengths)
+        winners = [i for i, strength in enumerate(strengths) if strength == best]
+        if len(winners) == 1:
+            wins[winners[0]] += 1
+            shares[winners[0]] += 1.0
+        else:
+            for i in winners:
+                ties[i] += 1
+                shares[i] += 1.0 / len(winners)
+        count += 1
+    
+    return {
+        "equity": [round(share / count, 4) for share in shares],
+        "win": [round(win / count, 4) for win in wins],
+        "tie": [round(tie / count, 4) for tie in ties],
+        "trials": count,
+        "exact": exact,
+    }
+
+
+def _sample(players: List[List[Combo]], board: List[int], needed: int,
+            rng: random.Random) -> Tuple[List[List[int]], List[int]]:
+    """Deal every player a non-conflicting combo and complete the board at random."""
+    base = 0
+    for card in board:
+        base |= 1 << card
+    for _ in range(1000):
+        used = base
+        hands = []
+        for combos in players:
+            first, second = combos[rng.randrange(len(combos))] if len(combos) > 1 else combos[0]
+            if used >> first & 1 or used >> second & 1:
+                break
+            used |= 1 << first | 1 << second
+            hands.append([first, second] + board)
+        else:
+            runout = []
+            while len(runout) < needed:
+                card = rng.randrange(52)
+                if not used >> card & 1:
+                    used |= 1 << card
+                    runout.append(card)
+            return hands, runout
+    raise ValueError("The ranges overlap too much to deal")
+
+
+def preflop_class(hole: Tuple[int, int]) -> str:
+    """Return the starting-hand class of two hole cards (``AA``, ``AKs``, ``T9o``)."""
+    first, second = sorted(hole, reverse=True)
+    high, low = RANKS[first >> 2], RANKS[second >> 2]
+    if high == low:
+        return high + low
+    return high + low + ("s" if first & 3 == second & 3 else "o")
+
+
+def _build_preflop_equity(trials: int = 2000) -> Dict[str, float]:
+    """Estimate every starting-hand class's equity against one random hand."""
+    rng = random.Random(0)
+    table = {}
+    for high in range(12, -1, -1):
+        for low in range(high, -1, -1):
+            for kind in ("s", "o") if high != low else ("",):
+                hole = rank_combos(high, low, kind)[0]
+                others = [(a, b) for a, b in itertools.combinations(range(51, -1, -1), 2)
+                          if a not in hole and b not in hole]
+                result = equity([[hole], others], [], trials, rng)
+                table[preflop_class(hole)] = result["equity"][0]
+    return table
+
+
+PREFLOP_EQUITY = LazyTable("preflop_equity", _build_preflop_equity, cached=True)
+
+
+def preflop_equity(hole: Tuple[int, int]) -> float:
+    """Return the (cached, sampled) equity of two hole cards against one random hand."""
+    return PREFLOP_EQUITY.get()[preflop_class(hole)]
+
+
+def answer(query: str, trials: int = 20000, seed: Optional[int] = None,
+           index: int = 0) -> str:
+    """Answer one query as a JSON line, reporting failures as an error line."""
+    result: Dict[str, Any] = {"query": query}
+    try:
+        if trials < 1:
+            raise ValueError("Trials must be at least 1")
+        players, board = parse_query(query)
+        if len(players) == 1:
+            if len(players[0]) != 1 or len(board) < 3:
+                raise ValueError("Ranking needs one exact hand and a board of at least three cards")
+            result.update(rank_hand(list(players[0][0]) + board))
+        else:
+            rng = random.Random(f"{seed}:{index}") if seed is not None else random.Random()
+            result.update(equity(players, board, trials, rng))
+    except ValueError as e:
+        result["error"] = str(e)
+    return json.dumps(result, separators=(",", ":"))
+
+
+def _answer_numbered(numbered: Tuple[int, str], trials: int, seed: Optional[int]) -> str:
+    """Pool entry point: answer a query tagged with its position in the batch."""
+    index, query = numbered
+    return answer(query, trials, seed, index)
+
+
+def _warm() -> None:
+    """Load the evaluator tables before the first query arrives."""
+    evaluator.STRAIGHT_HIGH.get()
+
+
+def run_batch(queries: Iterable[str], trials: int = 20000, seed: Optional[int] = None,
+              processes: int = 1, chunksize: int = 1) -> Iterator[str]:
+    """Answer queries in order, yielding each JSON line as soon as it is ready."""
+    _warm()
+    numbered = ((i, query) for i, query in enumerate(queries))
+    work = functools.partial(_answer_numbered, trials=trials, seed=seed)
+    if processes <= 1:
+        yield from map(work, numbered)
+        return
+    
+    import multiprocessing
+    import threading
+    
+    # The pool reads queries as they arrive, but only a bounded window ahead
+    # of the answers handed back, so huge inputs are not read into memory
+    window = processes * chunksize * 4
+    slots = threading.Semaphore(window)
+    
+    def throttled() -> Iterator[Tuple[int, str]]:
+        for item in numbered:
+            slots.acquire()
+            yield item
+    
+    with multiprocessing.Pool(processes, initializer=_warm) as pool:
+        try:
+            for line in pool.imap(work, throttled(), chunksize):
+                slots.release()
+                yield line
+        finally:
+            # Unblock the pool's feeder thread so the pool can shut down
+            for _ in range(window):
+                slots.release()
+
+
+def _read_queries(stream: Iterable[str]) -> Iterator[str]:
+    """Yield the queries in a stream, skipping blank lines and comments."""
+    for line in stream:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def _positive(text: str) -> int:
+    """Parse a command-line count that must be at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def main() -> None:
+    """Answer equity and hand-ranking queries from the command line or stdin."""
+    parser = argparse.ArgumentParser(
+        description="Compute poker equities and hand rankings, one JSON line per query.",
+        epilog="Example: poker-equity 'AhKh QQ+,AKo @ Qh7d2c'  (or pipe one query per line to stdin)",
+    )
+    parser.add_argument("queries", nargs="*", help="queries such as 'AhKh QsQd @ 2c7d9h'")
+    parser.add_argument("--trials", type=_positive, default=20000,
+                        help="sampled runouts per query, and the limit for exact enumeration")
+    parser.add_argument("--seed", type=int, help="seed for reproducible sampling")
+    parser.add_argument("--processes", type=_positive, default=1, help="worker processes")
+    parser.add_argument("--chunksize", type=_positive, default=1, help="queries handed to a worker at a time")
+    args = parser.parse_args()
+    
+    queries = args.queries if args.queries else _read_queries(sys.stdin)
+    write = sys.stdout.write
+    try:
+        for line in run_batch(queries, args.trials, args.seed, args.processes, args.chunksize):
+            write(line + "\n")
+            sys.stdout.flush()
+    except (BrokenPipeError, KeyboardInterrupt):
+        pass
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
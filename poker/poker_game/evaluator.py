@@ -0,0 +1,207 @@
+"""
+Fast integer hand evaluator.
+
+Cards are small integers, ``rank_index * 4 + suit_index``, with ranks running
+from two (0) to ace (12) and suits in ``Suit`` order (hearts, diamonds, clubs,
+spades).  A hand's strength is a single integer: higher is better and equal
+strengths tie.  The hand category sits above bit 20 (it matches
+``HandRank.numeric_value``) and up to five tiebreaker ranks follow as 4-bit
+values, so ``describe()`` turns a strength back into the same
+``(HandRank, tiebreakers)`` pair that ``PokerHand`` produces.
+
+Unlike ``PokerHand``, the A-2-3-4-5 straight ("the wheel") ranks as five-high.
+Any five to seven cards can be evaluated; this module does not import the
+``Card`` classes unless a conversion needs them.
+"""
+from typing import TYPE_CHECKING, Iterable, List, Sequence, Tuple
+
+from .tables import LazyTable
+
+if TYPE_CHECKING:
+    from .cards import Card
+    from .hand_evaluator import HandRank
+
+RANKS = "23456789TJQKA"
+SUITS = "hdcs"
+
+# Hand categories, matching HandRank.numeric_value
+HIGH_CARD = 1
+PAIR = 2
+TWO_PAIR = 3
+THREE_OF_A_KIND = 4
+STRAIGHT = 5
+FLUSH = 6
+FULL_HOUSE = 7
+FOUR_OF_A_KIND = 8
+STRAIGHT_FLUSH = 9
+ROYAL_FLUSH = 10
+
+CATEGORY_NAMES = (
+    "", "High Card", "Pair", "Two Pair", "Three of a Kind", "Straight",
+    "Flush", "Full House", "Four of a Kind", "Straight Flush", "Royal Flush",
+)
+
+WHEEL = 0b1000000001111  # A, 5, 4, 3, 2
+
+# Suit index by Suit.symbol, which (unlike Suit.name) is a plain attribute
+_SUIT_INDEX = {"♥": 0, "♦": 1, "♣": 2, "♠": 3}
+
+
+def _build_straight_high() -> List[int]:
+    """Map every 13-bit rank mask to the high card of its best straight (0 if none)."""
+    table = [0] * 8192
+    for mask in range(8192):
+        for high in range(12, 3, -1):
+            window = 0b11111 << (high - 4)
+            if mask & window == window:
+                table[mask] = high + 2
+                break
+        else:
+            if mask & WHEEL == WHEEL:
+                table[mask] = 5
+    return table
+
+
+STRAIGHT_HIGH = LazyTable("straight_high", _build_straight_high)
+
+
+def evaluate(cards: Iterable[int]) -> int:
+    """Return the strength of the best five-card hand among the cards."""
+    # Rank masks of ranks seen at least once, twice, three and four times
+    seen = pairs = trips = quads = 0
+    suit_masks = [0, 0, 0, 0]
+    for card in cards:
+        bit = 1 << (card >> 2)
+        suit_masks[card & 3] |= bit
+        if seen & bit:
+            if pairs & bit:
+                if trips & bit:
+                    quads |= bit
+                else:
+                    trips |= bit
+            else:
+                pairs |= bit
+        else:
+            seen |= bit
+    return evaluate_masks(seen, pairs, trips, quads, suit_masks)
+
+
+def evaluate_masks(seen: int, pairs: int, trips: int, quads: int, suit_masks: Sequence[int]) -> int:
+    """
+    Return the strength of a hand summarised as rank masks.
+    
+    ``seen``, ``pairs``, ``trips`` and ``quads`` hold the ranks present at
+    least once, twice, three and four times; ``suit_masks`` holds the ranks
+    present in each suit.  Callers that add cards one at a time (see
+    ``HandTracker``) keep these masks up to date instead of re-reading cards.
+    """
+    straight_high = STRAIGHT_HIGH.get()
+    
+    for mask in suit_masks:
+        if mask.bit_count() >= 5:
+            high = straight_high[mask]
+            if high == 14:
+                return ROYAL_FLUSH << 20 | 14 << 16
+            if high:
+                return STRAIGHT_FLUSH << 20 | high << 16
+            return FLUSH << 20 | _pack(mask, 5, 16)
+    
+    if quads:
+        top = quads.bit_length() - 1
+        return FOUR_OF_A_KIND << 20 | (top + 2) << 16 | _pack(seen & ~(1 << top), 1, 12)
+    
+    if trips:
+        top = trips.bit_length() - 1
+        rest = pairs & ~(1 << top)
+        if rest:
+            return FULL_HOUSE << 20 | (top + 2) << 16 | (rest.bit_length() + 1) << 12
+    
+    high = straight_high[seen]
+    if high:
+        return STRAIGHT << 20 | high << 16
+    
+    if trips:
+        top = trips.bit_length() - 1
+        return THREE_OF_A_KIND << 20 | (top + 2) << 16 | _pack(seen & ~(1 << top), 2, 12)
+    
+    if pairs:
+        top = pairs.bit_length() - 1
+        second = (pairs & ~(1 << top)).bit_length() - 1
+        if second >= 0:
+            kickers = seen & ~(1 << top) & ~(1 << second)
+            return TWO_PAIR << 20 | (top + 2) << 16 | (second + 2) << 12 | _pack(kickers, 1, 8)
+        return PAIR << 20 | (top + 2) << 16 | _pack(seen & ~(1 << top), 3, 12)
+    
+    return HIGH_CARD << 20 | _pack(seen, 5, 16)
+
+
+def _pack(mask: int, count: int, shift: int) -> int:
+    """Pack the ``count`` highest ranks of a mask as 4-bit values, starting at ``shift``."""
+    value = 0
+    while count and mask:
+        top = mask.bit_length() - 1
+        value |= (top + 2) << shift
+        mask ^= 1 << top
+        shift -= 4
+        count -= 1
+    return value
+
+
+def category(strength: int) -> int:
+    """Return the hand category (1 = high card ... 10 = royal flush) of a strength."""
+    return strength >> 20
+
+
+def hand_name(strength: int) -> str:
+    """Return the display name of a strength's hand category, e.g. 'Full House'."""
+    return CATEGORY_NAMES[strength >> 20]
+
+
+def tiebreakers(strength: int) -> List[int]:
+    """Return the tiebreaker ranks (2-14) encoded in a strength."""
+    return [value for value in ((strength >> shift) & 15 for shift in (16, 12, 8, 4, 0)) if value]
+
+
+def describe(strength: int) -> Tuple["HandRank", List[int]]:
+    """Return a strength as the ``(HandRank, tiebreakers)`` pair ``PokerHand`` uses."""
+    from .hand_evaluator import HandRank
+    
+    rank = next(r for r in HandRank if r.numeric_value == strength >> 20)
+    return rank, tiebreakers(strength)
+
+
+def parse_card(code: str) -> int:
+    """Parse a card code such as 'Ah' or 'Td' into a card integer."""
+    if len(code) != 2 or code[0].upper() not in RANKS or code[1].lower() not in SUITS:
+        raise ValueError(f"Invalid card code: {code!r}")
+    return RANKS.index(code[0].upper()) * 4 + SUITS.index(code[1].lower())
+
+
+def parse_cards(text: str) -> List[int]:
+    """Parse card codes, either run together ('AhKh') or separated by spaces or commas."""
+    text = "".join(text.replace(",", " ").split())
+    if len(text) % 2:
+        raise ValueError(f"Invalid cards: {text!r}")
+    return [parse_card(text[i:i + 2]) for i in range(0, len(text), 2)]
+
+
+def card_code(card: int) -> str:
+    """Return the two-character code of a card integer."""
+    return RANKS[card >> 2] + SUITS[card & 3]
+
+
+def from_card(card: "Card") -> int:
+    """Convert a ``Card`` into a card integer."""
+    return (card.rank.numeric_value - 2) * 4 + _SUIT_INDEX[card.suit.symbol]
+
+
+def from_cards(cards: Sequence["Card"]) -> List[int]:
+    """Convert ``Card`` objects into card integers."""
+    return [from_card(card) for card in cards]
+
+
+def to_card(card: int) -> "Card":
+    """Convert a card integer back into a ``Card``."""
+    from .cards import Card
+    
+    return Card.from_code(card_code(card))
@@ -1,21 +1,74 @@
 """
 Main poker game implementation with enhanced visuals.
 """
-from typing import List, Optional, Tuple
-import time
+from typing import Any, Callable, Dict, Generator, List, NamedTuple, Optional, Tuple, Union
 import os
+import time
 
+from . import instrumentation
+from .animation import get_scheduler
 from .cards import Card, Deck
 from .player import Player, HumanPlayer, AIPlayer
-from .hand_evaluator import PokerHand
+from .evaluator import evaluate, from_cards, hand_name
+from .opponent_stats import OpponentModel
 from .visuals import PokerArt, CardDisplay, Colors, print_with_sparkle_effect, clear_screen_with_effect
 
 
+class ActionRequest(NamedTuple):
+    """A request for a player's betting decision, yielded by the hand engine."""
+    player: Player
+    community_cards: List[Card]
+    current_bet: int
+    pot_size: int
+
+
+class RaiseRequest(NamedTuple):
+    """A request for a player's raise amount, yielded by the hand engine."""
+    player: Player
+    min_raise: int
+    max_raise: int
+
+
+Request = Union[ActionRequest, RaiseRequest]
+HandSteps = Generator[Request, Union[str, int], None]
+Listener = Callable[[str, Dict[str, Any]], None]
+
+
+class ActionClock:
+    """Per-action time limit for awaitable decisions, with an optional time bank."""
+    
+    def __init__(self, seconds: float, time_bank: float = 0.0):
+        """
+        Allow ``seconds`` per action plus a per-player ``time_bank`` that is
+        drawn down whenever a player takes longer than ``seconds``.
+        """
+        self.seconds = seconds
+        self.time_bank = time_bank
+        self._banks: Dict[Player, float] = {}
+    
+    def allowance(self, player: Player) -> float:
+        """Return how long the player may take on their next action."""
+        return self.seconds + self._banks.get(player, self.time_bank)
+    
+    def charge(self, player: Player, elapsed: float) -> None:
+        """Draw any time over the per-action limit from the player's bank."""
+        overrun = elapsed - self.seconds
+        if overrun > 0:
+            self._banks[player] = max(0.0, self._banks.get(player, self.time_bank) - overrun)
+
+
 class PokerGame:
     """Texas Hold'em poker game."""
     
-    def __init__(self, player_name: str = "Player", num_ai_players: int = 3):
-        """Initialize the poker game."""
+    def __init__(self, player_name: str = "Player", num_ai_players: int = 3,
+                 players: Optional[List[Player]] = None, verbose: bool = True):
+        """
+        Initialize the poker game.
+        
+        Pass ``players`` to seat an explicit list of players instead of one
+        human and ``num_ai_players`` AIs, and ``verbose=False`` to run the
+        table without any terminal output.
+        """
         self.deck = Deck()
         self.community_cards: List[Card] = []
         self.pot = 0
@@ -23,19 +76,40 @@ class PokerGame:
         self.small_blind = 10
         self.big_blind = 20
         self.dealer_position = 0
+        self.verbose = verbose
+        self.listeners: List[Listener] = []
         
         # Create players
-        self.players: List[Player] = [HumanPlayer(player_name)]
-        for i in range(num_ai_players):
-            self.players.append(AIPlayer(f"AI {i+1}"))
+        if players is not None:
+            self.players: List[Player] = list(players)
+        else:
+            self.players = [HumanPlayer(player_name)]
+            # The AIs share what they learn about everyone at the table
+            observer = OpponentModel().watch(self)
+            for i in range(num_ai_players):
+                self.players.append(AIPlayer(f"AI {i+1}", opponents=observer))
         
         self.active_players: List[Player] = []
     
+    def add_listener(self, listener: Listener) -> None:
+        """Register a callback invoked as ``listener(event, data)`` for game events."""
+        self.listeners.append(listener)
+    
+    def _notify(self, event: str, **data: Any) -> None:
+        """Send a game event to every registered listener."""
+        for listener in self.listeners:
+            listener(event, data)
+    
+    def _say(self, text: str = "") -> None:
+        """Print a line of game output unless the table is running quietly."""
+        if self.verbose:
+            print(text)
+    
     def play_game(self) -> None:
         """Main game loop with enhanced visuals."""
         # Enhanced animated intro
         PokerArt.animated_title()
-        time.sleep(1)
+        get_scheduler().pause(1)
         
         clear_screen_with_effect()
         print(PokerArt.title_banner())
@@ -46,7 +120,7 @@ class PokerGame:
         print_with_sparkle_effect(f"Blinds: {Colors.YELLOW}{self.small_blind}/{self.big_blind}{Colors.RESET}")
         print_with_sparkle_effect(f"Starting chips: {Colors.GREEN}1000{Colors.RESET} per player")
         
-        time.sleep(2)
+        get_scheduler().pause(2)
         
         hand_number = 1
         while len([p for p in self.players if p.chips > 0]) > 1:
@@ -57,11 +131,7 @@ class PokerGame:
             self.play_hand()
             hand_number += 1
             
-            # Remove players with no chips
-            self.players = [p for p in self.players if p.chips > 0]
-            
-            # Update dealer position
-            self.dealer_position = (self.dealer_position + 1) % len(self.players)
+            self.advance_to_next_hand()
             
             # Check if human player is still in the game
             human_player = next((p for p in self.players if isinstance(p, HumanPlayer)), None)
@@ -84,8 +154,81 @@ class PokerGame:
         print(f"\n{Colors.BOLD}{Colors.MAGENTA}🎊 Thanks for playing at our premium casino! �{Colors.RESET}")
         print(PokerArt.poker_table_deluxe())
     
+    def advance_to_next_hand(self) -> None:
+        """Remove players with no chips and move the dealer button."""
+        self.players = [p for p in self.players if p.chips > 0]
+        if self.players:
+            self.dealer_position = (self.dealer_position + 1) % len(self.players)
+    
     def play_hand(self) -> None:
         """Play a single hand of poker."""
+        steps = self.hand_steps()
+        try:
+            request = next(steps)
+            while True:
+                request = steps.send(self.resolve(request))
+        except StopIteration:
+            pass
+    
+    @staticmethod
+    def resolve(request: Request) -> Union[str, int]:
+        """Answer a decision request by asking the player synchronously."""
+        if isinstance(request, RaiseRequest):
+            return request.player.get_raise_amount(request.min_raise, request.max_raise)
+        return request.player.make_decision(request.community_cards, request.current_bet, request.pot_size)
+    
+    async def play_hand_async(self, action_clock: Optional[ActionClock] = None) -> None:
+        """
+        Play a single hand, awaiting each player's decision.
+        
+        With an ``action_clock``, a player who runs out of time checks if
+        they can and folds otherwise, so nobody can stall the table.
+        """
+        import asyncio
+        
+        steps = self.hand_steps()
+        try:
+            request = next(steps)
+            while True:
+                answer = await self.resolve_async(request, action_clock)
+                # Yield to the event loop so one table cannot starve the others
+                await asyncio.sleep(0)
+                request = steps.send(answer)
+        except StopIteration:
+            pass
+    
+    async def resolve_async(self, request: Request, action_clock: Optional[ActionClock] = None) -> Union[str, int]:
+        """Answer a decision request by awaiting the player, enforcing the clock."""
+        import asyncio
+        
+        player = request.player
+        if isinstance(request, RaiseRequest):
+            decision = player.decide_raise_amount(request.min_raise, request.max_raise)
+            fallback: Union[str, int] = request.min_raise
+        else:
+            decision = player.decide(request.community_cards, request.current_bet, request.pot_size)
+            fallback = "check" if request.current_bet <= player.current_bet else "fold"
+        
+        if action_clock is None:
+            return await decision
+        
+        started = time.monotonic()
+        try:
+            return await asyncio.wait_for(decision, action_clock.allowance(player))
+        except asyncio.TimeoutError:
+            self._notify("timeout", player=player, action=fallback)
+            return fallback
+        finally:
+            action_clock.charge(player, time.monotonic() - started)
+    
+    def hand_steps(self) -> HandSteps:
+        """
+        Play a single hand as a generator of decision requests.
+        
+        Each ``ActionRequest`` must be answered (via ``send``) with the
+        player's decision and each ``RaiseRequest`` with a raise amount.
+        This lets blocking and asynchronous drivers share the same rules.
+        """
         # Reset for new hand
         self.deck.reset()
         self.community_cards = []
@@ -100,46 +243,76 @@ class PokerGame:
         if len(self.active_players) < 2:
             return
         
+        instrumentation.count("hands")
+        self._notify("hand_start", players=list(self.active_players),
+                     dealer=self.active_players[self.dealer_position % len(self.active_players)])
+        
         # Post blinds
         self._post_blinds()
         
         # Deal hole cards
-        self._deal_hole_cards()
+        with instrumentation.timer("deal", street="preflop"):
+            self._deal_hole_cards()
         
         # Pre-flop betting round
-        print(PokerArt.betting_round_header_deluxe("🎲 PRE-FLOP"))
-        if self._betting_round():
+        if self.verbose:
+            print(PokerArt.betting_round_header_deluxe("🎲 PRE-FLOP"))
+        with instrumentation.timer("betting_round", street="preflop"):
+            hand_over = yield from self._betting_round()
+        if hand_over:
             return
         
         # Deal the flop
         if len([p for p in self.active_players if not p.folded]) > 1:
-            PokerArt.loading_animation("Dealing the flop", 1.5)
-            self._deal_flop()
-            print(PokerArt.betting_round_header_deluxe("🃏 FLOP", self.community_cards[:3]))
-            print(CardDisplay.display_cards_with_shadow(self.community_cards[:3], "🌟 Community Cards 🌟"))
-            if self._betting_round():
+            if self.verbose:
+                PokerArt.loading_animation("Dealing the flop", 1.5, blocking=False)
+            with instrumentation.timer("deal", street="flop"):
+                self._deal_flop()
+            get_scheduler().wait()
+            self._notify("street", street="flop", community_cards=list(self.community_cards))
+            if self.verbose:
+                print(PokerArt.betting_round_header_deluxe("🃏 FLOP", self.community_cards[:3]))
+                print(CardDisplay.display_cards_with_shadow(self.community_cards[:3], "🌟 Community Cards 🌟"))
+            with instrumentation.timer("betting_round", street="flop"):
+                hand_over = yield from self._betting_round()
+            if hand_over:
                 return
         
         # Deal the turn
         if len([p for p in self.active_players if not p.folded]) > 1:
-            PokerArt.loading_animation("Dealing the turn", 1.0)
-            self._deal_turn()
-            print(PokerArt.betting_round_header_deluxe("🎯 TURN", self.community_cards))
-            print(CardDisplay.display_cards_with_shadow(self.community_cards, "🌟 Community Cards 🌟"))
-            if self._betting_round():
+            if self.verbose:
+                PokerArt.loading_animation("Dealing the turn", 1.0, blocking=False)
+            with instrumentation.timer("deal", street="turn"):
+                self._deal_turn()
+            get_scheduler().wait()
+            self._notify("street", street="turn", community_cards=list(self.community_cards))
+            if self.verbose:
+                print(PokerArt.betting_round_header_deluxe("🎯 TURN", self.community_cards))
+                print(CardDisplay.display_cards_with_shadow(self.community_cards, "🌟 Community Cards 🌟"))
+            with instrumentation.timer("betting_round", street="turn"):
+                hand_over = yield from self._betting_round()
+            if hand_over:
                 return
         
         # Deal the river
         if len([p for p in self.active_players if not p.folded]) > 1:
-            PokerArt.loading_animation("Dealing the river", 1.0)
-            self._deal_river()
-            print(PokerArt.betting_round_header_deluxe("🌊 RIVER", self.community_cards))
-            print(CardDisplay.display_cards_with_shadow(self.community_cards, "🌟 Final Community Cards 🌟"))
-            if self._betting_round():
+            if self.verbose:
+                PokerArt.loading_animation("Dealing the river", 1.0, blocking=False)
+            with instrumentation.timer("deal", street="river"):
+                self._deal_river()
+            get_scheduler().wait()
+            self._notify("street", street="river", community_cards=list(self.community_cards))
+            if self.verbose:
+                print(PokerArt.betting_round_header_deluxe("🌊 RIVER", self.community_cards))
+                print(CardDisplay.display_cards_with_shadow(self.community_cards, "🌟 Final Community Cards 🌟"))
+            with instrumentation.timer("betting_round", street="river"):
+                hand_over = yield from self._betting_round()
+            if hand_over:
                 return
         
         # Showdown
-        self._showdown()
+        with instrumentation.timer("showdown"):
+            self._showdown()
     
     def _post_blinds(self) -> None:
         """Post small and big blinds."""
@@ -153,21 +326,24 @@ class PokerGame:
         sb_amount = sb_player.bet(self.small_blind)
         self.pot += sb_amount
         self.current_bet = sb_amount
-        print(f"{Colors.BLUE}{sb_player.name}{Colors.RESET} posts small blind: {Colors.YELLOW}{sb_amount}{Colors.RESET}")
+        self._say(f"{Colors.BLUE}{sb_player.name}{Colors.RESET} posts small blind: {Colors.YELLOW}{sb_amount}{Colors.RESET}")
+        self._notify("blind", player=sb_player, amount=sb_amount)
         
         # Big blind
         bb_pos = (self.dealer_position + 2) % num_players
         bb_player = self.active_players[bb_pos]
         bb_amount = bb_player.bet(self.big_blind)
         self.pot += bb_amount
-        self.current_bet = bb_amount
-        print(f"{Colors.BLUE}{bb_player.name}{Colors.RESET} posts big blind: {Colors.YELLOW}{bb_amount}{Colors.RESET}")
+        self.current_bet = max(sb_amount, bb_amount)
+        self._say(f"{Colors.BLUE}{bb_player.name}{Colors.RESET} posts big blind: {Colors.YELLOW}{bb_amount}{Colors.RESET}")
+        self._notify("blind", player=bb_player, amount=bb_amount)
     
     def _deal_hole_cards(self) -> None:
         """Deal hole cards to all players."""
         for player in self.active_players:
             hole_cards = [self.deck.deal_card(), self.deck.deal_card()]
             player.receive_cards(hole_cards)
+            self._notify("hole_cards", player=player, cards=hole_cards)
     
     def _deal_flop(self) -> None:
         """Deal the flop (3 community cards)."""
@@ -185,16 +361,18 @@ class PokerGame:
         self.deck.deal_card()  # Burn card
         self.community_cards.append(self.deck.deal_card())
     
-    def _betting_round(self) -> bool:
+    def _betting_round(self) -> Generator[Request, Union[str, int], bool]:
         """Conduct a betting round. Returns True if hand ends early."""
-        # Reset current bets for this round
-        for player in self.active_players:
-            player.current_bet = 0
-        self.current_bet = 0
+        # Reset current bets for this round; pre-flop the blinds are the bets
+        if self.community_cards:
+            for player in self.active_players:
+                player.current_bet = 0
+            self.current_bet = 0
         
         acting_players = [p for p in self.active_players if p.can_act()]
-        if len(acting_players) <= 1:
-            return True
+        if len(acting_players) <= 1 and not self._owes_call(acting_players):
+            # Nobody left to bet against - run out the board to a showdown
+            return False
         
         # Determine starting position
         if len(self.community_cards) == 0:  # Pre-flop
@@ -210,7 +388,8 @@ class PokerGame:
             player = self.active_players[current_pos]
             
             if player.can_act():
-                action = self._player_action(player)
+                action = yield from self._player_action(player)
+                instrumentation.count("actions", action=action)
                 actions_this_round += 1
                 
                 if action == "raise":
@@ -219,8 +398,10 @@ class PokerGame:
                     # Check if only one player remains
                     remaining = [p for p in self.active_players if not p.folded]
                     if len(remaining) == 1:
-                        print(PokerArt.winner_celebration_deluxe(remaining[0].name, self.pot))
+                        if self.verbose:
+                            print(PokerArt.winner_celebration_deluxe(remaining[0].name, self.pot))
                         remaining[0].chips += self.pot
+                        self._notify("hand_end", winners={remaining[0]: self.pot}, showdown=False)
                         return True
             
             # Move to next player
@@ -232,32 +413,36 @@ class PokerGame:
         
         return False
     
-    def _player_action(self, player: Player) -> str:
+    def _player_action(self, player: Player) -> Generator[Request, Union[str, int], str]:
         """Handle a single player's action with enhanced visuals."""
         call_amount = self.current_bet - player.current_bet
         
         # Display enhanced game state
-        print(CardDisplay.display_pot_info_deluxe(self.pot, self.current_bet))
-        print(f"\n{Colors.BOLD}{Colors.CYAN}🎯 {player.name}'s Turn 🎯{Colors.RESET}")
-        print(f"💰 Chips: {Colors.GREEN}{player.chips}{Colors.RESET} | 💸 Bet this round: {Colors.YELLOW}{player.current_bet}{Colors.RESET}")
+        if self.verbose:
+            print(CardDisplay.display_pot_info_deluxe(self.pot, self.current_bet))
+            print(f"\n{Colors.BOLD}{Colors.CYAN}🎯 {player.name}'s Turn 🎯{Colors.RESET}")
+            print(f"💰 Chips: {Colors.GREEN}{player.chips}{Colors.RESET} | 💸 Bet this round: {Colors.YELLOW}{player.current_bet}{Colors.RESET}")
         
-        decision = player.make_decision(self.community_cards, self.current_bet, self.pot)
+        decision = yield ActionRequest(player, self.community_cards, self.current_bet, self.pot)
         
         if decision == "fold":
             player.fold()
-            print(f"{Colors.RED}{Colors.BOLD}{player.name} folds 🙅‍♂️{Colors.RESET}")
+            self._say(f"{Colors.RED}{Colors.BOLD}{player.name} folds 🙅‍♂️{Colors.RESET}")
+            self._notify("action", player=player, action="fold", amount=0, pot=self.pot)
             return "fold"
         
         elif decision == "check":
-            print(f"{Colors.GREEN}{Colors.BOLD}{player.name} checks ✋{Colors.RESET}")
+            self._say(f"{Colors.GREEN}{Colors.BOLD}{player.name} checks ✋{Colors.RESET}")
+            self._notify("action", player=player, action="check", amount=0, pot=self.pot)
             return "check"
         
         elif decision == "call":
             actual_bet = player.bet(call_amount)
             self.pot += actual_bet
-            print(f"{Colors.GREEN}{Colors.BOLD}{player.name} calls {actual_bet} 📞{Colors.RESET}")
+            self._say(f"{Colors.GREEN}{Colors.BOLD}{player.name} calls {actual_bet} 📞{Colors.RESET}")
             if actual_bet < call_amount:
-                print(f"{Colors.MAGENTA}{Colors.BOLD}🚀 {player.name} is ALL-IN! 🚀{Colors.RESET}")
+                self._say(f"{Colors.MAGENTA}{Colors.BOLD}🚀 {player.name} is ALL-IN! 🚀{Colors.RESET}")
+            self._notify("action", player=player, action="call", amount=actual_bet, pot=self.pot)
             return "call"
         
         elif decision == "raise":
@@ -268,18 +453,20 @@ class PokerGame:
                 # Can't raise, treat as call
                 actual_bet = player.bet(call_amount)
                 self.pot += actual_bet
-                print(f"{Colors.GREEN}{Colors.BOLD}{player.name} calls {actual_bet} (insufficient chips to raise) 📞{Colors.RESET}")
+                self._say(f"{Colors.GREEN}{Colors.BOLD}{player.name} calls {actual_bet} (insufficient chips to raise) 📞{Colors.RESET}")
+                self._notify("action", player=player, action="call", amount=actual_bet, pot=self.pot)
                 return "call"
             
-            raise_amount = player.get_raise_amount(min_raise, max_raise)
+            raise_amount = yield RaiseRequest(player, min_raise, max_raise)
             actual_bet = player.bet(raise_amount)
             self.pot += actual_bet
             self.current_bet = player.current_bet
-            print(f"{Colors.YELLOW}{Colors.BOLD}{player.name} raises to {self.current_bet}! 📈{Colors.RESET}")
+            self._say(f"{Colors.YELLOW}{Colors.BOLD}{player.name} raises to {self.current_bet}! 📈{Colors.RESET}")
             
             if actual_bet < raise_amount:
-                print(f"{Colors.MAGENTA}{Colors.BOLD}🚀 {player.name} is ALL-IN! 🚀{Colors.RESET}")
+                self._say(f"{Colors.MAGENTA}{Colors.BOLD}🚀 {player.name} is ALL-IN! 🚀{Colors.RESET}")
             
+            self._notify("action", player=player, action="raise", amount=actual_bet, pot=self.pot)
             return "raise"
         
         return "check"
@@ -289,7 +476,8 @@ class PokerGame:
         acting_players = [p for p in self.active_players if p.can_act()]
         
         if len(acting_players) <= 1:
-            return True
+            # A last player facing an all-in still has to call or fold
+            return not self._owes_call(acting_players)
         
         # Everyone has had a chance to act
         if actions < len(acting_players):
@@ -302,50 +490,68 @@ class PokerGame:
         
         return True
     
+    def _owes_call(self, players: List[Player]) -> bool:
+        """Check if any of the players has yet to match the current bet."""
+        return any(player.current_bet < self.current_bet for player in players)
+    
     def _showdown(self) -> None:
         """Determine the winner and distribute chips."""
         remaining_players = [p for p in self.active_players if not p.folded]
         
         if len(remaining_players) == 1:
             winner = remaining_players[0]
-            print(PokerArt.winner_celebration_deluxe(winner.name, self.pot))
+            if self.verbose:
+                print(PokerArt.winner_celebration_deluxe(winner.name, self.pot))
             winner.chips += self.pot
+            self._notify("hand_end", winners={winner: self.pot}, showdown=False)
             return
         
-        print(PokerArt.showdown_banner())
-        print(CardDisplay.display_cards_with_shadow(self.community_cards, "🌟 Final Community Cards 🌟"))
-        print()
+        if self.verbose:
+            print(PokerArt.showdown_banner())
+            print(CardDisplay.display_cards_with_shadow(self.community_cards, "🌟 Final Community Cards 🌟"))
+            print()
         
-        # Evaluate all hands with enhanced display
-        hand_evaluations = []
+        # One integer strength per player in a single pass, tracking the best as we go
+        board = from_cards(self.community_cards)
+        strengths = {}
+        best = -1
+        winners: List[Player] = []
         for player in remaining_players:
-            hand = player.get_hand(self.community_cards)
-            hand_evaluations.append((player, hand))
+            strength = evaluate(from_cards(player.hole_cards) + board)
+            strengths[player] = strength
+            if strength > best:
+                best = strength
+                winners = [player]
+            elif strength == best:
+                winners.append(player)
             
             # Show player's cards and hand
-            print(f"{Colors.BOLD}{Colors.CYAN}🎯 {player.name}:{Colors.RESET}")
-            print(CardDisplay.display_cards_with_shadow(player.hole_cards, "  🃏 Hole Cards"))
-            print(f"  {Colors.YELLOW}{Colors.BOLD}✨ Best Hand: {hand} ✨{Colors.RESET}\n")
+            if self.verbose:
+                print(f"{Colors.BOLD}{Colors.CYAN}🎯 {player.name}:{Colors.RESET}")
+                print(CardDisplay.display_cards_with_shadow(player.hole_cards, "  🃏 Hole Cards"))
+                print(f"  {Colors.YELLOW}{Colors.BOLD}✨ Best Hand: {hand_name(strength)} ✨{Colors.RESET}\n")
         
-        # Find the winner(s)
-        best_hand = max(hand_evaluations, key=lambda x: (x[1].best_hand[0].numeric_value, x[1].best_hand[1]))
-        winners = [player for player, hand in hand_evaluations 
-                  if hand.compare(best_hand[1]) == 0]
+        self._notify("showdown", strengths=strengths)
         
         # Distribute pot
-        winnings_per_player = self.pot // len(winners)
-        remainder = self.pot % len(winners)
+        winnings_per_player, remainder = divmod(self.pot, len(winners))
+        payouts = {}
         
         for i, winner in enumerate(winners):
             winnings = winnings_per_player + (1 if i < remainder else 0)
             winner.chips += winnings
+            payouts[winner] = winnings
             if len(winners) == 1:
-                print(PokerArt.winner_celebration_deluxe(winner.name, winnings))
-                print(f"{Colors.BOLD}{Colors.GREEN}🏆 Winning hand: {best_hand[1]} 🏆{Colors.RESET}")
+                if self.verbose:
+                    print(PokerArt.winner_celebration_deluxe(winner.name, winnings))
+                self._say(f"{Colors.BOLD}{Colors.GREEN}🏆 Winning hand: {hand_name(best)} 🏆{Colors.RESET}")
             else:
-                print(f"{Colors.BOLD}{Colors.YELLOW}🤝 {winner.name} ties and wins {winnings:,} chips! 🤝{Colors.RESET}")
+                self._say(f"{Colors.BOLD}{Colors.YELLOW}🤝 {winner.name} ties and wins {winnings:,} chips! 🤝{Colors.RESET}")
+        
+        self._notify("hand_end", winners=payouts, showdown=True)
         
-        time.sleep(2)
+        if self.verbose:
+            get_scheduler().pause(2)
     
     def _display_chip_counts(self) -> None:
         """Display current chip counts."""
@@ -0,0 +1,163 @@
+"""
+Incremental hand state for one player through the streets of a hand.
+
+A ``HandTracker`` starts from a player's hole cards and is fed the board as
+it is dealt.  Each new card updates rank and suit masks in constant time, so
+the made hand and the flush and straight draws on the flop, turn and river
+are available without re-evaluating the cards seen so far.  Cards are the
+integers used by ``evaluator``.
+"""
+import math
+from typing import Iterable, List, Sequence
+
+from .distribution import percentile
+from .evaluator import FLUSH, STRAIGHT, STRAIGHT_HIGH, evaluate_masks
+from .tables import LazyTable
+
+
+def _build_straight_outs() -> List[int]:
+    """Map every rank mask without a straight to the mask of ranks that would make one."""
+    straight_high = STRAIGHT_HIGH.get()
+    table = [0] * 8192
+    for mask in range(8192):
+        if straight_high[mask]:
+            continue
+        for rank in range(13):
+            bit = 1 << rank
+            if not mask & bit and straight_high[mask | bit]:
+                table[mask] |= bit
+    return table
+
+
+STRAIGHT_OUTS = LazyTable("straight_outs", _build_straight_outs, cached=True)
+
+
+class HandTracker:
+    """Tracks one player's hand as hole cards and board cards arrive."""
+    
+    def __init__(self, hole_cards: Iterable[int] = ()):
+        """Start tracking a hand from its hole cards."""
+        self.reset(hole_cards)
+    
+    def reset(self, hole_cards: Iterable[int] = ()) -> None:
+        """Forget the board and start again from new hole cards."""
+        self.hole: List[int] = []
+        self.board: List[int] = []
+        self.history: List[int] = []
+        self.seen = self.pairs = self.trips = self.quads = 0
+        self.suit_masks = [0, 0, 0, 0]
+        self.suit_counts = [0, 0, 0, 0]
+        self._strength = 0
+        for card in hole_cards:
+            self._add(card)
+            self.hole.append(card)
+    
+    def add(self, card: int) -> None:
+        """Add one board card."""
+        self._add(card)
+        self.board.append(card)
+    
+    def update(self, board: Sequence[int]) -> None:
+        """
+        Bring the tracker up to date with the board dealt so far.
+        
+        Only cards not seen before are added, and the strength after each
+        update is recorded in ``history`` (one entry per street).  A board
+        that does not continue the one already tracked restarts the hand.
+        """
+        known = len(self.board)
+        if board[:known] != self.board:
+            self.reset(self.hole)
+            known = 0
+        if len(board) == known:
+            return
+        for card in board[known:]:
+            self.add(card)
+        self.history.append(self.strength())
+    
+    def _add(self, card: int) -> None:
+        """Fold a card into the rank and suit masks."""
+        bit = 1 << (card >> 2)
+        suit = card & 3
+        self.suit_masks[suit] |= bit
+        self.suit_counts[suit] += 1
+        if self.seen & bit:
+            if self.pairs & bit:
+                if self.trips & bit:
+                    self.quads |= bit
+                else:
+                    self.trips |= bit
+            else:
+                self.pairs |= bit
+        else:
+            self.seen |= bit
+        self._strength = 0
+    
+    def strength(self) -> int:
+        """Return the evaluator strength of the best hand made so far."""
+        if not self._strength:
+            self._strength = evaluate_masks(self.seen, self.pairs, self.trips, self.quads, self.suit_masks)
+        return self._strength
+    
+    @property
+    def cards_to_come(self) -> int:
+        """Return how many board cards are still to be dealt."""
+        return 5 - len(self.board)
+    
+    def flush_suit(self) -> int:
+        """Return the suit with exactly four cards (a flush draw), or -1."""
+        if self.cards_to_come == 0 or max(self.suit_counts) >= 5:
+            return -1
+        for suit, count in enumerate(self.suit_counts):
+            if count == 4:
+                return suit
+        return -1
+    
+    def flush_outs(self) -> int:
+        """Return the number of unseen cards that complete a flush."""
+        return 9 if self.flush_suit() >= 0 else 0
+    
+    def straight_out_ranks(self) -> int:
+        """Return the mask of ranks that would complete a straight."""
+        if self.cards_to_come == 0 or max(self.suit_counts) >= 5:
+            return 0
+        return STRAIGHT_OUTS.get()[self.seen]
+    
+    def straight_outs(self) -> int:
+        """Return the number of unseen cards that complete a straight."""
+        return 4 * self.straight_out_ranks().bit_count()
+    
+    def outs(self) -> int:
+        """Return the number of unseen cards that complete a flush or a straight."""
+        ranks = self.straight_out_ranks().bit_count()
+        if self.flush_suit() >= 0:
+            # Out ranks in the flush suit are already counted as flush outs
+            return 9 + 3 * ranks
+        return 4 * ranks
+    
+    def hit_probability(self, outs: int = -1) -> float:
+        """Return the chance of catching at least one out by the river."""
+        if outs < 0:
+            outs = self.outs()
+        unseen = 52 - len(self.hole) - len(self.board)
+        to_come = self.cards_to_come
+        if outs <= 0 or to_come <= 0:
+            return 0.0
+        return 1.0 - math.comb(unseen - outs, to_come) / math.comb(unseen, to_come)
+    
+    def strength_estimate(self) -> float:
+        """
+        Return a 0-1 estimate of the hand's strength once the flop is out.
+        
+        The made hand is scored by its percentile among all seven-card hands,
+        and on the flop and turn a flush or straight draw moves it towards
+        the weakest flush or straight by the chance of the draw arriving.
+        """
+        made = percentile(self.strength())
+        if self.flush_outs():
+            drawn = percentile(FLUSH << 20)
+        elif self.straight_outs():
+            drawn = percentile(STRAIGHT << 20)
+        else:
+            return made
+        return max(made, made + self.hit_probability() * (drawn - made))
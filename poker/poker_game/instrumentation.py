@@ -0,0 +1,248 @@
+"""
+Opt-in instrumentation for the poker engine.
+
+Counters and timing histograms are recorded only after ``enable()`` is
+called.  While disabled, ``timer()`` hands back a shared no-op context
+manager and ``count()`` returns immediately; hot methods such as AI
+decisions, hand evaluation and rendering are only wrapped with timers while
+instrumentation is enabled, so they run untouched otherwise.
+
+Results can be exported as a text report or as a Prometheus text dump.
+"""
+import functools
+import importlib
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Histogram bucket upper bounds in seconds
+BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+# (module, class, method, metric, is_static) for methods timed while enabled;
+# a class of None times a module-level function as the module looks it up
+HOT_METHODS = [
+    ("poker_game.player", "AIPlayer", "make_decision", "ai_decision", False),
+    ("poker_game.player", "AIPlayer", "get_raise_amount", "ai_raise_amount", False),
+    ("poker_game.game", None, "evaluate", "hand_evaluation", False),
+    ("poker_game.visuals", "CardDisplay", "display_cards_with_shadow", "render", True),
+    ("poker_game.visuals", "CardDisplay", "display_pot_info_deluxe", "render", True),
+    ("poker_game.visuals", "CardDisplay", "display_action_menu_deluxe", "render", True),
+    ("poker_game.visuals", "PokerArt", "betting_round_header_deluxe", "render", True),
+    ("poker_game.visuals", "PokerArt", "winner_celebration_deluxe", "render", True),
+]
+
+Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class Histogram:
+    """A fixed-bucket timing histogram."""
+    
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.bucket_counts = [0] * len(BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+    
+    def observe(self, seconds: float) -> None:
+        """Record one duration."""
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.bucket_counts[i] += 1
+                break
+    
+    def quantile(self, fraction: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket containing it."""
+        target = fraction * self.count
+        seen = 0
+        for bound, bucket_count in zip(BUCKETS, self.bucket_counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+
+class Metrics:
+    """A registry of counters and timing histograms."""
+    
+    def __init__(self):
+        """Initialize an empty registry."""
+        self.counters: Dict[Key, int] = {}
+        self.histograms: Dict[Key, Histogram] = {}
+    
+    def count(self, name: str, amount: int = 1, **labels: str) -> None:
+        """Increment a counter."""
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + amount
+    
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """Record a duration in a histogram."""
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram()
+        histogram.observe(seconds)
+    
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        self.counters.clear()
+        self.histograms.clear()
+    
+    def report(self) -> str:
+        """Return a human-readable summary of all counters and timings."""
+        lines = ["Counters:"]
+        for key in sorted(self.counters):
+            lines.append(f"  {_display_name(key):<40} {self.counters[key]:>12,}")
+        
+        lines.append("")
+        lines.append(f"Timings:{'count':>41} {'total ms':>11} {'mean µs':>10} {'p95 µs':>10} {'max µs':>10}")
+        for key in sorted(self.histograms):
+            h = self.histograms[key]
+            lines.append(
+                f"  {_display_name(key):<40} {h.count:>8,} {h.total * 1e3:>11.2f} "
+                f"{h.total / h.count * 1e6:>10.1f} {h.quantile(0.95) * 1e6:>10.1f} {h.max * 1e6:>10.1f}"
+            )
+        return "\n".join(lines)
+    
+    def prometheus(self, prefix: str = "poker") -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        
+        for name in sorted({key[0] for key in self.counters}):
+            metric = f"{prefix}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for key in sorted(k for k in self.counters if k[0] == name):
+                lines.append(f"{metric}{_labels(key[1])} {self.counters[key]}")
+        
+        for name in sorted({key[0] for key in self.histograms}):
+            metric = f"{prefix}_{name}_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for key in sorted(k for k in self.histograms if k[0] == name):
+                h = self.histograms[key]
+                cumulative = 0
+                for bound, bucket_count in zip(BUCKETS, h.bucket_counts):
+                    cumulative += bucket_count
+                    lines.append(f"{metric}_bucket{_labels(key[1], le=repr(bound))} {cumulative}")
+                lines.append(f"{metric}_bucket{_labels(key[1], le='+Inf')} {h.count}")
+                lines.append(f"{metric}_sum{_labels(key[1])} {h.total!r}")
+                lines.append(f"{metric}_count{_labels(key[1])} {h.count}")
+        
+        return "\n".join(lines) + "\n"
+
+
+def _display_name(key: Key) -> str:
+    """Format a metric key as ``name{label=value}`` for the text report."""
+    name, labels = key
+    if not labels:
+        return name
+    return name + "{" + ",".join(f"{k}={v}" for k, v in labels) + "}"
+
+
+def _labels(labels: Tuple[Tuple[str, str], ...], **extra: str) -> str:
+    """Format Prometheus labels."""
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+class _Timer:
+    """Context manager that records its wall time into a histogram."""
+    
+    __slots__ = ("name", "labels", "started")
+    
+    def __init__(self, name: str, labels: Dict[str, str]):
+        self.name = name
+        self.labels = labels
+        self.started = 0.0
+    
+    def __enter__(self) -> "_Timer":
+        self.started = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        _metrics.observe(self.name, time.perf_counter() - self.started, **self.labels)
+
+
+class _NullTimer:
+    """Shared do-nothing context manager used while disabled."""
+    
+    __slots__ = ()
+    
+    def __enter__(self) -> "_NullTimer":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+_metrics = Metrics()
+_enabled = False
+_originals: List[Tuple[Any, str, Any]] = []
+
+
+def timer(name: str, **labels: str) -> Any:
+    """Return a context manager timing its block, or a no-op when disabled."""
+    if not _enabled:
+        return _NULL_TIMER
+    return _Timer(name, labels)
+
+
+def count(name: str, amount: int = 1, **labels: str) -> None:
+    """Increment a counter if instrumentation is enabled."""
+    if _enabled:
+        _metrics.count(name, amount, **labels)
+
+
+def get_metrics() -> Metrics:
+    """Return the global metrics registry."""
+    return _metrics
+
+
+def is_enabled() -> bool:
+    """Return True while instrumentation is recording."""
+    return _enabled
+
+
+def enable() -> None:
+    """Start recording metrics and wrap the hot methods with timers."""
+    global _enabled
+    if _enabled:
+        return
+    _enabled = True
+    for module_name, class_name, method_name, metric, is_static in HOT_METHODS:
+        module = importlib.import_module(module_name)
+        cls = module if class_name is None else getattr(module, class_name)
+        original = cls.__dict__[method_name]
+        _originals.append((cls, method_name, original))
+        if is_static:
+            wrapped = staticmethod(_timed(original.__func__, metric, view=method_name))
+        else:
+            wrapped = _timed(original, metric)
+        setattr(cls, method_name, wrapped)
+
+
+def disable() -> None:
+    """Stop recording metrics and restore the unwrapped hot methods."""
+    global _enabled
+    _enabled = False
+    while _originals:
+        cls, method_name, original = _originals.pop()
+        setattr(cls, method_name, original)
+
+
+def _timed(func: Callable[..., Any], metric: str, **labels: str) -> Callable[..., Any]:
+    """Wrap a function so each call is recorded in a histogram."""
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _metrics.observe(metric, time.perf_counter() - started, **labels)
+    return wrapper
@@ -0,0 +1,237 @@
+"""
+Load generator for the poker server.
+
+Spins up many simulated clients, each playing its seat with the ``AIPlayer``
+policy, and reports throughput and action round-trip latency.  Clients are
+spread over worker processes so thousands of connections can be driven from
+a single Linux host; the server can be started locally with ``--spawn-server``.
+
+The round-trip time of an action is measured from the moment a client sends
+its reply until the server's broadcast of that action (or its follow-up
+``raise`` request) arrives back at the client.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import resource
+import socket
+import time
+from typing import Any, Dict, List, Optional
+
+from .client import Message, PokerClient
+from .player import AIPlayer
+from .protocol import codes_to_cards
+
+
+class AIPolicy:
+    """Answers server requests using an ``AIPlayer``'s decision logic."""
+    
+    def __init__(self, name: str):
+        """Create the AI that will make this client's decisions."""
+        self.player = AIPlayer(name)
+    
+    def __call__(self, message: Message) -> Message:
+        """Reply to an ``act`` or ``raise`` request."""
+        if message["type"] == "raise":
+            return {"type": "amount", "amount": self.player.get_raise_amount(message["min"], message["max"])}
+        
+        player = self.player
+        player.hole_cards = codes_to_cards(message["hole_cards"])
+        player.chips = message["chips"]
+        player.current_bet = message["current_bet"] - message["to_call"]
+        action = player.make_decision(codes_to_cards(message["board"]), message["current_bet"], message["pot"])
+        if action not in message["options"]:
+            action = "check" if "check" in message["options"] else "call"
+        return {"type": "action", "action": action}
+
+
+class TimedClient(PokerClient):
+    """A client that records the round-trip time of each of its actions."""
+    
+    def __init__(self, name: str):
+        """Initialize a bot client with an AI policy."""
+        super().__init__(name, AIPolicy(name), self._on_message)
+        self.latencies: List[float] = []
+        self._sent_at: Optional[float] = None
+    
+    async def send(self, message: Message) -> None:
+        """Send a message, starting the clock for replies to requests."""
+        if message["type"] in ("action", "amount"):
+            self._sent_at = time.perf_counter()
+        await super().send(message)
+    
+    def _on_message(self, message: Message) -> None:
+        """Stop the clock when the server acknowledges our action."""
+        if self._sent_at is None:
+            return
+        kind = message["type"]
+        if kind == "raise" or (kind == "action" and message["player"] == self.name):
+            self.latencies.append(time.perf_counter() - self._sent_at)
+            self._sent_at = None
+
+
+def raise_file_limit() -> int:
+    """Raise the open-file soft limit as far as allowed; returns the new limit."""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY:
+        hard = 1 << 20
+    if soft < hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+            soft = hard
+        except (ValueError, OSError):
+            pass
+    return soft
+
+
+async def _run_clients(worker: int, count: int, target: Dict[str, Any], ramp: int) -> Dict[str, Any]:
+    """Connect ``count`` bot clients and play until their tables close."""
+    connecting = asyncio.Semaphore(ramp)
+    clients = [TimedClient(f"bot-{worker}-{i}") for i in range(count)]
+    failures = 0
+    
+    async def run(client: TimedClient) -> Optional[Message]:
+        nonlocal failures
+        try:
+            async with connecting:
+                if target["unix"]:
+                    await client.connect_unix(target["unix"])
+                else:
+                    await client.connect(target["host"], target["port"])
+            return await client.play()
+        except (ConnectionError, OSError):
+            failures += 1
+            return None
+        finally:
+            await client.close()
+    
+    results = await asyncio.gather(*(run(client) for client in clients))
+    return {
+        "latencies": [latency for client in clients for latency in client.latencies],
+        "hands": sum(client.hands_seen for client in clients),
+        "completed": sum(result is not None for result in results),
+        "failures": failures,
+    }
+
+
+def _worker(worker: int, count: int, target: Dict[str, Any], ramp: int) -> Dict[str, Any]:
+    """Process entry point: run a share of the clients on a fresh event loop."""
+    raise_file_limit()
+    return asyncio.run(_run_clients(worker, count, target, ramp))
+
+
+def _serve(target: Dict[str, Any], ai_players: int, max_hands: int) -> None:
+    """Process entry point: run a quiet poker server for the load test."""
+    from .server import PokerServer, serve
+    
+    raise_file_limit()
+    server = PokerServer(ai_players=ai_players, max_hands=max_hands)
+    asyncio.run(serve(server, target["host"], target["port"], target["unix"]))
+
+
+def _wait_for_server(target: Dict[str, Any], timeout: float = 10.0) -> None:
+    """Block until the server accepts connections."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if target["unix"]:
+                with socket.socket(socket.AF_UNIX) as sock:
+                    sock.connect(target["unix"])
+            else:
+                socket.create_connection((target["host"], target["port"]), timeout=1).close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run_load_test(clients: int, processes: int, target: Dict[str, Any], ramp: int = 200) -> Dict[str, Any]:
+    """Run the clients across worker processes and summarise the results."""
+    processes = max(1, min(processes, clients))
+    shares = [clients // processes + (1 if i < clients % processes else 0) for i in range(processes)]
+    
+    started = time.perf_counter()
+    with multiprocessing.Pool(processes) as pool:
+        results = pool.starmap(_worker, [(i, share, target, ramp) for i, share in enumerate(shares)])
+    elapsed = time.perf_counter() - started
+    
+    latencies = sorted(latency for result in results for latency in result["latencies"])
+    return {
+        "clients": clients,
+        "processes": processes,
+        "completed": sum(result["completed"] for result in results),
+        "failures": sum(result["failures"] for result in results),
+        "hands": sum(result["hands"] for result in results),
+        "actions": len(latencies),
+        "seconds": elapsed,
+        "actions_per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "latency_ms": {
+            "p50": percentile(latencies, 0.50) * 1000,
+            "p95": percentile(latencies, 0.95) * 1000,
+            "p99": percentile(latencies, 0.99) * 1000,
+            "max": (latencies[-1] if latencies else 0.0) * 1000,
+        },
+    }
+
+
+def format_report(summary: Dict[str, Any]) -> str:
+    """Format a load-test summary as a short text report."""
+    latency = summary["latency_ms"]
+    return "\n".join([
+        f"Clients:      {summary['clients']:,} over {summary['processes']} processes "
+        f"({summary['completed']:,} completed, {summary['failures']:,} failed)",
+        f"Hands seen:   {summary['hands']:,}",
+        f"Actions:      {summary['actions']:,} in {summary['seconds']:.2f}s "
+        f"({summary['actions_per_second']:,.0f} actions/sec)",
+        f"Round trip:   p50 {latency['p50']:.2f} ms | p95 {latency['p95']:.2f} ms | "
+        f"p99 {latency['p99']:.2f} ms | max {latency['max']:.2f} ms",
+    ])
+
+
+def main() -> None:
+    """Run a load test against a poker server from the command line."""
+    parser = argparse.ArgumentParser(description="Load-test the poker server with AI bot clients.")
+    parser.add_argument("--clients", type=int, default=1000, help="number of simulated clients")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="client worker processes")
+    parser.add_argument("--ramp", type=int, default=200, help="concurrent connection attempts per process")
+    parser.add_argument("--host", default="127.0.0.1", help="server host")
+    parser.add_argument("--port", type=int, default=8765, help="server TCP port")
+    parser.add_argument("--unix", metavar="PATH", help="connect over a Unix socket instead of TCP")
+    parser.add_argument("--spawn-server", action="store_true", help="start a local server for the test")
+    parser.add_argument("--ai-players", type=int, default=3, help="AI seats per table (spawned server)")
+    parser.add_argument("--max-hands", type=int, default=20, help="hands per table (spawned server)")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args()
+    
+    target = {"host": args.host, "port": args.port, "unix": args.unix}
+    server = None
+    if args.spawn_server:
+        if args.unix and os.path.exists(args.unix):
+            os.unlink(args.unix)
+        server = multiprocessing.Process(target=_serve, args=(target, args.ai_players, args.max_hands), daemon=True)
+        server.start()
+        _wait_for_server(target)
+    
+    try:
+        summary = run_load_test(args.clients, args.processes, target, args.ramp)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join()
+    
+    print(json.dumps(summary, indent=2) if args.json else format_report(summary))
+
+
+if __name__ == "__main__":
+    main()
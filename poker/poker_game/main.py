@@ -1,13 +1,16 @@
 """
 Main entry point for the poker game with enhanced visuals.
 """
+import argparse
 import os
-from .game import PokerGame
+from . import instrumentation
 from .visuals import PokerArt, Colors
 
 
-def main():
-    """Main function to start the poker game."""
+def run_game():
+    """Run an interactive poker session."""
+    from .game import PokerGame
+    
     try:
         # Clear screen
         os.system('clear' if os.name == 'posix' else 'cls')
@@ -67,5 +70,40 @@ def main():
         print(f"{Colors.MAGENTA}Thanks for playing! 👋{Colors.RESET}")
 
 
+def main():
+    """Main function to start the poker game."""
+    parser = argparse.ArgumentParser(description="Play Texas Hold'em poker in your terminal.")
+    parser.add_argument("--profile", nargs="?", const="poker.prof", metavar="PATH",
+                        help="profile the session with cProfile and write the stats to PATH (default: poker.prof)")
+    parser.add_argument("--metrics", nargs="?", const="-", metavar="PATH",
+                        help="record engine timings; print a report on exit, or write a Prometheus dump to PATH")
+    args = parser.parse_args()
+    
+    if args.metrics:
+        instrumentation.enable()
+    
+    profiler = None
+    if args.profile:
+        import cProfile
+        
+        profiler = cProfile.Profile()
+        profiler.enable()
+    
+    try:
+        run_game()
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            print(f"{Colors.CYAN}📊 Profile written to {args.profile} (view with: python -m pstats {args.profile}){Colors.RESET}")
+        
+        if args.metrics == "-":
+            print(instrumentation.get_metrics().report())
+        elif args.metrics:
+            with open(args.metrics, "w") as f:
+                f.write(instrumentation.get_metrics().prometheus())
+            print(f"{Colors.CYAN}📊 Metrics written to {args.metrics}{Colors.RESET}")
+
+
 if __name__ == "__main__":
     main()
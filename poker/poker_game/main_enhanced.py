@@ -3,8 +3,8 @@
 Enhanced Beautiful Poker Game - Main Entry Point
 No external dependencies - pure Python beauty!
 """
-import time
 import sys
+from .animation import get_scheduler
 from .game import PokerGame
 from .visuals import PokerArt, Colors, clear_screen_with_effect, print_with_sparkle_effect
 
@@ -35,10 +35,10 @@ def get_enhanced_player_setup():
                 return player_name, num_ai
             else:
                 print(f"{Colors.RED}❌ Please enter a number between 1 and 5{Colors.RESET}")
-                time.sleep(1.5)
+                get_scheduler().pause(1.5)
         except ValueError:
             print(f"{Colors.RED}❌ Please enter a valid number{Colors.RESET}")
-            time.sleep(1.5)
+            get_scheduler().pause(1.5)
 
 def enhanced_welcome_sequence():
     """Display an enhanced welcome sequence."""
@@ -46,7 +46,7 @@ def enhanced_welcome_sequence():
     
     # Animated title
     PokerArt.animated_title()
-    time.sleep(2)
+    get_scheduler().pause(2)
     
     clear_screen_with_effect()
     print(PokerArt.title_banner())
@@ -61,7 +61,7 @@ def enhanced_welcome_sequence():
     
     for msg in welcome_messages:
         print_with_sparkle_effect(msg)
-        time.sleep(1)
+        get_scheduler().pause(1)
     
     print(f"\n{Colors.YELLOW}Press Enter to begin your poker journey...{Colors.RESET}")
     input()
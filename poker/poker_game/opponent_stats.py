@@ -0,0 +1,210 @@
+"""
+Per-opponent statistics gathered from game events.
+
+An ``OpponentModel`` keeps, for every player it has seen, the usual HUD
+numbers:
+
+* VPIP - how often the player voluntarily puts chips in preflop
+* PFR - how often the player raises preflop
+* aggression factor - raises per call after the flop
+* fold to bet - how often the player folds when facing a bet
+* went to showdown - how often a player who sees the flop reaches showdown
+
+Every number is an exponentially decaying rate, so recent hands weigh more,
+each statistic is two floats no matter how many hands are played, and
+reading one is O(1).  The model also forgets the least recently seen players
+beyond ``max_players``, so its memory stays bounded on a busy server.
+
+Call ``watch(game)`` to follow a table; the returned ``TableObserver`` also
+knows who is still in the current hand, which is what ``AIPlayer`` reads
+when it adjusts to its opponents.  Players are keyed by name, so one model
+should only watch tables whose names refer to the same people (the server
+gives every table its own).
+"""
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+if TYPE_CHECKING:
+    from .game import PokerGame
+
+
+class DecayingRate:
+    """A hit rate whose older observations fade by ``decay`` per new observation."""
+    
+    __slots__ = ("hits", "samples")
+    
+    def __init__(self):
+        """Start with no observations."""
+        self.hits = 0.0
+        self.samples = 0.0
+    
+    def observe(self, hit: bool, decay: float) -> None:
+        """Record one opportunity and whether it was taken."""
+        self.hits = self.hits * decay + (1.0 if hit else 0.0)
+        self.samples = self.samples * decay + 1.0
+    
+    def rate(self, default: float = 0.0) -> float:
+        """Return the decayed hit rate, or ``default`` with no observations."""
+        return self.hits / self.samples if self.samples else default
+
+
+class OpponentStats:
+    """Decaying statistics for one player."""
+    
+    __slots__ = ("vpip", "pfr", "fold_to_bet", "showdown", "aggressive", "passive")
+    
+    def __init__(self):
+        """Start with empty statistics."""
+        self.vpip = DecayingRate()
+        self.pfr = DecayingRate()
+        self.fold_to_bet = DecayingRate()
+        self.showdown = DecayingRate()
+        # Post-flop raises and calls, decayed together, for the aggression factor
+        self.aggressive = 0.0
+        self.passive = 0.0
+    
+    @property
+    def hands(self) -> float:
+        """Return the (decayed) number of hands observed."""
+        return self.vpip.samples
+    
+    def aggression_factor(self, default: float = 1.0) -> float:
+        """Return post-flop raises per call (at most one call is assumed when calls have faded)."""
+        if self.aggressive + self.passive < 1e-9:
+            return default
+        return self.aggressive / max(self.passive, 1.0)
+    
+    def summary(self) -> Dict[str, float]:
+        """Return the statistics as a dictionary (rates as fractions)."""
+        return {
+            "hands": round(self.hands, 1),
+            "vpip": round(self.vpip.rate(), 3),
+            "pfr": round(self.pfr.rate(), 3),
+            "aggression": round(self.aggression_factor(), 2),
+            "fold_to_bet": round(self.fold_to_bet.rate(), 3),
+            "showdown": round(self.showdown.rate(), 3),
+        }
+
+
+class OpponentModel:
+    """A bounded store of ``OpponentStats`` keyed by player name."""
+    
+    def __init__(self, decay: float = 0.98, max_players: int = 10000):
+        """
+        Create an empty model.
+        
+        ``decay`` sets the memory of every rate: each new observation scales
+        the old ones by it, so 0.98 is roughly a fifty-observation window.
+        """
+        self.decay = decay
+        self.max_players = max_players
+        self._players: "OrderedDict[str, OpponentStats]" = OrderedDict()
+    
+    def __contains__(self, name: str) -> bool:
+        """Return True if the model has statistics for a player."""
+        return name in self._players
+    
+    def __len__(self) -> int:
+        """Return the number of players being tracked."""
+        return len(self._players)
+    
+    def get(self, name: str) -> OpponentStats:
+        """Return a player's statistics, creating them (and evicting the stalest) if new."""
+        stats = self._players.get(name)
+        if stats is None:
+            stats = self._players[name] = OpponentStats()
+            if len(self._players) > self.max_players:
+                self._players.popitem(last=False)
+        else:
+            self._players.move_to_end(name)
+        return stats
+    
+    def peek(self, name: str) -> Optional[OpponentStats]:
+        """Return a player's statistics without creating or refreshing them."""
+        return self._players.get(name)
+    
+    def watch(self, game: "PokerGame") -> "TableObserver":
+        """Start following a game's events; returns the table's observer."""
+        observer = TableObserver(self)
+        game.add_listener(observer)
+        return observer
+
+
+class TableObserver:
+    """Follows one table's hands and feeds what it sees into an ``OpponentModel``."""
+    
+    def __init__(self, model: OpponentModel):
+        """Create an observer that records into ``model``."""
+        self.model = model
+        self.street = "preflop"
+        self.facing_bet = False
+        self.last_aggressor: Optional[str] = None
+        self.dealt: List[str] = []
+        self.live: List[str] = []
+        self._voluntary: Set[str] = set()
+        self._raised: Set[str] = set()
+        self._saw_flop: Set[str] = set()
+    
+    def live_opponents(self, name: str) -> List[OpponentStats]:
+        """Return the statistics of everyone but ``name`` still in the current hand (reading only)."""
+        found = (self.model.peek(other) for other in self.live if other != name)
+        return [stats for stats in found if stats is not None]
+    
+    def __call__(self, event: str, data: Dict[str, Any]) -> None:
+        """Update the statistics from one game event."""
+        if event == "hand_start":
+            self.street = "preflop"
+            self.facing_bet = True  # the big blind
+            self.last_aggressor = None
+            self.dealt = [player.name for player in data["players"]]
+            self.live = list(self.dealt)
+            self._voluntary.clear()
+            self._raised.clear()
+            self._saw_flop.clear()
+        elif event == "street":
+            self.street = data["street"]
+            self.facing_bet = False
+            if self.street == "flop":
+                self._saw_flop.update(self.live)
+        elif event == "action":
+            self._on_action(data["player"].name, data["action"])
+        elif event == "showdown":
+            reached = {player.name for player in data["strengths"]}
+            decay = self.model.decay
+            for name in self._saw_flop:
+                self.model.get(name).showdown.observe(name in reached, decay)
+        elif event == "hand_end":
+            decay = self.model.decay
+            if not data["showdown"]:
+                for name in self._saw_flop:
+                    self.model.get(name).showdown.observe(False, decay)
+            for name in self.dealt:
+                stats = self.model.get(name)
+                stats.vpip.observe(name in self._voluntary, decay)
+                stats.pfr.observe(name in self._raised, decay)
+    
+    def _on_action(self, name: str, action: str) -> None:
+        """Record one betting action."""
+        stats = self.model.get(name)
+        decay = self.model.decay
+        if self.facing_bet and action in ("fold", "call", "raise"):
+            stats.fold_to_bet.observe(action == "fold", decay)
+        
+        if action == "fold":
+            if name in self.live:
+                self.live.remove(name)
+        elif action == "raise":
+            self.facing_bet = True
+            self.last_aggressor = name
+            if self.street == "preflop":
+                self._voluntary.add(name)
+                self._raised.add(name)
+            else:
+                stats.aggressive = stats.aggressive * decay + 1.0
+                stats.passive *= decay
+        elif action == "call":
+            if self.street == "preflop":
+                self._voluntary.add(name)
+            else:
+                stats.passive = stats.passive * decay + 1.0
+                stats.aggressive *= decay
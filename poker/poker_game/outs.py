@@ -0,0 +1,158 @@
+"""
+Outs and draw probabilities on the flop and turn.
+
+Given hole cards and a three- or four-card board, every unseen card is tried
+as the next card.  The hand's rank and suit masks are built once and each
+candidate card only adds one bit to them before evaluation.  Cards of the
+same rank make the same hand unless they can complete a flush, so a scan of
+the remaining deck needs little more than one evaluation per rank.
+
+Categories are the ``HandRank.numeric_value`` integers used by
+``evaluator``; ``card_outs`` offers the same information in terms of
+``Card`` and ``HandRank`` objects.
+"""
+import math
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Sequence, Tuple
+
+from .evaluator import evaluate_masks, from_cards
+
+if TYPE_CHECKING:
+    from .cards import Card
+    from .hand_evaluator import HandRank
+
+Masks = Tuple[int, int, int, int, Tuple[int, int, int, int]]
+
+
+class DrawOdds(NamedTuple):
+    """What the next cards can make of a hand."""
+    category: int
+    outs: Dict[int, List[int]]
+    next_card: Dict[int, float]
+    by_river: Dict[int, float]
+
+
+def hand_masks(cards: Sequence[int]) -> Masks:
+    """Return the rank multiplicity masks and suit masks of some cards."""
+    seen = pairs = trips = quads = 0
+    suit_masks = [0, 0, 0, 0]
+    for card in cards:
+        seen, pairs, trips, quads = add_rank(seen, pairs, trips, quads, 1 << (card >> 2))
+        suit_masks[card & 3] |= 1 << (card >> 2)
+    return seen, pairs, trips, quads, (suit_masks[0], suit_masks[1], suit_masks[2], suit_masks[3])
+
+
+def add_rank(seen: int, pairs: int, trips: int, quads: int, bit: int) -> Tuple[int, int, int, int]:
+    """Add one rank bit to the multiplicity masks."""
+    if not seen & bit:
+        return seen | bit, pairs, trips, quads
+    if not pairs & bit:
+        return seen, pairs | bit, trips, quads
+    if not trips & bit:
+        return seen, pairs, trips | bit, quads
+    return seen, pairs, trips, quads | bit
+
+
+def _category_with(masks: Masks, card: int) -> int:
+    """Return the hand category after adding one card to some masks."""
+    seen, pairs, trips, quads, suit_masks = masks
+    bit = 1 << (card >> 2)
+    suit = card & 3
+    suits = list(suit_masks)
+    suits[suit] |= bit
+    return evaluate_masks(*add_rank(seen, pairs, trips, quads, bit), suits) >> 20
+
+
+def outs(hole: Sequence[int], board: Sequence[int]) -> Dict[int, List[int]]:
+    """
+    Return the unseen cards that improve the hand, grouped by the category they make.
+    
+    Only cards that raise the hand's category count as outs; a card that
+    makes a better hand of the same category (a higher kicker, say) does not.
+    """
+    if not 3 <= len(board) <= 4:
+        raise ValueError("Outs are defined on the flop and the turn")
+    known = list(hole) + list(board)
+    masks = hand_masks(known)
+    seen, pairs, trips, quads, suit_masks = masks
+    current = evaluate_masks(*masks) >> 20
+    used = set(known)
+    
+    result: Dict[int, List[int]] = {}
+    for rank in range(13):
+        # Away from a four-card suit only the rank matters, so evaluate it once
+        bit = 1 << rank
+        by_rank = evaluate_masks(*add_rank(seen, pairs, trips, quads, bit), suit_masks) >> 20
+        for card in range(rank * 4, rank * 4 + 4):
+            if card in used:
+                continue
+            if suit_masks[card & 3].bit_count() >= 4:
+                category = _category_with(masks, card)
+            else:
+                category = by_rank
+            if category > current:
+                result.setdefault(category, []).append(card)
+    return {category: sorted(cards) for category, cards in sorted(result.items())}
+
+
+def draw_odds(hole: Sequence[int], board: Sequence[int], exact: bool = False) -> DrawOdds:
+    """
+    Return the outs and the chance of finishing with at least each better category.
+    
+    ``next_card`` holds the chance that the very next card reaches a
+    category; ``by_river`` the chance of reaching it by the river.  From the
+    flop, ``by_river`` counts only one-card outs unless ``exact`` is set, in
+    which case all two-card runouts are enumerated so runner-runner draws
+    are included (about a thousand evaluations instead of fifty).
+    """
+    found = outs(hole, board)
+    known = list(hole) + list(board)
+    current = evaluate_masks(*hand_masks(known)) >> 20
+    unseen = 52 - len(known)
+    to_come = 5 - len(board)
+    
+    next_card: Dict[int, float] = {}
+    by_river: Dict[int, float] = {}
+    for category in sorted(found):
+        hits = sum(len(cards) for made, cards in found.items() if made >= category)
+        next_card[category] = hits / unseen
+        by_river[category] = 1.0 - math.comb(unseen - hits, to_come) / math.comb(unseen, to_come)
+    
+    if exact and to_come == 2:
+        by_river = _runouts(known, current)
+    return DrawOdds(current, found, next_card, by_river)
+
+
+def _runouts(known: List[int], current: int) -> Dict[int, float]:
+    """Enumerate turn and river pairs for the chance of reaching each better category."""
+    used = set(known)
+    deck = [card for card in range(52) if card not in used]
+    masks = hand_masks(known)
+    counts = [0] * 11
+    total = 0
+    for i, turn in enumerate(deck):
+        seen, pairs, trips, quads, suit_masks = masks
+        bit = 1 << (turn >> 2)
+        suits = list(suit_masks)
+        suits[turn & 3] |= bit
+        turned: Masks = (*add_rank(seen, pairs, trips, quads, bit), (suits[0], suits[1], suits[2], suits[3]))
+        for river in deck[i + 1:]:
+            counts[_category_with(turned, river)] += 1
+            total += 1
+    
+    by_river: Dict[int, float] = {}
+    reached = 0
+    for category in range(10, current, -1):
+        reached += counts[category]
+        if reached:
+            by_river[category] = reached / total
+    return dict(sorted(by_river.items()))
+
+
+def card_outs(hole_cards: Sequence["Card"], community_cards: Sequence["Card"]) -> Dict["HandRank", List["Card"]]:
+    """Return ``outs`` for ``Card`` objects, keyed by ``HandRank``."""
+    from .evaluator import to_card
+    from .hand_evaluator import HandRank
+    
+    ranks = {rank.numeric_value: rank for rank in HandRank}
+    found = outs(from_cards(hole_cards), from_cards(community_cards))
+    return {ranks[category]: [to_card(card) for card in cards] for category, cards in found.items()}
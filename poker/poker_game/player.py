@@ -1,11 +1,17 @@
 """
 Player classes for the poker game with enhanced visuals.
 """
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
 from .cards import Card
+from .evaluator import from_cards
 from .hand_evaluator import PokerHand
+from .hand_tracker import HandTracker
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from .opponent_stats import TableObserver
 
 
 class Player(ABC):
@@ -26,8 +32,8 @@ class Player(ABC):
     
     def bet(self, amount: int) -> int:
         """Make a bet. Returns the actual amount bet."""
-        if amount > self.chips:
-            # All-in
+        if amount >= self.chips:
+            # All-in, including a bet of exactly the whole stack
             actual_bet = self.chips
             self.all_in = True
         else:
@@ -66,6 +72,20 @@ class Player(ABC):
     def get_raise_amount(self, min_raise: int, max_raise: int) -> int:
         """Get the amount to raise when raising."""
         pass
+    
+    async def decide(self, community_cards: List[Card], current_bet: int, pot_size: int) -> str:
+        """
+        Awaitable version of ``make_decision``.
+        
+        The default runs ``make_decision`` inline; subclasses that wait on
+        people, sockets or heavy computation override this so the event loop
+        can keep serving other tables (and enforce an action clock).
+        """
+        return self.make_decision(community_cards, current_bet, pot_size)
+    
+    async def decide_raise_amount(self, min_raise: int, max_raise: int) -> int:
+        """Awaitable version of ``get_raise_amount``."""
+        return self.get_raise_amount(min_raise, max_raise)
 
 
 class HumanPlayer(Player):
@@ -131,11 +151,71 @@ class HumanPlayer(Player):
                     print(f"{Colors.RED}❌ Amount must be between {min_raise} and {max_raise}{Colors.RESET}")
             except ValueError:
                 print(f"{Colors.RED}❌ Please enter a valid number{Colors.RESET}")
+    
+    async def decide(self, community_cards: List[Card], current_bet: int, pot_size: int) -> str:
+        """
+        Prompt for a decision on a worker thread so the event loop keeps running.
+        
+        If the action clock runs out the prompt is abandoned by the game, but
+        the terminal is still waiting for a line of input.
+        """
+        import asyncio
+        
+        return await asyncio.to_thread(self.make_decision, community_cards, current_bet, pot_size)
+    
+    async def decide_raise_amount(self, min_raise: int, max_raise: int) -> int:
+        """Prompt for a raise amount on a worker thread."""
+        import asyncio
+        
+        return await asyncio.to_thread(self.get_raise_amount, min_raise, max_raise)
 
 
 class AIPlayer(Player):
     """Simple AI player with basic strategy."""
     
+    def __init__(self, name: str, chips: int = 1000, executor: Optional["Executor"] = None,
+                 opponents: Optional["TableObserver"] = None):
+        """
+        Initialize an AI player.
+        
+        When an ``executor`` is given, awaitable decisions are computed on it
+        instead of on the event loop.  Process pools receive a pickled copy
+        of the player, so decisions must not rely on mutating it.
+        
+        With ``opponents`` (see ``OpponentModel.watch``) the AI bets more
+        into players who fold too often and calls wider against aggressive
+        bettors and tighter against passive ones.
+        """
+        super().__init__(name, chips)
+        self.executor = executor
+        self.opponents = opponents
+        self.tracker = HandTracker()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the executor or opponent model so decisions can run in a process pool."""
+        state = self.__dict__.copy()
+        state["executor"] = None
+        state["opponents"] = None
+        return state
+    
+    async def decide(self, community_cards: List[Card], current_bet: int, pot_size: int) -> str:
+        """Make a decision, offloading it to the executor if one is configured."""
+        if self.executor is None:
+            return self.make_decision(community_cards, current_bet, pot_size)
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.make_decision, list(community_cards), current_bet, pot_size)
+    
+    async def decide_raise_amount(self, min_raise: int, max_raise: int) -> int:
+        """Choose a raise amount, offloading it to the executor if one is configured."""
+        if self.executor is None:
+            return self.get_raise_amount(min_raise, max_raise)
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.get_raise_amount, min_raise, max_raise)
+    
     def make_decision(self, community_cards: List[Card], current_bet: int, pot_size: int) -> str:
         """Make decision based on simple AI logic."""
         import random
@@ -143,58 +223,105 @@ class AIPlayer(Player):
         # Get hand strength (simplified)
         hand_strength = self._evaluate_hand_strength(community_cards)
         call_amount = current_bet - self.current_bet
+        bet_frequency, call_threshold = self._read_opponents()
+        return self.choose_action(hand_strength, call_amount, bet_frequency, call_threshold, random)
+    
+    @staticmethod
+    def choose_action(hand_strength: float, call_amount: int, bet_frequency: float = 0.3,
+                      call_threshold: float = 0.4, rng: Any = None) -> str:
+        """
+        Choose an action from a hand strength and the amount to call.
+        
+        This is the AI's whole betting rule; ``batch_policy.decide`` is the
+        same rule for arrays of seats.  ``rng`` supplies ``random()`` (the
+        ``random`` module by default).
+        """
+        if rng is None:
+            import random as rng
         
         # Very weak hands - fold if there's a bet
-        if hand_strength < 0.3 and call_amount > 0:
+        if hand_strength < min(0.3, call_threshold) and call_amount > 0:
             return 'fold'
         
         # Strong hands - raise
         if hand_strength > 0.7:
-            if random.random() < 0.6:  # 60% chance to raise with strong hand
+            if rng.random() < 0.6:  # 60% chance to raise with strong hand
                 return 'raise'
         
         # Medium hands or conservative play
         if call_amount == 0:
-            if random.random() < 0.3:  # 30% chance to bet with medium hand
+            if rng.random() < bet_frequency:  # 30% chance to bet with medium hand by default
                 return 'raise'
             else:
                 return 'check'
         else:
-            if hand_strength > 0.4:
+            if hand_strength > call_threshold:
                 return 'call'
             else:
                 return 'fold'
     
+    def _read_opponents(self) -> Tuple[float, float]:
+        """Return the betting frequency and calling threshold adjusted for the opponents in the hand."""
+        bet_frequency, call_threshold = 0.3, 0.4
+        if self.opponents is None:
+            return bet_frequency, call_threshold
+        
+        # Bet more into players who give up to bets, less into calling stations
+        folds = [stats.fold_to_bet.rate() for stats in self.opponents.live_opponents(self.name)
+                 if stats.fold_to_bet.samples >= 10]
+        if folds:
+            bet_frequency = min(0.6, max(0.1, 0.3 + (sum(folds) / len(folds) - 0.5) * 0.6))
+        
+        # Call wider against maniacs and tighter against players who only bet real hands
+        aggressor = self.opponents.last_aggressor
+        stats = self.opponents.model.peek(aggressor) if aggressor and aggressor != self.name else None
+        if stats is not None and stats.aggressive + stats.passive >= 10:
+            factor = stats.aggression_factor()
+            if factor > 2.0:
+                call_threshold = 0.3
+            elif factor < 0.5:
+                call_threshold = 0.5
+        return bet_frequency, call_threshold
+    
     def get_raise_amount(self, min_raise: int, max_raise: int) -> int:
         """Get raise amount for AI."""
         import random
         
+        return self.choose_raise(min_raise, max_raise, random)
+    
+    @staticmethod
+    def choose_raise(min_raise: int, max_raise: int, rng: Any = None) -> int:
+        """Choose a raise amount; ``rng`` supplies ``random()`` and ``randint()``."""
+        if rng is None:
+            import random as rng
+        
         # Prefer smaller raises
         if min_raise == max_raise:
             return min_raise
         
         range_size = max_raise - min_raise
         # 70% chance for smaller raise, 30% for larger
-        if random.random() < 0.7:
-            return min_raise + random.randint(0, range_size // 3)
+        if rng.random() < 0.7:
+            return min_raise + rng.randint(0, range_size // 3)
         else:
-            return min_raise + random.randint(range_size // 3, range_size)
+            return min_raise + rng.randint(range_size // 3, range_size)
     
     def _evaluate_hand_strength(self, community_cards: List[Card]) -> float:
-        """Evaluate hand strength on a scale of 0-1."""
-        if len(community_cards) < 5:
-            # Pre-flop or early streets - simplified evaluation
+        """
+        Evaluate hand strength on a scale of 0-1.
+        
+        After the flop this is the hand tracker's estimate (see
+        ``HandTracker.strength_estimate``); the tracker only folds in board
+        cards it has not seen yet.
+        """
+        if len(community_cards) < 3:
             return self._evaluate_preflop_strength()
         
-        # Post-flop evaluation
-        try:
-            hand = self.get_hand(community_cards)
-            rank_value = hand.best_hand[0].numeric_value
-            
-            # Normalize hand rank to 0-1 scale
-            return min(rank_value / 10.0, 1.0)
-        except:
-            return 0.3  # Default to medium strength if evaluation fails
+        hole = from_cards(self.hole_cards)
+        if hole != self.tracker.hole:
+            self.tracker.reset(hole)
+        self.tracker.update(from_cards(community_cards))
+        return self.tracker.strength_estimate()
     
     def _evaluate_preflop_strength(self) -> float:
         """Evaluate preflop hand strength."""
@@ -0,0 +1,64 @@
+"""
+Line-delimited JSON protocol shared by the poker server and its clients.
+
+Every message is one JSON object on its own line with a ``type`` field.
+Cards are sent as two-character codes such as ``"Ah"`` or ``"Td"``.
+
+Client to server:
+    join     {"name": str}                     - take a seat
+    action   {"id", "action": str, "amount": int?} - answer an ``act`` request
+    amount   {"id", "amount": int}                 - answer a ``raise`` request
+
+Replies echo the ``id`` of the request they answer; replies that arrive
+after the action clock expired are discarded.
+
+Server to client:
+    welcome     {"table", "seat", "players"}
+    hand_start  {"hand", "dealer", "chips"}
+    blind       {"player", "amount"}
+    hole_cards  {"cards"}                      - sent only to the card owner
+    street      {"street", "board"}
+    act         {"id", "options", "to_call", "current_bet", "pot", "chips",
+                 "hole_cards", "board"}
+    raise       {"id", "min", "max"}
+    action      {"player", "action", "amount", "pot"}
+    timeout     {"player", "action"}           - the action clock ran out
+    showdown    {"hands": {name: {"cards", "hand"}}}
+    hand_end    {"winners", "chips"}
+    error       {"message"}
+    game_over   {"chips", "hands"}
+"""
+import json
+from typing import Any, Dict, Iterable, List
+
+from .cards import Card
+
+
+class ProtocolError(ValueError):
+    """Raised when a peer sends a malformed message."""
+
+
+def encode(message: Dict[str, Any]) -> bytes:
+    """Encode a message as a single newline-terminated JSON line."""
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def decode(line: bytes) -> Dict[str, Any]:
+    """Decode a single JSON line into a message dictionary."""
+    try:
+        message = json.loads(line)
+    except ValueError as e:
+        raise ProtocolError(f"Invalid JSON: {e}") from e
+    if not isinstance(message, dict) or not isinstance(message.get("type"), str):
+        raise ProtocolError("Messages must be JSON objects with a 'type' field")
+    return message
+
+
+def cards_to_codes(cards: Iterable[Card]) -> List[str]:
+    """Convert cards to their protocol codes."""
+    return [card.code() for card in cards]
+
+
+def codes_to_cards(codes: Iterable[str]) -> List[Card]:
+    """Convert protocol codes back into cards."""
+    return [Card.from_code(code) for code in codes]
@@ -0,0 +1,428 @@
+"""
+Asyncio poker server hosting many tables in a single process.
+
+Clients connect over TCP or a Unix socket and speak the line-delimited JSON
+protocol described in ``protocol.py``.  Each client is seated as a
+``NetworkPlayer`` alongside in-process AI players, and every table runs as
+its own task on the event loop, so one process can serve hundreds of tables.
+"""
+import argparse
+import asyncio
+import itertools
+import logging
+from typing import Any, Dict, List, Optional, Set
+
+from .cards import Card
+from .evaluator import hand_name
+from .game import ActionClock, PokerGame
+from .opponent_stats import OpponentModel
+from .player import AIPlayer, Player
+from .protocol import ProtocolError, cards_to_codes, decode, encode
+
+logger = logging.getLogger(__name__)
+
+
+class Connection:
+    """A client connection speaking the line-delimited JSON protocol."""
+    
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Wrap an asyncio stream pair."""
+        self.reader = reader
+        self.writer = writer
+        self.closed = False
+    
+    def send(self, message: Dict[str, Any]) -> None:
+        """Queue a message for sending; call ``flush`` to push it out."""
+        if self.closed or self.writer.is_closing():
+            self.closed = True
+            return
+        self.writer.write(encode(message))
+    
+    async def flush(self) -> None:
+        """Wait until queued messages have been handed to the OS."""
+        if self.closed:
+            return
+        try:
+            await self.writer.drain()
+        except ConnectionError:
+            self.closed = True
+    
+    async def receive(self) -> Optional[Dict[str, Any]]:
+        """Read the next message, or return None once the client has gone (bad lines raise ``ProtocolError``)."""
+        if self.closed:
+            return None
+        try:
+            line = await self.reader.readline()
+        except ConnectionError:
+            line = b""
+        except ValueError as e:
+            # A line over the stream limit; only this connection's message is lost
+            raise ProtocolError("Message too long") from e
+        if not line:
+            self.closed = True
+            return None
+        return decode(line)
+    
+    async def close(self) -> None:
+        """Close the connection."""
+        self.closed = True
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+class NetworkPlayer(Player):
+    """A player whose decisions are made by a remote client."""
+    
+    def __init__(self, name: str, connection: Connection, chips: int = 1000):
+        """Initialize a network player bound to a client connection."""
+        super().__init__(name, chips)
+        self.connection = connection
+        self._pending_raise: Optional[int] = None
+        self._request_ids = itertools.count(1)
+    
+    @property
+    def connected(self) -> bool:
+        """Return True while the client is still connected."""
+        return not self.connection.closed
+    
+    def make_decision(self, community_cards: List[Card], current_bet: int, pot_size: int) -> str:
+        """Network players can only be asked asynchronously."""
+        raise RuntimeError("NetworkPlayer decisions must be awaited with decide()")
+    
+    def get_raise_amount(self, min_raise: int, max_raise: int) -> int:
+        """Network players can only be asked asynchronously."""
+        raise RuntimeError("NetworkPlayer raise amounts must be awaited with decide_raise_amount()")
+    
+    async def decide(self, community_cards: List[Card], current_bet: int, pot_size: int) -> str:
+        """Ask the client for a decision; disconnected clients check or fold."""
+        call_amount = current_bet - self.current_bet
+        if call_amount > 0:
+            valid_actions = ["fold", "call", "raise"]
+        else:
+            valid_actions = ["check", "raise"]
+        fallback = "check" if call_amount <= 0 else "fold"
+        self._pending_raise = None
+        request_id = next(self._request_ids)
+        
+        self.connection.send({
+            "type": "act",
+            "id": request_id,
+            "options": valid_actions,
+            "to_call": call_amount,
+            "current_bet": current_bet,
+            "pot": pot_size,
+            "chips": self.chips,
+            "hole_cards": cards_to_codes(self.hole_cards),
+            "board": cards_to_codes(community_cards),
+        })
+        await self.connection.flush()
+        
+        while True:
+            message = await self._receive(request_id)
+            if message is None:
+                return fallback
+            action = message.get("action")
+            if message["type"] == "action" and action in valid_actions:
+                amount = message.get("amount")
+                self._pending_raise = amount if isinstance(amount, int) else None
+                return action
+            self.connection.send({"type": "error", "message": f"Expected one of {valid_actions}"})
+            await self.connection.flush()
+    
+    async def decide_raise_amount(self, min_raise: int, max_raise: int) -> int:
+        """Ask the client how much to raise, reusing an amount sent with the action."""
+        if self._pending_raise is not None:
+            amount, self._pending_raise = self._pending_raise, None
+            return max(min_raise, min(amount, max_raise))
+        
+        request_id = next(self._request_ids)
+        self.connection.send({"type": "raise", "id": request_id, "min": min_raise, "max": max_raise})
+        await self.connection.flush()
+        
+        while True:
+            message = await self._receive(request_id)
+            if message is None:
+                return min_raise
+            amount = message.get("amount")
+            if message["type"] == "amount" and isinstance(amount, int) and min_raise <= amount <= max_raise:
+                return amount
+            self.connection.send({"type": "error", "message": f"Amount must be between {min_raise} and {max_raise}"})
+            await self.connection.flush()
+    
+    async def _receive(self, request_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Receive the reply to a request, reporting malformed input and
+        discarding late replies to requests that already timed out.
+        """
+        while True:
+            try:
+                message = await self.connection.receive()
+            except ProtocolError as e:
+                self.connection.send({"type": "error", "message": str(e)})
+                await self.connection.flush()
+                continue
+            if message is not None and message.get("id", request_id) != request_id:
+                continue
+            return message
+
+
+class Table:
+    """One poker table whose network seats are driven by the event loop."""
+    
+    def __init__(self, table_id: int, players: List[Player], max_hands: Optional[int] = None,
+                 action_clock: Optional[ActionClock] = None):
+        """Create a table for the given seats."""
+        self.table_id = table_id
+        self.seats = list(players)
+        self.max_hands = max_hands
+        self.action_clock = action_clock
+        self.hands_played = 0
+        self.finished = asyncio.Event()
+        self.game = PokerGame(players=players, verbose=False)
+        self.game.add_listener(self._broadcast)
+    
+    @property
+    def network_players(self) -> List[NetworkPlayer]:
+        """Return the network players seated at the table."""
+        return [p for p in self.seats if isinstance(p, NetworkPlayer)]
+    
+    def should_continue(self) -> bool:
+        """Return True while the table still has a hand worth dealing."""
+        if self.max_hands is not None and self.hands_played >= self.max_hands:
+            return False
+        if len(self.game.players) < 2:
+            return False
+        return any(isinstance(p, NetworkPlayer) and p.connected for p in self.game.players)
+    
+    async def run(self) -> None:
+        """Play hands until the table breaks up, then notify the clients."""
+        try:
+            names = [p.name for p in self.seats]
+            for seat, player in enumerate(self.seats):
+                if isinstance(player, NetworkPlayer):
+                    player.connection.send({"type": "welcome", "table": self.table_id, "seat": seat, "players": names})
+            
+            while self.should_continue():
+                await self.play_hand()
+                self.game.advance_to_next_hand()
+            
+            for player in self.network_players:
+                player.connection.send({"type": "game_over", "chips": player.chips, "hands": self.hands_played})
+                await player.connection.flush()
+        except Exception:
+            logger.exception("Table %s crashed", self.table_id)
+        finally:
+            self.finished.set()
+    
+    async def play_hand(self) -> None:
+        """Play one hand, awaiting network players and resolving AIs in-process."""
+        await self.game.play_hand_async(self.action_clock)
+        self.hands_played += 1
+        for player in self.network_players:
+            await player.connection.flush()
+    
+    def _broadcast(self, event: str, data: Dict[str, Any]) -> None:
+        """Forward a game event to the connected network players."""
+        if event == "hole_cards":
+            player = data["player"]
+            if isinstance(player, NetworkPlayer):
+                player.connection.send({"type": "hole_cards", "cards": cards_to_codes(data["cards"])})
+            return
+        
+        if event == "hand_start":
+            message = {
+                "type": "hand_start",
+                "hand": self.hands_played + 1,
+                "dealer": data["dealer"].name,
+                "chips": {p.name: p.chips for p in data["players"]},
+            }
+        elif event == "blind":
+            message = {"type": "blind", "player": data["player"].name, "amount": data["amount"]}
+        elif event == "street":
+            message = {"type": "street", "street": data["street"], "board": cards_to_codes(data["community_cards"])}
+        elif event == "action":
+            message = {
+                "type": "action",
+                "player": data["player"].name,
+                "action": data["action"],
+                "amount": data["amount"],
+                "pot": data["pot"],
+            }
+        elif event == "timeout":
+            message = {"type": "timeout", "player": data["player"].name, "action": data["action"]}
+        elif event == "showdown":
+            message = {
+                "type": "showdown",
+                "hands": {p.name: {"cards": cards_to_codes(p.hole_cards), "hand": hand_name(strength)}
+                          for p, strength in data["strengths"].items()},
+            }
+        elif event == "hand_end":
+            message = {
+                "type": "hand_end",
+                "winners": {p.name: amount for p, amount in data["winners"].items()},
+                "chips": {p.name: p.chips for p in self.game.active_players},
+            }
+        else:
+            return
+        
+        for player in self.network_players:
+            player.connection.send(message)
+
+
+class PokerServer:
+    """Hosts many concurrent tables of network and AI players."""
+    
+    def __init__(self, ai_players: int = 3, humans_per_table: int = 1,
+                 starting_chips: int = 1000, max_hands: Optional[int] = None,
+                 action_timeout: Optional[float] = None, time_bank: float = 0.0):
+        """
+        Configure how each table is seated.
+        
+        ``action_timeout`` (seconds) starts an action clock at every table;
+        players who run out of time, including their ``time_bank``,
+        automatically check or fold.
+        """
+        if humans_per_table < 1:
+            raise ValueError("A table needs at least one network player")
+        if humans_per_table + ai_players < 2:
+            raise ValueError("A table needs at least two players")
+        self.ai_players = ai_players
+        self.humans_per_table = humans_per_table
+        self.starting_chips = starting_chips
+        self.max_hands = max_hands
+        self.action_timeout = action_timeout
+        self.time_bank = time_bank
+        self.tables: Dict[int, Table] = {}
+        self._table_ids = itertools.count(1)
+        self._lobby: List[NetworkPlayer] = []
+        self._lobby_table: Optional["asyncio.Future[Table]"] = None
+        self._servers: List[asyncio.AbstractServer] = []
+        self._tasks: Set["asyncio.Task[None]"] = set()
+    
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 8765, backlog: int = 1024) -> asyncio.AbstractServer:
+        """Start listening for clients on a TCP port."""
+        server = await asyncio.start_server(self._handle_client, host, port, limit=2 ** 16, backlog=backlog)
+        self._servers.append(server)
+        return server
+    
+    async def start_unix(self, path: str, backlog: int = 1024) -> asyncio.AbstractServer:
+        """Start listening for clients on a Unix domain socket."""
+        server = await asyncio.start_unix_server(self._handle_client, path, limit=2 ** 16, backlog=backlog)
+        self._servers.append(server)
+        return server
+    
+    async def serve_forever(self) -> None:
+        """Serve clients until cancelled."""
+        await asyncio.gather(*(server.serve_forever() for server in self._servers))
+    
+    async def close(self) -> None:
+        """Stop accepting clients and wait for the listeners to shut down."""
+        for server in self._servers:
+            server.close()
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers.clear()
+    
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Seat a newly connected client and keep it until its table finishes."""
+        connection = Connection(reader, writer)
+        try:
+            hello = await connection.receive()
+        except ProtocolError:
+            hello = None
+        
+        if not hello or hello["type"] != "join":
+            connection.send({"type": "error", "message": "Expected a join message"})
+            await connection.flush()
+            await connection.close()
+            return
+        
+        name = str(hello.get("name") or "Player")
+        player = NetworkPlayer(name, connection, self.starting_chips)
+        table = await self._seat(player)
+        await table.finished.wait()
+        await connection.close()
+    
+    def _seat(self, player: NetworkPlayer) -> "asyncio.Future[Table]":
+        """Add a player to the lobby, opening a table once it is full."""
+        if self._lobby_table is None:
+            self._lobby_table = asyncio.get_running_loop().create_future()
+        future = self._lobby_table
+        self._lobby.append(player)
+        
+        if len(self._lobby) >= self.humans_per_table:
+            future.set_result(self._open_table(self._lobby))
+            self._lobby = []
+            self._lobby_table = None
+        return future
+    
+    def _open_table(self, humans: List[NetworkPlayer]) -> Table:
+        """Create a table for the given humans and start it on the event loop."""
+        table_id = next(self._table_ids)
+        players: List[Player] = []
+        names: Set[str] = set()
+        for human in humans:
+            if human.name in names:
+                human.name = f"{human.name} ({len(players) + 1})"
+            names.add(human.name)
+            players.append(human)
+        for i in range(self.ai_players):
+            players.append(AIPlayer(f"AI {i+1}", self.starting_chips))
+        
+        clock = ActionClock(self.action_timeout, self.time_bank) if self.action_timeout is not None else None
+        table = Table(table_id, players, self.max_hands, clock)
+        # Each table gets its own model: player names are only unique within a
+        # table, so a shared model would merge unrelated players' statistics
+        observer = OpponentModel().watch(table.game)
+        for player in players:
+            if isinstance(player, AIPlayer):
+                player.opponents = observer
+        self.tables[table_id] = table
+        task = asyncio.create_task(table.run())
+        self._tasks.add(task)
+        task.add_done_callback(lambda t: self._close_table(table_id, t))
+        return table
+    
+    def _close_table(self, table_id: int, task: "asyncio.Task[None]") -> None:
+        """Forget a table once its task has finished."""
+        self._tasks.discard(task)
+        self.tables.pop(table_id, None)
+
+
+async def serve(server: PokerServer, host: str, port: int, unix_path: Optional[str] = None) -> None:
+    """Start the server on TCP (and optionally a Unix socket) and run forever."""
+    if unix_path:
+        await server.start_unix(unix_path)
+    else:
+        await server.start_tcp(host, port)
+    await server.serve_forever()
+
+
+def main() -> None:
+    """Run the poker server from the command line."""
+    parser = argparse.ArgumentParser(description="Host many poker tables over a line-delimited JSON protocol.")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on")
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--ai-players", type=int, default=3, help="AI seats per table")
+    parser.add_argument("--humans-per-table", type=int, default=1, help="network seats per table")
+    parser.add_argument("--chips", type=int, default=1000, help="starting chips per player")
+    parser.add_argument("--max-hands", type=int, help="close each table after this many hands")
+    parser.add_argument("--action-timeout", type=float, help="seconds per action before auto check/fold")
+    parser.add_argument("--time-bank", type=float, default=0.0, help="extra seconds per player per table")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO)
+    server = PokerServer(args.ai_players, args.humans_per_table, args.chips, args.max_hands,
+                         args.action_timeout, args.time_bank)
+    try:
+        asyncio.run(serve(server, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,486 @@
+"""
+Counterfactual regret minimisation for a reduced heads-up game.
+
+The solver plays a small abstraction of heads-up no-limit hold'em:
+
+* both players start every hand with ``stack`` chips and post the blinds;
+  the small blind acts first on every street, as in ``PokerGame``, where
+  the dealer posts the big blind heads-up and each street starts left of
+  the dealer;
+* hands are replaced by strength buckets on every street - preflop by the
+  starting hand's standing against a random hand, afterwards by
+  ``HandTracker.strength_estimate`` - so a player only knows its bucket;
+* the only bets are ``raise_sizes`` fractions of the pot (capped by the
+  stack, so large bets become all-ins), with at most ``max_raises`` raises
+  per street.
+
+An information set is (position, street, bucket, raises this street, facing
+a bet), and the regret and strategy sums for all of them live in two NumPy
+arrays of shape ``SolverConfig.shape``.  Training uses external-sampling
+Monte Carlo CFR: every iteration deals one hand and, for each player in
+turn, explores all of that player's actions while sampling the opponent's.
+
+``CFRSolver.train`` runs iterations in worker processes.  Each worker starts
+from the current regrets, runs a batch of iterations and sends back what it
+added; the parent sums the batches and writes a checkpoint every so often
+(``np.savez``, replaced atomically) so long runs can be resumed.
+
+``Policy`` is the normalised average strategy read from a checkpoint and
+``CFRPlayer`` is a ``Player`` that acts on one::
+    
+    python -m poker_game.solver --iterations 200000 --processes 8
+
+NumPy is an optional dependency: install ``poker-game[solver]``.
+"""
+import argparse
+import json
+import os
+import random
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError("The CFR solver needs NumPy: install poker-game[solver]") from e
+
+from .cards import Card
+from .distribution import percentile
+from .equity import PREFLOP_EQUITY, preflop_class
+from .evaluator import evaluate, from_cards
+from .hand_tracker import HandTracker
+from .player import Player
+from .tables import LazyTable, cache_dir
+
+if TYPE_CHECKING:
+    from .game import PokerGame
+
+FOLD, CALL = 0, 1
+STREETS = ("preflop", "flop", "turn", "river")
+
+
+class SolverConfig(NamedTuple):
+    """The abstraction the solver plays."""
+    stack: int = 1000
+    small_blind: int = 10
+    big_blind: int = 20
+    buckets: int = 8
+    raise_sizes: Tuple[float, ...] = (0.5, 1.0)
+    max_raises: int = 2
+    
+    @property
+    def actions(self) -> int:
+        """Return the number of action slots: fold, check/call and one per raise size."""
+        return 2 + len(self.raise_sizes)
+    
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Return the shape of the regret and strategy tables."""
+        return (2, len(STREETS), self.buckets, self.max_raises + 1, 2, self.actions)
+
+
+def default_checkpoint() -> str:
+    """Return the default checkpoint file, next to the cached tables."""
+    return os.path.join(cache_dir(), "cfr_policy.npz")
+
+
+def _build_preflop_standing() -> Dict[str, float]:
+    """Map every starting-hand class to the share of the 1326 starting hands it out-equities."""
+    equities = PREFLOP_EQUITY.get()
+    combos = {name: 6 if len(name) == 2 else 4 if name[2] == "s" else 12 for name in equities}
+    standing = {}
+    below = 0
+    for name in sorted(equities, key=equities.__getitem__):
+        standing[name] = (below + combos[name] / 2) / 1326
+        below += combos[name]
+    return standing
+
+
+PREFLOP_STANDING = LazyTable("preflop_standing", _build_preflop_standing)
+
+
+def hand_strength(hole: Sequence[int], board: Sequence[int], tracker: Optional[HandTracker] = None) -> float:
+    """Return the 0-1 strength the solver buckets: preflop standing, then the tracker's estimate."""
+    if len(board) < 3:
+        return PREFLOP_STANDING.get()[preflop_class((hole[0], hole[1]))]
+    tracker = tracker or HandTracker()
+    if tracker.hole != list(hole) or tracker.board != list(board[:len(tracker.board)]):
+        tracker.reset(hole)
+    tracker.update(board)
+    return tracker.strength_estimate()
+
+
+def hand_bucket(hole: Sequence[int], board: Sequence[int], buckets: int,
+                tracker: Optional[HandTracker] = None) -> int:
+    """Return a hand's bucket on the current street."""
+    return min(buckets - 1, int(hand_strength(hole, board, tracker) * buckets))
+
+
+def _raise_targets(config: SolverConfig, committed: Sequence[int], actor: int, raises: int) -> List[Tuple[int, int]]:
+    """Return (action, total committed) for each distinct legal raise."""
+    other = committed[1 - actor]
+    if raises >= config.max_raises or other >= config.stack:
+        return []
+    to_call = other - committed[actor]
+    pot = committed[0] + committed[1]
+    targets = []
+    seen = set()
+    for i, fraction in enumerate(config.raise_sizes):
+        amount = max(config.big_blind, int(round(fraction * (pot + to_call))))
+        target = min(config.stack, other + amount)
+        if target not in seen:
+            seen.add(target)
+            targets.append((2 + i, target))
+    return targets
+
+
+def _regret_matching(regrets: List[float], offset: int, actions: Sequence[int]) -> List[float]:
+    """Return the current strategy over some legal actions from their positive regrets."""
+    positive = [max(regrets[offset + action], 0.0) for action in actions]
+    total = sum(positive)
+    if total > 0:
+        return [value / total for value in positive]
+    return [1.0 / len(actions)] * len(actions)
+
+
+class _Trainer:
+    """Runs external-sampling MCCFR iterations on flat Python copies of the tables."""
+    
+    def __init__(self, config: SolverConfig, regrets: List[float], rng: random.Random):
+        """Start from a flat copy of the regret table."""
+        self.config = config
+        self.regrets = regrets
+        self.strategy = [0.0] * len(regrets)
+        self.rng = rng
+        self.tracker = HandTracker()
+        _, streets, buckets, raises, facing, actions = config.shape
+        self.strides = (streets * buckets * raises * facing * actions, buckets * raises * facing * actions,
+                        raises * facing * actions, facing * actions, actions)
+        self.buckets: List[List[int]] = [[], []]
+        self.winner = -1
+    
+    def iterate(self) -> None:
+        """Deal one hand and update both players' regrets."""
+        cards = self.rng.sample(range(52), 9)
+        holes = (cards[0:2], cards[2:4])
+        board = cards[4:]
+        for player, hole in enumerate(holes):
+            self.buckets[player] = [
+                hand_bucket(hole, board[:count], self.config.buckets, self.tracker) for count in (0, 3, 4, 5)
+            ]
+        first, second = (evaluate(hole + board) for hole in holes)
+        self.winner = 0 if first > second else 1 if second > first else -1
+        
+        start = [self.config.small_blind, self.config.big_blind]
+        for traverser in (0, 1):
+            self._walk(traverser, 0, start, 0, 0, 0)
+    
+    def _walk(self, traverser: int, street: int, committed: List[int], actor: int, raises: int, acted: int) -> float:
+        """Return the traverser's expected winnings from a decision point."""
+        other = 1 - actor
+        facing = 1 if committed[other] > committed[actor] else 0
+        strides = self.strides
+        offset = (actor * strides[0] + street * strides[1] + self.buckets[actor][street] * strides[2]
+                  + raises * strides[3] + facing * strides[4])
+        
+        moves = [(FOLD, 0)] if facing else []
+        moves.append((CALL, committed[other]))
+        moves.extend(_raise_targets(self.config, committed, actor, raises))
+        strategy = _regret_matching(self.regrets, offset, [action for action, _ in moves])
+        
+        if actor != traverser:
+            for probability, (action, _) in zip(strategy, moves):
+                self.strategy[offset + action] += probability
+            pick = self.rng.random()
+            for probability, move in zip(strategy, moves):
+                pick -= probability
+                if pick <= 0:
+                    break
+            return self._play(traverser, street, committed, actor, raises, acted, move)
+        
+        values = [self._play(traverser, street, committed, actor, raises, acted, move) for move in moves]
+        expected = sum(p * value for p, value in zip(strategy, values))
+        for (action, _), value in zip(moves, values):
+            self.regrets[offset + action] += value - expected
+        return expected
+    
+    def _play(self, traverser: int, street: int, committed: List[int], actor: int, raises: int, acted: int,
+              move: Tuple[int, int]) -> float:
+        """Return the traverser's expected winnings after one action."""
+        action, target = move
+        if action == FOLD:
+            return -committed[actor] if actor == traverser else committed[actor]
+        
+        after = list(committed)
+        after[actor] = target
+        if action != CALL:
+            return self._walk(traverser, street, after, 1 - actor, raises + 1, acted + 1)
+        if not acted:
+            # The small blind completing preflop or a first check: the other player still acts
+            return self._walk(traverser, street, after, 1 - actor, raises, acted + 1)
+        if street == len(STREETS) - 1 or target >= self.config.stack:
+            if self.winner < 0:
+                return 0.0
+            return target if self.winner == traverser else -target
+        return self._walk(traverser, street + 1, after, 0, 0, 0)
+
+
+def _run_iterations(config: SolverConfig, regrets: "np.ndarray", iterations: int, seed: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Worker entry point: run a batch of iterations and return the regret and strategy increments."""
+    start = regrets.ravel().tolist()
+    trainer = _Trainer(config, list(start), random.Random(seed))
+    for _ in range(iterations):
+        trainer.iterate()
+    delta = np.array(trainer.regrets) - np.array(start)
+    return delta.reshape(config.shape), np.array(trainer.strategy).reshape(config.shape)
+
+
+def _warm() -> None:
+    """Load the strength tables, building and caching them if needed."""
+    PREFLOP_STANDING.get()
+    percentile(0)
+
+
+class CFRSolver:
+    """Regret and average-strategy tables for a ``SolverConfig``, with training and checkpoints."""
+    
+    def __init__(self, config: Optional[SolverConfig] = None):
+        """Start an untrained solver."""
+        self.config = config or SolverConfig()
+        self.regrets = np.zeros(self.config.shape)
+        self.strategy_sums = np.zeros(self.config.shape)
+        self.iterations = 0
+    
+    def train(self, iterations: int, processes: int = 1, batch: int = 1000, seed: Optional[int] = None,
+              checkpoint: Optional[str] = None, checkpoint_every: int = 50000, verbose: bool = False) -> None:
+        """
+        Run ``iterations`` more iterations.
+        
+        Each round gives every process a batch of iterations from the same
+        regrets; with ``checkpoint`` the tables are saved whenever another
+        ``checkpoint_every`` iterations are done, and at the end.
+        """
+        rng = random.Random(seed)
+        pool = None
+        if processes > 1:
+            import multiprocessing
+            
+            # Build the tables here first: forked workers inherit them and
+            # spawned ones read the cache, so no worker has to build them
+            _warm()
+            pool = multiprocessing.Pool(processes)
+        try:
+            started = time.perf_counter()
+            last_saved = self.iterations
+            remaining = iterations
+            while remaining > 0:
+                sizes = []
+                for _ in range(processes):
+                    size = min(batch, remaining)
+                    if size:
+                        sizes.append(size)
+                        remaining -= size
+                jobs = [(self.config, self.regrets, size, rng.getrandbits(32)) for size in sizes]
+                results = pool.starmap(_run_iterations, jobs) if pool else [_run_iterations(*job) for job in jobs]
+                for regrets, strategy in results:
+                    self.regrets += regrets
+                    self.strategy_sums += strategy
+                self.iterations += sum(sizes)
+                
+                if verbose:
+                    rate = (iterations - remaining) / (time.perf_counter() - started)
+                    print(f"{self.iterations:>10,} iterations  {rate:,.0f}/s")
+                if checkpoint and self.iterations - last_saved >= checkpoint_every:
+                    self.save(checkpoint)
+                    last_saved = self.iterations
+            if checkpoint:
+                self.save(checkpoint)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+    
+    def average_strategy(self) -> "np.ndarray":
+        """Return the strategy sums normalised over each information set (zeros where never reached)."""
+        totals = self.strategy_sums.sum(axis=-1, keepdims=True)
+        return np.divide(self.strategy_sums, totals, out=np.zeros_like(self.strategy_sums), where=totals > 0)
+    
+    def policy(self) -> "Policy":
+        """Return the average strategy as a ``Policy``."""
+        return Policy(self.config, self.average_strategy())
+    
+    def save(self, path: str) -> None:
+        """Write a checkpoint atomically."""
+        import tempfile
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, regrets=self.regrets, strategy_sums=self.strategy_sums,
+                         iterations=self.iterations, config=json.dumps(self.config._asdict()))
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    
+    @classmethod
+    def load(cls, path: str) -> "CFRSolver":
+        """Read a checkpoint written by ``save``."""
+        with np.load(path) as data:
+            solver = cls(_config_from_json(str(data["config"])))
+            solver.regrets = data["regrets"]
+            solver.strategy_sums = data["strategy_sums"]
+            solver.iterations = int(data["iterations"])
+        return solver
+
+
+def _config_from_json(text: str) -> SolverConfig:
+    """Rebuild a ``SolverConfig`` saved in a checkpoint."""
+    fields = json.loads(text)
+    fields["raise_sizes"] = tuple(fields["raise_sizes"])
+    return SolverConfig(**fields)
+
+
+class Policy:
+    """A trained average strategy: action probabilities for every information set."""
+    
+    def __init__(self, config: SolverConfig, strategy: "np.ndarray"):
+        """Wrap a normalised strategy table."""
+        self.config = config
+        self.strategy = strategy
+    
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "Policy":
+        """Read the average strategy from a solver checkpoint (the default one if no path is given)."""
+        return CFRSolver.load(path or default_checkpoint()).policy()
+    
+    def probabilities(self, position: int, street: int, bucket: int, raises: int, facing: bool,
+                      actions: Sequence[int]) -> List[float]:
+        """Return the probabilities of some legal actions, uniform where training never got."""
+        row = self.strategy[position, street, bucket, min(raises, self.config.max_raises), int(facing)]
+        weights = [float(row[action]) for action in actions]
+        total = sum(weights)
+        if total <= 0:
+            return [1.0 / len(actions)] * len(actions)
+        return [weight / total for weight in weights]
+
+
+class CFRPlayer(Player):
+    """A player that samples its actions from a trained ``Policy``."""
+    
+    def __init__(self, name: str, chips: int = 1000, policy: Union[Policy, str, None] = None):
+        """
+        Create a player from a policy or a checkpoint path (default: the default checkpoint).
+        
+        Call ``watch(game)`` so the player knows its blind and the raises on
+        each street; otherwise it infers its blind from its first preflop
+        decision and the raises from the bet it faces.
+        """
+        super().__init__(name, chips)
+        self.policy = policy if isinstance(policy, Policy) else Policy.load(policy)
+        self.tracker = HandTracker()
+        self.position: Optional[int] = None
+        self.raises = 0
+        self._watching = False
+        self._blinds = 0
+        self._raise_amount: Optional[int] = None
+    
+    def reset_for_new_hand(self) -> None:
+        """Forget the last hand's position as well."""
+        super().reset_for_new_hand()
+        if not self._watching:
+            self.position = None
+    
+    def watch(self, game: "PokerGame") -> None:
+        """Follow a game's events to learn positions and raise counts."""
+        self._watching = True
+        game.add_listener(self._observe)
+    
+    def _observe(self, event: str, data: Dict[str, Any]) -> None:
+        """Track the blinds and the raises on the current street."""
+        if event == "hand_start":
+            self.position = None
+            self.raises = 0
+            self._blinds = 0
+        elif event == "blind":
+            if data["player"] is self:
+                self.position = self._blinds
+            self._blinds += 1
+        elif event == "street":
+            self.raises = 0
+        elif event == "action" and data["action"] == "raise":
+            self.raises += 1
+    
+    def make_decision(self, community_cards: List[Card], current_bet: int, pot_size: int) -> str:
+        """Sample an action from the policy for this hand's information set."""
+        config = self.policy.config
+        board = from_cards(community_cards)
+        street = max(0, len(board) - 2)
+        bucket = hand_bucket(from_cards(self.hole_cards), board, config.buckets, self.tracker)
+        to_call = current_bet - self.current_bet
+        facing = to_call > 0
+        
+        if self._watching:
+            position, raises = 1 if self.position is None else self.position, self.raises
+        else:
+            preflop_blind = street == 0 and current_bet <= config.big_blind
+            if self.position is None:
+                # Only the small blind's first decision faces just the big blind
+                self.position = 0 if preflop_blind and self.current_bet < current_bet else 1
+            position = self.position
+            raises = 1 if facing and not preflop_blind else 0
+        
+        actions = [FOLD, CALL] if facing else [CALL]
+        if raises < config.max_raises and self.chips > to_call:
+            actions.extend(range(2, config.actions))
+        probabilities = self.policy.probabilities(position, street, bucket, raises, facing, actions)
+        action = random.choices(actions, probabilities)[0]
+        
+        if action == FOLD:
+            return "fold"
+        if action == CALL:
+            return "call" if facing else "check"
+        fraction = config.raise_sizes[action - 2]
+        self._raise_amount = to_call + max(config.big_blind, int(fraction * (pot_size + to_call)))
+        return "raise"
+    
+    def get_raise_amount(self, min_raise: int, max_raise: int) -> int:
+        """Raise by the pot fraction chosen in ``make_decision``, within the allowed range."""
+        amount = self._raise_amount if self._raise_amount is not None else min_raise
+        self._raise_amount = None
+        return max(min_raise, min(max_raise, amount))
+
+
+def main() -> None:
+    """Train (or continue training) a policy and save it."""
+    parser = argparse.ArgumentParser(description="Train a heads-up CFR policy.")
+    parser.add_argument("--iterations", type=int, default=100000, help="iterations to run")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--batch", type=int, default=1000, help="iterations per process per round")
+    parser.add_argument("--checkpoint", default=default_checkpoint(), help="checkpoint file")
+    parser.add_argument("--checkpoint-every", type=int, default=50000, help="iterations between checkpoints")
+    parser.add_argument("--resume", action="store_true", help="continue from the checkpoint")
+    parser.add_argument("--buckets", type=int, default=SolverConfig().buckets, help="hand buckets per street")
+    parser.add_argument("--seed", type=int, help="random seed")
+    args = parser.parse_args()
+    
+    if args.resume and os.path.exists(args.checkpoint):
+        solver = CFRSolver.load(args.checkpoint)
+        print(f"Resuming from {solver.iterations:,} iterations")
+    else:
+        solver = CFRSolver(SolverConfig(buckets=args.buckets))
+    solver.train(args.iterations, args.processes, args.batch, args.seed,
+                 args.checkpoint, args.checkpoint_every, verbose=True)
+    
+    strategy = solver.average_strategy()
+    print(f"\nSmall blind's first action by bucket (fold / call / {' / '.join(map(str, solver.config.raise_sizes))} pot):")
+    for bucket in range(solver.config.buckets):
+        row = " ".join(f"{p:5.2f}" for p in strategy[0, 0, bucket, 0, 1])
+        print(f"  {bucket:>2}  {row}")
+    print(f"Saved {solver.iterations:,} iterations to {args.checkpoint}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Lazily built lookup tables with an optional on-disk cache.
+
+Evaluator tables are built the first time they are needed instead of at
+import time.  Tables that are expensive to build can be cached as pickles
+in ``$POKER_CACHE_DIR`` (default ``~/.cache/poker_game``) so later processes
+load them instead of rebuilding.  A table's ``version`` is part of its cache
+file name; bump it whenever the builder's output changes.
+"""
+import os
+import pickle
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def cache_dir() -> str:
+    """Return the directory used to cache built tables."""
+    default = os.path.join(os.path.expanduser("~"), ".cache", "poker_game")
+    return os.environ.get("POKER_CACHE_DIR", default)
+
+
+class LazyTable(Generic[T]):
+    """A lookup table built on first use and optionally cached on disk."""
+    
+    def __init__(self, name: str, builder: Callable[[], T], version: int = 1, cached: bool = False):
+        """
+        Describe a table without building it.
+        
+        ``builder`` is called at most once per process; with ``cached=True``
+        its result is also written to (and later read from) the cache file.
+        """
+        self.name = name
+        self.builder = builder
+        self.version = version
+        self.cached = cached
+        self._value: Optional[T] = None
+        self._loaded = False
+    
+    @property
+    def path(self) -> str:
+        """Return the cache file for this table."""
+        return os.path.join(cache_dir(), f"{self.name}-v{self.version}.pickle")
+    
+    @property
+    def loaded(self) -> bool:
+        """Return True once the table is in memory."""
+        return self._loaded
+    
+    def get(self) -> T:
+        """Return the table, loading or building it on first use."""
+        if not self._loaded:
+            self._value = self._load()
+            self._loaded = True
+        return self._value  # type: ignore[return-value]
+    
+    def __call__(self) -> T:
+        """Shorthand for ``get()``."""
+        return self.get()
+    
+    def store(self, value: T) -> T:
+        """Replace the table in memory (and in the cache, if cached) with a new build."""
+        self._value = value
+        self._loaded = True
+        if self.cached:
+            self._save(value)
+        return value
+    
+    def clear(self) -> None:
+        """Drop the in-memory table so the next use loads it again."""
+        self._value = None
+        self._loaded = False
+    
+    def _load(self) -> T:
+        """Read the table from the cache, or build (and cache) it."""
+        if self.cached:
+            try:
+                with open(self.path, "rb") as f:
+                    return pickle.load(f)
+            except (OSError, pickle.PickleError, EOFError, AttributeError, ValueError):
+                pass
+        
+        value = self.builder()
+        if self.cached:
+            self._save(value)
+        return value
+    
+    def _save(self, value: T) -> None:
+        """Write the table atomically; a failed write only costs a rebuild later."""
+        import tempfile
+        
+        try:
+            os.makedirs(cache_dir(), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_dir(), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
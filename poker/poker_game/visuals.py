@@ -2,10 +2,9 @@
 Visual utilities for the poker game using only Python built-ins.
 Enhanced beautiful ASCII art and animations without external dependencies.
 """
-import time
 import os
-import random
 from typing import List
+from .animation import get_scheduler
 from .cards import Card
 
 
@@ -72,10 +71,11 @@ class PokerArt:
     ╚══════════════════════════════════════════════════════════════════════╝{Colors.RESET}"""
         ]
         
-        for frame in frames:
+        def show(frame: str) -> None:
             os.system('clear' if os.name == 'posix' else 'cls')
             print(frame)
-            time.sleep(0.8)
+        
+        get_scheduler().play([lambda f=frame: show(f) for frame in frames], 0.8)
     
     @staticmethod
     def title_banner() -> str:
@@ -141,9 +141,7 @@ class PokerArt:
 ╚═════════════════════════════════════════════════════════════════════════════╝{Colors.RESET}"""
         ]
         
-        for frame in separator_frames:
-            print(frame)
-            time.sleep(0.3)
+        get_scheduler().play([lambda f=frame: print(f) for frame in separator_frames], 0.3)
     
     @staticmethod
     def betting_round_header_deluxe(round_name: str, community_cards: List[Card] = None) -> str:
@@ -172,6 +170,14 @@ class PokerArt:
 │                                                                             │
 └─────────────────────────────────────────────────────────────────────────────┘{Colors.RESET}"""
     
+    @staticmethod
+    def showdown_banner() -> str:
+        """Return the showdown banner."""
+        return f"""{Colors.BOLD}{Colors.MAGENTA}
+╔═════════════════════════════════════════════════════════════════════════════╗
+║                    🃏 ⚔️  🃏  S H O W D O W N  🃏 ⚔️  🃏                    ║
+╚═════════════════════════════════════════════════════════════════════════════╝{Colors.RESET}"""
+    
     @staticmethod
     def winner_celebration_deluxe(winner_name: str, amount: int) -> str:
         """Return an elaborate winner celebration."""
@@ -192,19 +198,25 @@ class PokerArt:
         return celebration
     
     @staticmethod
-    def loading_animation(message: str, duration: float = 2.0) -> None:
-        """Display a beautiful loading animation."""
-        frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-        start_time = time.time()
+    def loading_animation(message: str, duration: float = 2.0, blocking: bool = True) -> None:
+        """
+        Display a beautiful loading animation.
         
-        while time.time() - start_time < duration:
-            for frame in frames:
-                if time.time() - start_time >= duration:
-                    break
-                print(f"\r{Colors.CYAN}{Colors.BOLD}{frame} {message}...{Colors.RESET}", end="", flush=True)
-                time.sleep(0.1)
+        Pass ``blocking=False`` to let the caller keep working while the
+        spinner renders; call ``get_scheduler().wait()`` before printing again.
+        """
+        spinner = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+        frame_count = max(1, round(duration / 0.1))
+        frames = [
+            lambda s=spinner[i % len(spinner)]: print(f"\r{Colors.CYAN}{Colors.BOLD}{s} {message}...{Colors.RESET}", end="", flush=True)
+            for i in range(frame_count)
+        ]
         
-        print(f"\r{Colors.GREEN}{Colors.BOLD}✓ {message} complete!{Colors.RESET}")
+        get_scheduler().play(
+            frames, 0.1,
+            final=lambda: print(f"\r{Colors.GREEN}{Colors.BOLD}✓ {message} complete!{Colors.RESET}"),
+            blocking=blocking,
+        )
 
 
 class CardDisplay:
@@ -332,20 +344,17 @@ class CardDisplay:
 def print_with_sparkle_effect(text: str, delay: float = 0.5) -> None:
     """Print text with a sparkle effect animation."""
     sparkles = ["✨", "⭐", "🌟", "💫", "⭐", "✨"]
+    frames = [
+        lambda s=sparkles[i % len(sparkles)]: print(f"\r{s} {text} {s}", end="", flush=True)
+        for i in range(3)
+    ]
     
-    for i in range(3):
-        sparkle = sparkles[i % len(sparkles)]
-        print(f"\r{sparkle} {text} {sparkle}", end="", flush=True)
-        time.sleep(delay / 3)
-    
-    print(f"\r{text}")
+    get_scheduler().play(frames, delay / 3, final=lambda: print(f"\r{text}"))
 
 
 def clear_screen_with_effect() -> None:
     """Clear screen with a beautiful transition effect."""
     # Create a wipe effect
-    for i in range(5):
-        print("░" * (20 + i * 10))
-        time.sleep(0.1)
+    frames = [lambda i=i: print("░" * (20 + i * 10)) for i in range(5)]
     
-    os.system('clear' if os.name == 'posix' else 'cls')
+    get_scheduler().play(frames, 0.1, final=lambda: os.system('clear' if os.name == 'posix' else 'cls'))
@@ -0,0 +1,75 @@
+"""
+Tests for the equity-histogram card abstraction.
+"""
+import itertools
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+from poker_game.evaluator import parse_cards
+
+if np is not None:
+    from poker_game.abstraction import AbstractionConfig, build, canonical_hand, canonical_key, histogram
+
+# Just enough sampling to cluster something in a few seconds
+SMALL = AbstractionConfig(buckets=(5, 50, 10, 10), preflop_boards=20, flop_runouts=8,
+                          turn_boards=4, turn_runouts=4, river_boards=4)
+
+
+def relabelled(cards, permutation):
+    """Return cards with their suits permuted."""
+    return [card & ~3 | permutation[card & 3] for card in cards]
+
+
+@unittest.skipIf(np is None, "the card abstraction needs NumPy")
+class TestAbstraction(unittest.TestCase):
+    """Suit-isomorphic hands are keyed, sampled and bucketed alike."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build a small abstraction storing a single flop."""
+        cls.abstraction = build(SMALL, flops=[tuple(parse_cards("AsKsQs"))])
+    
+    def test_canonical_hand(self):
+        """Every suit permutation of a hand has the same canonical cards and key."""
+        hole, board = parse_cards("AhKh"), parse_cards("Qh7d2c")
+        expected = canonical_hand(hole, board)
+        for permutation in itertools.permutations(range(4)):
+            other = relabelled(hole, permutation), relabelled(board, permutation)
+            self.assertEqual(canonical_hand(*other), expected)
+            self.assertEqual(canonical_key(*other), canonical_key(hole, board))
+    
+    def test_histograms_are_isomorphic(self):
+        """Hands assigned on demand sample the same runouts in any suits."""
+        for text in ("AhKh Qh7d2c", "9c8c 7d6h2s5c"):
+            hole, board = (parse_cards(part) for part in text.split())
+            expected = histogram(hole, board, SMALL)
+            for permutation in itertools.permutations(range(4)):
+                actual = histogram(relabelled(hole, permutation), relabelled(board, permutation), SMALL)
+                np.testing.assert_array_equal(actual, expected)
+    
+    def test_isomorphic_buckets(self):
+        """Hands off the stored flop land in the same bucket whatever their suits."""
+        self.assertEqual(self.abstraction.bucket(parse_cards("AhKh"), parse_cards("Qh7d2c")),
+                         self.abstraction.bucket(parse_cards("AsKs"), parse_cards("Qs7c2d")))
+        self.assertEqual(self.abstraction.bucket(parse_cards("JdTd"), parse_cards("9d8c2h3s")),
+                         self.abstraction.bucket(parse_cards("JcTc"), parse_cards("9c8h2s3d")))
+    
+    def test_stored_buckets(self):
+        """Stored hands are found under their canonical key."""
+        for hole, board in (("AcKd", ""), ("JhJd", "AhKhQh"), ("7c2d", "AdKdQd")):
+            bucket = self.abstraction.bucket(parse_cards(hole), parse_cards(board))
+            self.assertLess(bucket, self.abstraction.buckets("flop" if board else "preflop"))
+        self.assertEqual(self.abstraction.bucket(parse_cards("AcAd")), self.abstraction.bucket(parse_cards("AhAs")))
+    
+    def test_duplicate_card(self):
+        """A card in both the hole and the board is rejected."""
+        with self.assertRaises(ValueError):
+            self.abstraction.bucket(parse_cards("AhKh"), parse_cards("AhQh2c"))
+
+
+if __name__ == "__main__":
+    unittest.main()
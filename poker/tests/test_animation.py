@@ -0,0 +1,131 @@
+"""
+Tests for the animation scheduler's time scale and frame skipping, on a fake clock.
+"""
+import os
+import unittest
+from unittest import mock
+
+from poker_game.animation import AnimationScheduler, _scale_from_environment
+
+
+class FakeClock:
+    """A clock that only moves when the scheduler sleeps or a frame takes time."""
+    
+    def __init__(self):
+        """Start at zero with no sleeps."""
+        self.now = 0.0
+        self.sleeps = []
+    
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+    
+    def sleep(self, seconds):
+        """Record a sleep and move the clock past it."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def scheduler_with(clock, time_scale):
+    """Return a scheduler driven by ``clock``."""
+    return AnimationScheduler(time_scale, clock=clock, sleep=clock.sleep)
+
+
+def frames(clock, count, cost=0.0, drawn=None):
+    """Return ``count`` frames that record their index and each take ``cost`` seconds."""
+    drawn = [] if drawn is None else drawn
+    
+    def frame(index):
+        def draw():
+            drawn.append(index)
+            clock.now += cost
+        return draw
+    
+    return [frame(index) for index in range(count)], drawn
+
+
+class TestAnimationScheduler(unittest.TestCase):
+    """Effects keep to the scaled clock, and fall back to the last frame when they cannot."""
+    
+    def test_instant_mode(self):
+        """A zero time scale draws only the last frame and the final one, without sleeping."""
+        clock = FakeClock()
+        scheduler = scheduler_with(clock, 0)
+        effect, drawn = frames(clock, 5)
+        final = mock.Mock()
+        scheduler.play(effect, 0.1, final=final)
+        scheduler.pause(2.0)
+        
+        self.assertTrue(scheduler.instant)
+        self.assertEqual(drawn, [4])
+        final.assert_called_once_with()
+        self.assertEqual((scheduler.frames_played, scheduler.frames_skipped), (1, 4))
+        self.assertEqual(clock.sleeps, [])
+        self.assertEqual(clock.now, 0.0)
+    
+    def test_frames_on_time(self):
+        """Cheap frames are all drawn one scaled interval apart, and the last is held."""
+        clock = FakeClock()
+        scheduler = scheduler_with(clock, 0.5)
+        effect, drawn = frames(clock, 4, cost=0.01)
+        scheduler.play(effect, 0.2)
+        
+        self.assertEqual(drawn, [0, 1, 2, 3])
+        self.assertEqual(scheduler.frames_skipped, 0)
+        self.assertAlmostEqual(clock.now, 4 * 0.1)
+        self.assertTrue(all(delay > 0 for delay in clock.sleeps))
+    
+    def test_slow_frames_are_skipped(self):
+        """Frames that take longer than the interval make the scheduler drop the overdue ones."""
+        clock = FakeClock()
+        scheduler = scheduler_with(clock, 1.0)
+        effect, drawn = frames(clock, 10, cost=0.25)
+        scheduler.play(effect, 0.1)
+        
+        self.assertEqual(drawn[-1], 9)
+        self.assertEqual(drawn, sorted(drawn))
+        self.assertEqual(scheduler.frames_played + scheduler.frames_skipped, 10)
+        self.assertGreater(scheduler.frames_skipped, 0)
+        # Skipping keeps the effect close to its nominal length instead of 10 frame costs
+        self.assertLess(clock.now, 10 * 0.25)
+    
+    def test_small_environment_scale(self):
+        """A small ``POKER_ANIMATION_SCALE`` shortens every interval so most frames are skipped."""
+        with mock.patch.dict(os.environ, {"POKER_ANIMATION_SCALE": "0.01"}):
+            time_scale = _scale_from_environment()
+        self.assertEqual(time_scale, 0.01)
+        
+        clock = FakeClock()
+        scheduler = scheduler_with(clock, time_scale)
+        effect, drawn = frames(clock, 20, cost=0.005)
+        scheduler.play(effect, 0.1)
+        scheduler.pause(1.0)
+        
+        self.assertFalse(scheduler.instant)
+        self.assertEqual(drawn[-1], 19)
+        self.assertLess(len(drawn), 20)
+        self.assertEqual(scheduler.frames_played, len(drawn))
+        self.assertEqual(scheduler.frames_skipped, 20 - len(drawn))
+        self.assertAlmostEqual(clock.sleeps[-1], 0.01)
+    
+    def test_bad_environment_scale(self):
+        """An unreadable ``POKER_ANIMATION_SCALE`` falls back to normal speed."""
+        with mock.patch.dict(os.environ, {"POKER_ANIMATION_SCALE": "fast"}):
+            self.assertEqual(_scale_from_environment(), 1.0)
+        self.assertEqual(AnimationScheduler(-2).time_scale, 0.0)
+    
+    def test_background_effects_play_in_order(self):
+        """Queued effects play one after another, and ``wait`` returns once they are done."""
+        clock = FakeClock()
+        scheduler = scheduler_with(clock, 0)
+        drawn = []
+        for count in (2, 3, 1):
+            effect, _ = frames(clock, count, drawn=drawn)
+            scheduler.play(effect, 0.1, final=lambda count=count: drawn.append(("final", count)),
+                           blocking=False)
+        scheduler.wait()
+        self.assertEqual(drawn, [1, ("final", 2), 2, ("final", 3), 0, ("final", 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
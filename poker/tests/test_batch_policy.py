@@ -0,0 +1,83 @@
+"""
+Tests for the vectorised AI betting rule against AIPlayer's per-seat methods.
+"""
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+if np is not None:
+    from poker_game.batch_policy import ACTIONS, RAISE, decide, raise_bounds, reference
+
+
+def random_seats(rng, seats):
+    """Return strengths, amounts to call, raise bounds and draws for random seats."""
+    strength = rng.random(seats)
+    to_call = np.where(rng.random(seats) < 0.5, rng.integers(10, 200, seats), 0)
+    # The game turns a raise the stack cannot cover into a call, so every
+    # range is one a player can be asked for, some with a single amount
+    min_raise, _ = raise_bounds(to_call, 0, 0)
+    chips = np.where(rng.random(seats) < 0.1, min_raise, rng.integers(min_raise, 4000))
+    min_raise, max_raise = raise_bounds(to_call, 0, chips)
+    return strength, to_call, min_raise, max_raise, rng.random((4, seats))
+
+
+@unittest.skipIf(np is None, "the batch policy needs NumPy")
+class TestBatchPolicy(unittest.TestCase):
+    """``decide`` makes exactly the reference's decisions from the same draws."""
+    
+    def assert_matches(self, batch, strength, to_call, min_raise, max_raise, draws,
+                       bet_frequency=None, call_threshold=None):
+        """Check every seat of a batch against the reference."""
+        mismatches = []
+        for i in range(len(strength)):
+            adjustments = {}
+            if bet_frequency is not None:
+                adjustments = {"bet_frequency": float(bet_frequency[i]), "call_threshold": float(call_threshold[i])}
+            expected = reference(float(strength[i]), int(to_call[i]), int(min_raise[i]), int(max_raise[i]),
+                                 draws[:, i], **adjustments)
+            actual = (ACTIONS[batch.actions[i]], int(batch.raise_amounts[i]))
+            if actual != expected:
+                mismatches.append((i, actual, expected))
+        self.assertEqual(mismatches, [])
+    
+    def test_matches_reference(self):
+        """Seeded random seats with the default adjustments."""
+        rng = np.random.default_rng(0)
+        seats = random_seats(rng, 20000)
+        batch = decide(*seats[:4], draws=seats[4])
+        self.assert_matches(batch, *seats)
+        self.assertEqual(set(np.unique(batch.actions)), {0, 1, 2, 3})
+    
+    def test_matches_reference_with_opponent_adjustments(self):
+        """Per-seat bet frequencies and call thresholds broadcast like the scalars."""
+        rng = np.random.default_rng(1)
+        seats = random_seats(rng, 5000)
+        bet_frequency = rng.uniform(0.1, 0.6, 5000)
+        call_threshold = rng.uniform(0.2, 0.6, 5000)
+        batch = decide(*seats[:4], bet_frequency, call_threshold, draws=seats[4])
+        self.assert_matches(batch, *seats, bet_frequency, call_threshold)
+    
+    def test_raise_amounts(self):
+        """Raises stay within their bounds; other actions bet nothing."""
+        rng = np.random.default_rng(2)
+        strength, to_call, min_raise, max_raise, draws = random_seats(rng, 20000)
+        batch = decide(strength, to_call, min_raise, max_raise, draws=draws)
+        raising = batch.actions == RAISE
+        self.assertTrue(np.all(batch.raise_amounts[~raising] == 0))
+        self.assertTrue(np.all(batch.raise_amounts[raising] >= min_raise[raising]))
+        self.assertTrue(np.all(batch.raise_amounts[raising] <= max_raise[raising]))
+    
+    def test_generator_draws(self):
+        """Without explicit draws the same seed gives the same decisions."""
+        strength, to_call, min_raise, max_raise, _ = random_seats(np.random.default_rng(3), 1000)
+        first = decide(strength, to_call, min_raise, max_raise, rng=np.random.default_rng(4))
+        second = decide(strength, to_call, min_raise, max_raise, rng=np.random.default_rng(4))
+        np.testing.assert_array_equal(first.actions, second.actions)
+        np.testing.assert_array_equal(first.raise_amounts, second.raise_amounts)
+
+
+if __name__ == "__main__":
+    unittest.main()
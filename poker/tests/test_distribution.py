@@ -0,0 +1,88 @@
+"""
+Tests for the seven-card hand-rank distribution against published totals.
+"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from poker_game.distribution import (DISTRIBUTION, TOTAL_HANDS, build, category_frequencies, percentile,
+                                     strength_at)
+from poker_game.evaluator import evaluate, parse_cards
+
+# The standard counts of seven-card hands by their best five cards
+PUBLISHED = {
+    "High Card": 23_294_460,
+    "Pair": 58_627_800,
+    "Two Pair": 31_433_400,
+    "Three of a Kind": 6_461_620,
+    "Straight": 6_180_020,
+    "Flush": 4_047_644,
+    "Full House": 3_473_184,
+    "Four of a Kind": 224_848,
+    "Straight Flush": 37_260,
+    "Royal Flush": 4_324,
+}
+
+
+class TestDistribution(unittest.TestCase):
+    """The combinatorial tables count every hand exactly once."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the lazy table into a scratch cache directory."""
+        cls.cache = tempfile.TemporaryDirectory()
+        cls.environ = mock.patch.dict(os.environ, {"POKER_CACHE_DIR": cls.cache.name})
+        cls.environ.start()
+        DISTRIBUTION.clear()
+        cls.table = DISTRIBUTION.get()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Forget the scratch table and restore the cache directory."""
+        DISTRIBUTION.clear()
+        cls.environ.stop()
+        cls.cache.cleanup()
+    
+    def test_published_totals(self):
+        """Every category matches the published count, and the counts add up to C(52, 7)."""
+        self.assertEqual(category_frequencies(), PUBLISHED)
+        self.assertEqual(sum(PUBLISHED.values()), TOTAL_HANDS)
+        self.assertEqual(sum(self.table["counts"]), TOTAL_HANDS)
+    
+    def test_cached_table(self):
+        """The first use writes the cache, and a fresh load reads back the same table."""
+        self.assertTrue(os.path.exists(DISTRIBUTION.path))
+        self.assertTrue(DISTRIBUTION.path.startswith(self.cache.name))
+        DISTRIBUTION.clear()
+        self.assertEqual(DISTRIBUTION.get(), self.table)
+    
+    def test_worker_processes(self):
+        """Spreading the rank multisets over a pool gives the same table."""
+        self.assertEqual(build(processes=2), self.table)
+    
+    def test_percentiles(self):
+        """Percentiles run from the weakest seven cards to a royal flush and ties count half."""
+        weakest = evaluate(parse_cards("9h8d7c5s4h3d2c"))
+        royal = evaluate(parse_cards("AsKsQsJsTs2h3d"))
+        self.assertEqual(self.table["strengths"][0], weakest)
+        self.assertEqual(self.table["strengths"][-1], royal)
+        self.assertAlmostEqual(percentile(royal), 1 - PUBLISHED["Royal Flush"] / 2 / TOTAL_HANDS)
+        self.assertAlmostEqual(percentile(weakest), self.table["counts"][0] / 2 / TOTAL_HANDS)
+        self.assertEqual(percentile(0), 0.0)
+        self.assertEqual(percentile(royal + 1), 1.0)
+        
+        values = [percentile(strength) for strength in self.table["strengths"]]
+        self.assertEqual(values, sorted(values))
+    
+    def test_strength_at(self):
+        """``strength_at`` inverts ``percentile`` at every strength boundary."""
+        below = self.table["below"]
+        for index in range(0, len(below), 97):
+            self.assertEqual(strength_at(below[index] / TOTAL_HANDS), self.table["strengths"][index])
+        self.assertEqual(strength_at(0.0), self.table["strengths"][0])
+        self.assertEqual(strength_at(1.0), self.table["strengths"][-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Tests for the integer hand evaluator against ``PokerHand``.
+"""
+import random
+import unittest
+
+from poker_game.evaluator import describe, evaluate, from_cards, parse_cards, to_card
+from poker_game.hand_evaluator import PokerHand
+
+# Ace, five, four, three, two: PokerHand scores the wheel as ace-high
+WHEEL_RANKS = {12, 3, 2, 1, 0}
+
+
+def random_hands(count: int, seed: int):
+    """Yield ``count`` random seven-card hands without the wheel's ranks."""
+    rng = random.Random(seed)
+    produced = 0
+    while produced < count:
+        cards = rng.sample(range(52), 7)
+        if WHEEL_RANKS <= {card >> 2 for card in cards}:
+            continue
+        produced += 1
+        yield cards
+
+
+class TestEvaluator(unittest.TestCase):
+    """The evaluator agrees with ``PokerHand`` on category and tiebreakers."""
+
+    def test_matches_poker_hand(self):
+        """Random hands describe the same way under both evaluators."""
+        for cards in random_hands(3000, seed=1):
+            expected = PokerHand([to_card(card) for card in cards]).best_hand
+            self.assertEqual(describe(evaluate(cards)), expected, [to_card(card).code() for card in cards])
+
+    def test_every_category(self):
+        """A hand from every category matches, from a royal flush down to high card."""
+        hands = [
+            "AhKhQhJhTh2c3d", "9s8s7s6s5s2c2d", "QcQdQhQs2c3d4h", "KcKdKh2s2c7d9h",
+            "Ah9h7h4h2h3c3d", "9c8d7h6s5c2d2h", "7c7d7h2s4c9dJh", "8c8d4h4s2cJdKh",
+            "TcTd2h5s7cJdKh", "Ac9d7h5s3cJdKh",
+        ]
+        categories = []
+        for text in hands:
+            cards = parse_cards(text)
+            expected = PokerHand([to_card(card) for card in cards]).best_hand
+            self.assertEqual(describe(evaluate(cards)), expected, text)
+            categories.append(expected[0].numeric_value)
+        self.assertEqual(categories, list(range(10, 0, -1)))
+
+    def test_ordering_matches_compare(self):
+        """Comparing strengths gives the same winner as ``PokerHand.compare``."""
+        hands = [(evaluate(cards), PokerHand([to_card(card) for card in cards]))
+                 for cards in random_hands(1000, seed=2)]
+        for (strength, hand), (other_strength, other) in zip(hands, hands[1:]):
+            actual = (strength > other_strength) - (strength < other_strength)
+            self.assertEqual(actual, hand.compare(other))
+
+    def test_wheel_is_five_high(self):
+        """A-2-3-4-5 is the lowest straight, below 2-3-4-5-6."""
+        wheel = evaluate(parse_cards("Ah2c3d4s5hKcKd"))
+        six_high = evaluate(parse_cards("2c3d4s5h6hKcKd"))
+        self.assertEqual(describe(wheel)[1], [5])
+        self.assertLess(wheel, six_high)
+
+    def test_card_round_trip(self):
+        """Every card integer survives a trip through ``Card``."""
+        cards = list(range(52))
+        self.assertEqual(from_cards([to_card(card) for card in cards]), cards)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+"""
+Tests for the betting rules, driving ``hand_steps`` with scripted players.
+"""
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+from poker_game.game import ActionRequest, PokerGame
+from poker_game.player import Player
+
+
+class ScriptedPlayer(Player):
+    """A player that answers every request from a fixed script."""
+    
+    def __init__(self, name, chips=1000, script=()):
+        """Seat a player who will answer with ``script`` in order."""
+        super().__init__(name, chips)
+        self.script = list(script)
+    
+    def make_decision(self, community_cards, current_bet, pot_size):
+        """Return the next scripted action."""
+        return self.script.pop(0)
+    
+    def get_raise_amount(self, min_raise, max_raise):
+        """Return the next scripted amount."""
+        return self.script.pop(0)
+
+
+def play(game):
+    """Play one hand through ``hand_steps`` and return the requests it made."""
+    requests = []
+    steps = game.hand_steps()
+    try:
+        request = next(steps)
+        while True:
+            requests.append(request)
+            request = steps.send(game.resolve(request))
+    except StopIteration:
+        pass
+    return requests
+
+
+def heads_up(dealer_chips=1000, other_chips=1000, dealer_script=(), other_script=()):
+    """Seat two scripted players; the first is the dealer and posts the big blind."""
+    dealer = ScriptedPlayer("Dealer", dealer_chips, dealer_script)
+    other = ScriptedPlayer("Other", other_chips, other_script)
+    game = PokerGame(players=[dealer, other], verbose=False)
+    events = []
+    game.add_listener(lambda event, data: events.append((event, data)))
+    return game, dealer, other, events
+
+
+class TestBettingRules(unittest.TestCase):
+    """Blinds, the order of play and all-in runouts."""
+    
+    def assert_conserved(self, game, total):
+        """Check that no chips were created or lost."""
+        self.assertEqual(sum(player.chips for player in game.players), total)
+    
+    def test_blinds_count_preflop(self):
+        """The small blind completes, the big blind may check, and the flop pot holds both blinds."""
+        game, dealer, other, events = heads_up(dealer_script=["check", "check", "check", "check"],
+                                               other_script=["call", "check", "check", "check"])
+        requests = play(game)
+        
+        self.assertEqual([(r.player, r.current_bet, r.pot_size) for r in requests[:2]],
+                         [(other, 20, 30), (dealer, 20, 40)])
+        # The small blind opens every street after the flop too
+        self.assertEqual([r.player for r in requests[2:]], [other, dealer] * 3)
+        self.assertTrue(all(r.current_bet == 0 and r.pot_size == 40 for r in requests[2:]))
+        self.assertEqual(len(game.community_cards), 5)
+        self.assertIn("showdown", [event for event, _ in events])
+        self.assert_conserved(game, 2000)
+    
+    def test_fold_ends_the_hand(self):
+        """A fold to the last player hands them the pot without a showdown."""
+        game, dealer, other, events = heads_up(other_script=["fold"])
+        requests = play(game)
+        self.assertEqual(len(requests), 1)
+        self.assertEqual((dealer.chips, other.chips), (1010, 990))
+        self.assertEqual(events[-1][0], "hand_end")
+        self.assertFalse(events[-1][1]["showdown"])
+    
+    def test_quiet_game_builds_no_art(self):
+        """A table that is not verbose never renders the round headers or winner banners."""
+        game, _, _, _ = heads_up(dealer_script=["check"] * 4, other_script=["call"] + ["check"] * 3)
+        with mock.patch("poker_game.game.PokerArt") as art:
+            play(game)
+        art.betting_round_header_deluxe.assert_not_called()
+        art.winner_celebration_deluxe.assert_not_called()
+    
+    def test_raise_reopens_the_action(self):
+        """A raise gets an answer from the player who had already acted."""
+        game, dealer, other, _ = heads_up(dealer_script=["check", "raise", 60, "fold"],
+                                          other_script=["call", "check", "call", "raise", 200])
+        requests = play(game)
+        flop = [(r.player.name, type(r).__name__) for r in requests[2:]]
+        self.assertEqual(flop, [("Other", "ActionRequest"), ("Dealer", "ActionRequest"), ("Dealer", "RaiseRequest"),
+                                ("Other", "ActionRequest"), ("Other", "ActionRequest"), ("Other", "RaiseRequest"),
+                                ("Dealer", "ActionRequest")])
+        self.assertEqual(other.chips, 2000 - dealer.chips)
+        self.assert_conserved(game, 2000)
+    
+    def test_short_big_blind_keeps_the_small_blind_bet(self):
+        """A big blind all-in for less than the small blind leaves the bet at the small blind."""
+        game, dealer, other, _ = heads_up(dealer_chips=5)
+        bets = []
+        game.add_listener(lambda event, data: bets.append(game.current_bet) if event == "blind" else None)
+        steps = game.hand_steps()
+        with self.assertRaises(StopIteration):
+            next(steps)
+        # Nobody owes a call, so the board is run out without asking anyone
+        self.assertEqual(bets, [10, 10])
+        self.assertTrue(dealer.all_in)
+        self.assertEqual(len(game.community_cards), 5)
+        self.assert_conserved(game, 1005)
+    
+    def test_short_big_blind_is_called(self):
+        """A big blind all-in for more than the small blind must still be called or folded."""
+        game, dealer, other, _ = heads_up(dealer_chips=15, other_script=["call"])
+        requests = play(game)
+        self.assertEqual([(r.player, r.current_bet) for r in requests], [(other, 15)])
+        self.assertEqual(len(game.community_cards), 5)
+        self.assertIn(other.chips, (985, 1000, 1015))
+        self.assert_conserved(game, 1015)
+    
+    def test_all_in_runs_out_the_board(self):
+        """Once everyone is all-in the remaining streets are dealt without any requests."""
+        game, dealer, other, events = heads_up(dealer_script=["call"], other_script=["raise", 990])
+        requests = play(game)
+        self.assertEqual([r.player for r in requests], [other, other, dealer])
+        self.assertTrue(dealer.all_in and other.all_in)
+        self.assertEqual(len(game.community_cards), 5)
+        self.assertEqual([data["street"] for event, data in events if event == "street"], ["flop", "turn", "river"])
+        self.assert_conserved(game, 2000)
+        self.assertIn(other.chips, (0, 1000, 2000))
+    
+    def test_three_handed_order(self):
+        """With three players the seat after the big blind opens preflop, the small blind afterwards."""
+        players = [ScriptedPlayer(name, script=["call", "check", "check", "check", "check"]) for name in "ABC"]
+        players[1].script = ["call", "check", "check", "check"]
+        players[2].script = ["check", "check", "check", "check"]
+        game = PokerGame(players=players, verbose=False)
+        requests = [r for r in play(game) if isinstance(r, ActionRequest)]
+        names = [r.player.name for r in requests]
+        # Dealer A, small blind B, big blind C
+        self.assertEqual(names[:3], ["A", "B", "C"])
+        self.assertEqual(names[3:], ["B", "C", "A"] * 3)
+        self.assert_conserved(game, 3000)
+
+
+
+class TestLazyImports(unittest.TestCase):
+    """The local game does not pay for the server's imports."""
+    
+    def test_no_asyncio_at_startup(self):
+        """Importing the game and the command line leaves asyncio to the async paths."""
+        code = "import sys, poker_game.main, poker_game.game, poker_game.player; print('asyncio' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "False")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Tests for the incremental hand tracker against full evaluation and brute-force outs.
+"""
+import unittest
+
+from poker_game.evaluator import STRAIGHT, evaluate, parse_cards
+from poker_game.hand_tracker import HandTracker
+from tests.test_outs import brute_outs, random_spots
+
+PAIR = 2
+
+
+def tracked(hole, board):
+    """Return a tracker fed ``board`` one street at a time."""
+    tracker = HandTracker(hole)
+    for end in (3, 4, 5):
+        if len(board) >= end:
+            tracker.update(board[:end])
+    return tracker
+
+
+def straight_or_flush_outs(hole, board):
+    """Return the brute-force outs that make a straight, a flush or a straight flush."""
+    return sum(len(cards) for category, cards in brute_outs(hole, board).items() if category >= STRAIGHT)
+
+
+class TestHandTracker(unittest.TestCase):
+    """The tracker agrees with evaluating the cards from scratch."""
+    
+    def test_strength_matches_evaluate(self):
+        """The incremental masks give the evaluator's strength on every street."""
+        for size in (3, 4, 5):
+            for hole, board in random_spots(300, size, seed=10 + size):
+                tracker = tracked(hole, board)
+                self.assertEqual(tracker.strength(), evaluate(hole + board))
+                self.assertEqual(len(tracker.history), size - 2)
+    
+    def test_outs_match_brute_force(self):
+        """Flush and straight outs match brute force wherever nothing else can improve past a straight."""
+        checked = drawing = 0
+        for size in (3, 4):
+            for hole, board in random_spots(1500, size, seed=20 + size):
+                # Below two pair, one more card cannot make a full house or quads,
+                # so every out to a straight or better is a straight or flush
+                if evaluate(hole + board) >> 20 > PAIR:
+                    continue
+                tracker = tracked(hole, board)
+                expected = straight_or_flush_outs(hole, board)
+                self.assertEqual(tracker.outs(), expected, (hole, board))
+                checked += 1
+                drawing += expected > 0
+        self.assertGreater(checked, 1000)
+        self.assertGreater(drawing, 100)
+    
+    def test_combined_draws(self):
+        """Flush and open-ended straight draws share the out ranks in the flush suit."""
+        spots = {
+            "9h8h 7h6c2h": 15,  # flush draw and open-ended straight draw
+            "9h8h 7h2h2d": 9,   # flush draw on a paired board
+            "9s8d 7h6c2h": 8,   # open-ended
+            "9s8d 7h5c2h": 4,   # gutshot
+            "AhKh Qh7h2c": 9,   # flush draw, two cards short of a straight
+        }
+        for spot, expected in spots.items():
+            hole, board = (parse_cards(part) for part in spot.split())
+            tracker = tracked(hole, board)
+            self.assertEqual(tracker.outs(), expected, spot)
+            if evaluate(hole + board) >> 20 <= PAIR:
+                self.assertEqual(tracker.outs(), straight_or_flush_outs(hole, board), spot)
+    
+    def test_no_outs_on_the_river(self):
+        """With no cards to come there are no draws and no chance of hitting one."""
+        tracker = tracked(parse_cards("9h8h"), parse_cards("7h6c2h3d4s"))
+        self.assertEqual(tracker.outs(), 0)
+        self.assertEqual(tracker.hit_probability(), 0.0)
+    
+    def test_update_restarts_on_a_new_board(self):
+        """A board that does not continue the tracked one starts the hand again."""
+        hole = parse_cards("AhKh")
+        tracker = tracked(hole, parse_cards("Qh7h2c5d"))
+        tracker.update(parse_cards("Qh7h2c5d"))
+        self.assertEqual(len(tracker.history), 2)
+        tracker.update(parse_cards("3s3d3c"))
+        self.assertEqual(tracker.board, parse_cards("3s3d3c"))
+        self.assertEqual(tracker.strength(), evaluate(hole + parse_cards("3s3d3c")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Tests for the decaying opponent statistics and their bounded store.
+"""
+import unittest
+
+from poker_game.opponent_stats import DecayingRate, OpponentModel
+from tests.test_game import heads_up, play
+
+
+class TestDecay(unittest.TestCase):
+    """Older observations fade by the decay per new one."""
+    
+    def test_decaying_rate(self):
+        """Hits and samples are both scaled before each observation."""
+        rate = DecayingRate()
+        self.assertEqual(rate.rate(default=0.3), 0.3)
+        for hit in (True, False, True):
+            rate.observe(hit, 0.5)
+        self.assertAlmostEqual(rate.hits, 1.25)
+        self.assertAlmostEqual(rate.samples, 1.75)
+        self.assertAlmostEqual(rate.rate(), 1.25 / 1.75)
+    
+    def test_recent_hands_weigh_more(self):
+        """After a change of style the decayed rate follows it, where a plain average would not."""
+        decayed = OpponentModel(decay=0.98).get("Villain").fold_to_bet
+        plain = OpponentModel(decay=1.0).get("Villain").fold_to_bet
+        for hit in [True] * 200 + [False] * 200:
+            decayed.observe(hit, 0.98)
+            plain.observe(hit, 1.0)
+        self.assertAlmostEqual(plain.rate(), 0.5)
+        self.assertLess(decayed.rate(), 0.02)
+        # The samples converge to 1 / (1 - decay) instead of growing without bound
+        self.assertAlmostEqual(decayed.samples, 50, delta=1)
+    
+    def test_aggression_factor(self):
+        """Post-flop raises per call, with a default before any are seen."""
+        stats = OpponentModel().get("Villain")
+        self.assertEqual(stats.aggression_factor(default=1.5), 1.5)
+        stats.aggressive, stats.passive = 3.0, 2.0
+        self.assertEqual(stats.aggression_factor(), 1.5)
+        # Faded calls count as one, so a single raise is not an infinite factor
+        stats.aggressive, stats.passive = 1.0, 0.0
+        self.assertEqual(stats.aggression_factor(), 1.0)
+
+
+class TestEviction(unittest.TestCase):
+    """The model forgets the least recently seen players beyond ``max_players``."""
+    
+    def test_least_recently_used(self):
+        """``get`` refreshes a player and ``peek`` does not."""
+        model = OpponentModel(max_players=3)
+        for name in ("a", "b", "c"):
+            model.get(name)
+        model.get("a")
+        model.get("d")
+        self.assertEqual(len(model), 3)
+        self.assertNotIn("b", model)
+        
+        model.peek("c")
+        model.get("e")
+        self.assertNotIn("c", model)
+        self.assertEqual([name for name in "abcde" if name in model], ["a", "d", "e"])
+    
+    def test_statistics_survive_refresh(self):
+        """Refreshing a player keeps the same statistics object."""
+        model = OpponentModel(max_players=2)
+        stats = model.get("a")
+        stats.vpip.observe(True, model.decay)
+        model.get("b")
+        self.assertIs(model.get("a"), stats)
+        model.get("c")
+        self.assertIs(model.peek("a"), stats)
+        self.assertIsNone(model.peek("b"))
+        self.assertIsNone(model.peek("z"))
+        self.assertNotIn("z", model)
+
+
+class TestTableObserver(unittest.TestCase):
+    """A watched game feeds its actions into the model."""
+    
+    def test_raised_pot_to_showdown(self):
+        """A raise and a call preflop, then checks to showdown."""
+        game, dealer, other, _ = heads_up(dealer_script=["call", "check", "check", "check"],
+                                          other_script=["raise", 60, "check", "check", "check"])
+        model = OpponentModel()
+        observer = model.watch(game)
+        play(game)
+        
+        raiser, caller = model.peek("Other"), model.peek("Dealer")
+        self.assertEqual((raiser.vpip.rate(), raiser.pfr.rate()), (1.0, 1.0))
+        self.assertEqual((caller.vpip.rate(), caller.pfr.rate()), (1.0, 0.0))
+        self.assertEqual(caller.fold_to_bet.samples, 1.0)
+        self.assertEqual(caller.fold_to_bet.rate(), 0.0)
+        self.assertEqual((raiser.showdown.rate(), caller.showdown.rate()), (1.0, 1.0))
+        self.assertEqual(raiser.aggression_factor(), 1.0)
+        self.assertEqual(observer.last_aggressor, "Other")
+        self.assertEqual(observer.live_opponents("Dealer"), [raiser])
+    
+    def test_fold_to_the_blind(self):
+        """A preflop fold counts against the folder's fold-to-bet, not the big blind's VPIP."""
+        game, dealer, other, _ = heads_up(other_script=["fold"])
+        model = OpponentModel()
+        observer = model.watch(game)
+        play(game)
+        
+        folder, blind = model.peek("Other"), model.peek("Dealer")
+        self.assertEqual((folder.fold_to_bet.rate(), folder.vpip.rate()), (1.0, 0.0))
+        self.assertEqual((blind.vpip.samples, blind.vpip.rate()), (1.0, 0.0))
+        self.assertEqual(blind.showdown.samples, 0.0)
+        self.assertEqual(observer.live_opponents("Dealer"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
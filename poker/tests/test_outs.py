@@ -0,0 +1,90 @@
+"""
+Tests for the outs calculator against brute-force evaluation.
+"""
+import itertools
+import math
+import random
+import unittest
+
+from poker_game.evaluator import evaluate, parse_cards
+from poker_game.outs import draw_odds, outs
+
+
+def brute_outs(hole, board):
+    """Evaluate every unseen card as the next card and group the improving ones."""
+    known = list(hole) + list(board)
+    current = evaluate(known) >> 20
+    found = {}
+    for card in range(52):
+        if card not in known:
+            category = evaluate(known + [card]) >> 20
+            if category > current:
+                found.setdefault(category, []).append(card)
+    return found
+
+
+def random_spots(count: int, board_size: int, seed: int):
+    """Yield ``count`` random (hole, board) pairs."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        cards = rng.sample(range(52), 2 + board_size)
+        yield cards[:2], cards[2:]
+
+
+class TestOuts(unittest.TestCase):
+    """``outs`` and ``draw_odds`` agree with evaluating every card."""
+
+    def test_flop_outs(self):
+        """Random flops give the same outs as brute force."""
+        for hole, board in random_spots(500, 3, seed=1):
+            self.assertEqual(outs(hole, board), brute_outs(hole, board))
+
+    def test_turn_outs(self):
+        """Random turns give the same outs as brute force."""
+        for hole, board in random_spots(500, 4, seed=2):
+            self.assertEqual(outs(hole, board), brute_outs(hole, board))
+
+    def test_flush_draws(self):
+        """Four-card suits, where the suit of each out matters, match brute force."""
+        spots = ["AhKh Qh7h2c", "9s8s 7s6d2s", "5d4d 3d2cKd", "JcTc 9c8c2h", "AhQh 2h3h4d"]
+        for spot in spots:
+            hole, board = (parse_cards(part) for part in spot.split())
+            self.assertEqual(outs(hole, board), brute_outs(hole, board), spot)
+
+    def test_exact_runouts(self):
+        """Exact flop odds match enumerating every turn and river."""
+        for hole, board in random_spots(20, 3, seed=3):
+            known = hole + board
+            current = evaluate(known) >> 20
+            deck = [card for card in range(52) if card not in known]
+            counts = [0] * 11
+            for runout in itertools.combinations(deck, 2):
+                counts[evaluate(known + list(runout)) >> 20] += 1
+            total = math.comb(len(deck), 2)
+            expected = {}
+            for category in range(current + 1, 11):
+                reached = sum(counts[category:])
+                if reached:
+                    expected[category] = reached / total
+            odds = draw_odds(hole, board, exact=True)
+            self.assertEqual(odds.by_river.keys(), expected.keys())
+            for category, chance in expected.items():
+                self.assertAlmostEqual(odds.by_river[category], chance)
+
+    def test_next_card_odds(self):
+        """The next-card chance of each category counts its outs and every better one."""
+        for hole, board in random_spots(100, 4, seed=4):
+            found = brute_outs(hole, board)
+            odds = draw_odds(hole, board)
+            for category, chance in odds.next_card.items():
+                hits = sum(len(cards) for made, cards in found.items() if made >= category)
+                self.assertAlmostEqual(chance, hits / 46)
+
+    def test_river_is_rejected(self):
+        """Outs are only defined with cards still to come."""
+        with self.assertRaises(ValueError):
+            outs(parse_cards("AhKh"), parse_cards("Qh7h2c3d4s"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Tests for the poker server and client speaking the JSON line protocol.
+"""
+import asyncio
+import os
+import tempfile
+import unittest
+
+from poker_game.client import PokerClient
+from poker_game.protocol import ProtocolError, decode, encode
+from poker_game.server import PokerServer
+
+
+class TestProtocol(unittest.TestCase):
+    """Encoding and decoding single messages."""
+    
+    def test_round_trip(self):
+        """A message survives encoding as one line."""
+        message = {"type": "act", "id": 3, "options": ["check", "raise"], "board": ["Ah", "Td", "2c"]}
+        line = encode(message)
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertEqual(line.count(b"\n"), 1)
+        self.assertEqual(decode(line), message)
+    
+    def test_malformed(self):
+        """Lines that are not JSON objects with a type are protocol errors."""
+        for line in (b"not json\n", b"[1, 2]\n", b'{"name": "x"}\n', b'{"type": 1}\n'):
+            with self.assertRaises(ProtocolError):
+                decode(line)
+
+
+class TestServer(unittest.TestCase):
+    """Clients playing whole tables against in-process AIs over a Unix socket."""
+    
+    def setUp(self):
+        """Pick a socket path that is cleaned up afterwards."""
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.path = os.path.join(folder.name, "poker.sock")
+    
+    def run_server(self, scenario, **options):
+        """Run a coroutine against a server listening on the socket."""
+        async def main():
+            server = PokerServer(**options)
+            await server.start_unix(self.path)
+            try:
+                return await asyncio.wait_for(scenario(), 30)
+            finally:
+                await server.close()
+        
+        return asyncio.run(main())
+    
+    def test_clients_play_to_game_over(self):
+        """Two tables of calling stations play their hands and every chip is accounted for."""
+        async def scenario():
+            seen = {name: [] for name in ("Ann", "Bob", "Cat", "Dan")}
+            clients = [PokerClient(name, on_message=seen[name].append) for name in seen]
+            for client in clients:
+                await client.connect_unix(self.path)
+            results = await asyncio.gather(*(client.play() for client in clients))
+            for client in clients:
+                await client.close()
+            return clients, results, seen
+        
+        clients, results, seen = self.run_server(scenario, ai_players=1, humans_per_table=2, max_hands=3)
+        self.assertEqual({client.table for client in clients}, {1, 2})
+        for client, result in zip(clients, results):
+            messages = seen[client.name]
+            self.assertEqual(result["type"], "game_over")
+            self.assertEqual(client.hands_seen, result["hands"])
+            self.assertEqual(messages[0]["type"], "welcome")
+            self.assertEqual(len(messages[0]["players"]), 3)
+            # Hole cards go only to their owner, two per hand they still have chips for
+            dealt_in = sum(m["type"] == "hand_start" and client.name in m["chips"] for m in messages)
+            self.assertTrue(all(len(m["cards"]) == 2 for m in messages if m["type"] == "hole_cards"))
+            self.assertEqual(sum(m["type"] == "hole_cards" for m in messages), dealt_in)
+            last_hand = [m for m in messages if m["type"] == "hand_end"][-1]
+            self.assertEqual(sum(last_hand["chips"].values()), 3000)
+            self.assertEqual(last_hand["chips"].get(client.name, 0), result["chips"])
+            if result["hands"] < 3:
+                # A table stops early once it is down to one player or none of its clients has chips
+                holding = [name for name, chips in last_hand["chips"].items() if chips]
+                clients_left = [r for other, r in zip(clients, results) if other.table == client.table and r["chips"]]
+                self.assertTrue(len(holding) < 2 or not clients_left)
+    
+    def test_bad_lines_are_answered(self):
+        """Malformed and overlong lines get an error reply and the seat keeps playing."""
+        async def scenario():
+            reader, writer = await asyncio.open_unix_connection(self.path, limit=2 ** 16)
+            
+            async def next_message(kind):
+                while True:
+                    message = decode(await reader.readline())
+                    if message["type"] in (kind, "game_over"):
+                        return message
+            
+            writer.write(encode({"type": "join", "name": "Eve"}))
+            request = await next_message("act")
+            replies = []
+            for line in (b"not json\n", b"x" * (2 ** 17) + b"\n"):
+                writer.write(line)
+                await writer.drain()
+                replies.append(await next_message("error"))
+            
+            while request["type"] != "game_over":
+                if request["type"] == "act":
+                    action = "call" if "call" in request["options"] else "check"
+                    writer.write(encode({"type": "action", "id": request["id"], "action": action}))
+                    await writer.drain()
+                request = decode(await reader.readline())
+            result = request
+            writer.close()
+            await writer.wait_closed()
+            return replies, result
+        
+        # The AI may fold before Eve acts, but Eve opens the second hand (unless she went bust)
+        replies, result = self.run_server(scenario, ai_players=1, max_hands=2)
+        self.assertTrue(replies[0]["message"].startswith("Invalid JSON"))
+        self.assertEqual(replies[1]["message"], "Message too long")
+        self.assertIn(result["hands"], (1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
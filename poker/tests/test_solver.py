@@ -0,0 +1,131 @@
+"""
+Tests for the heads-up CFR solver and CFRPlayer.
+"""
+import os
+import random
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+from poker_game.game import PokerGame
+
+if np is not None:
+    from poker_game.solver import CFRPlayer, CFRSolver, Policy, SolverConfig, _Trainer
+
+SMALL = SolverConfig(buckets=4) if np is not None else None
+
+
+class RecordingPolicy(Policy if np is not None else object):
+    """A policy that remembers the position of every decision it is asked about."""
+    
+    def __init__(self, policy):
+        """Copy a trained policy."""
+        super().__init__(policy.config, policy.strategy)
+        self.positions = []
+    
+    def probabilities(self, position, street, bucket, raises, facing, actions):
+        """Record the position and street, then answer as usual."""
+        self.positions.append((street, position))
+        return super().probabilities(position, street, bucket, raises, facing, actions)
+
+
+@unittest.skipIf(np is None, "the solver needs NumPy")
+class TestSolver(unittest.TestCase):
+    """Training, checkpoints and playing a trained policy."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Train one small solver for all the tests."""
+        cls.solver = CFRSolver(SMALL)
+        cls.solver.train(300, batch=100, seed=1)
+    
+    def test_training(self):
+        """Training counts its iterations and leaves a normalised average strategy."""
+        self.assertEqual(self.solver.iterations, 300)
+        self.assertTrue(np.any(self.solver.regrets))
+        strategy = self.solver.average_strategy()
+        totals = strategy.sum(axis=-1)
+        reached = totals > 0
+        self.assertTrue(np.any(reached))
+        np.testing.assert_allclose(totals[reached], 1.0)
+        # The small blind's opening decision is reached in every hand, with every bucket
+        self.assertTrue(np.all(reached[0, 0, :, 0, 1]))
+    
+    def test_seeded_training_repeats(self):
+        """The same seed gives the same tables."""
+        other = CFRSolver(SMALL)
+        other.train(300, batch=100, seed=1)
+        np.testing.assert_array_equal(other.regrets, self.solver.regrets)
+        np.testing.assert_array_equal(other.strategy_sums, self.solver.strategy_sums)
+    
+    def test_checkpoint_round_trip(self):
+        """A saved solver loads with the same tables, iterations and config."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "nested", "policy.npz")
+            self.solver.save(path)
+            loaded = CFRSolver.load(path)
+            self.assertEqual(os.listdir(os.path.dirname(path)), ["policy.npz"])
+            policy = Policy.load(path)
+        self.assertEqual(loaded.config, self.solver.config)
+        self.assertEqual(loaded.iterations, self.solver.iterations)
+        np.testing.assert_array_equal(loaded.regrets, self.solver.regrets)
+        np.testing.assert_array_equal(loaded.strategy_sums, self.solver.strategy_sums)
+        np.testing.assert_array_equal(policy.strategy, self.solver.average_strategy())
+    
+    def test_small_blind_acts_first_after_the_flop(self):
+        """The abstract game, like ``PokerGame``, starts every street with the small blind."""
+        first_actors = set()
+        
+        class Recording(_Trainer):
+            def _walk(self, traverser, street, committed, actor, raises, acted):
+                """Note who opens each street after the flop."""
+                if street and not acted:
+                    first_actors.add(actor)
+                return super()._walk(traverser, street, committed, actor, raises, acted)
+        
+        trainer = Recording(SMALL, [0.0] * int(np.prod(SMALL.shape)), random.Random(0))
+        for _ in range(50):
+            trainer.iterate()
+        self.assertEqual(first_actors, {0})
+    
+    def test_cfr_players_in_play_hand(self):
+        """CFRPlayers play whole hands, acting in the seat their blind implies."""
+        for watched in (True, False):
+            with self.subTest(watched=watched):
+                players = [CFRPlayer(name, policy=RecordingPolicy(self.solver.policy())) for name in ("A", "B")]
+                game = PokerGame(players=players, verbose=False)
+                if watched:
+                    for player in players:
+                        player.watch(game)
+                small_blinds = []
+                acted = []
+                
+                def listen(event, data):
+                    if event == "hand_start":
+                        small_blinds.append(None)
+                    elif event == "blind" and small_blinds[-1] is None:
+                        small_blinds[-1] = data["player"]
+                    elif event == "action":
+                        acted.append((len(small_blinds) - 1, data["player"]))
+                
+                game.add_listener(listen)
+                for _ in range(30):
+                    if sum(player.chips > 0 for player in players) < 2:
+                        break
+                    game.play_hand()
+                    game.advance_to_next_hand()
+                self.assertEqual(sum(player.chips for player in players), 2000)
+                
+                # Each player's recorded positions follow its blind, hand by hand
+                decisions = {player: iter(player.policy.positions) for player in players}
+                for hand, player in acted:
+                    street, position = next(decisions[player])
+                    self.assertEqual(position, 0 if small_blinds[hand] is player else 1, (hand, street))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,15 +3,15 @@
 # Format and lint the Tina project
 
 echo "🔧 Running isort to sort imports..."
-poetry run isort tina/
+poetry run isort tina/ tests/
 
 echo "🎨 Running black to format code..."
-poetry run black tina/
+poetry run black tina/ tests/
 
 echo "🔍 Running flake8 to check for style issues..."
-poetry run flake8 tina/
+poetry run flake8 tina/ tests/
 
 echo "🏷️  Running mypy for type checking..."
-poetry run mypy tina/
+poetry run mypy tina/ tests/
 
 echo "✅ Linting and formatting complete!"
@@ -0,0 +1 @@
+# Tests for the tina patterns and backends; run with python -m unittest
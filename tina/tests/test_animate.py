@@ -0,0 +1,134 @@
+import importlib
+import os
+import random
+import struct
+import tempfile
+import unittest
+from typing import List, Tuple
+
+import numpy as np
+
+from tests.test_rendering import read_png
+from tina.animate import animate
+from tina.geometry import PATTERNS
+from tina.raster import Pixels, lzw, render_shapes
+
+SCALE = 0.5
+
+
+def unlzw(data: bytes, min_code_size: int) -> bytes:
+    # A plain GIF LZW decoder, written from the format rather than the encoder
+    clear = 1 << min_code_size
+    end = clear + 1
+    code_size = min_code_size + 1
+    table: List[bytes] = []
+    previous = -1
+    out = bytearray()
+    position = 0
+    while True:
+        byte, bit = divmod(position, 8)
+        code = int.from_bytes(data[byte : byte + 3], "little") >> bit
+        code &= (1 << code_size) - 1
+        position += code_size
+        if code == clear:
+            table = [bytes([i]) for i in range(clear)] + [b"", b""]
+            code_size = min_code_size + 1
+            previous = -1
+            continue
+        if code == end:
+            return bytes(out)
+        if previous < 0:
+            entry = table[code]
+        else:
+            if code < len(table):
+                entry = table[code]
+            else:
+                entry = table[previous] + table[previous][:1]
+            if len(table) < 4096:
+                table.append(table[previous] + entry[:1])
+        out += entry
+        previous = code
+        if len(table) == 1 << code_size and code_size < 12:
+            code_size += 1
+
+
+def read_gif(path: str) -> List[Pixels]:
+    # Every frame of a GIF as GifWriter produces it: a global palette, and
+    # frames that are drawn over the earlier ones
+    with open(path, "rb") as f:
+        data = f.read()
+    assert data[:6] == b"GIF89a"
+    width, height, flags = struct.unpack("<HHB", data[6:11])
+    colors = 1 << ((flags & 7) + 1)
+    palette = np.frombuffer(data[13 : 13 + 3 * colors], dtype=np.uint8)
+    palette = palette.reshape(colors, 3)
+    canvas = np.zeros((height, width, 3), dtype=np.uint8)
+    frames = []
+    offset = 13 + 3 * colors
+
+    def blocks() -> bytes:
+        nonlocal offset
+        chunks = []
+        while data[offset]:
+            chunks.append(data[offset + 1 : offset + 1 + data[offset]])
+            offset += data[offset] + 1
+        offset += 1
+        return b"".join(chunks)
+
+    while data[offset] != 0x3B:
+        if data[offset] == 0x21:
+            offset += 2
+            blocks()
+            continue
+        assert data[offset] == 0x2C
+        left, top, w, h, _ = struct.unpack("<HHHHB", data[offset + 1 : offset + 10])
+        min_code_size = data[offset + 10]
+        offset += 11
+        indices = np.frombuffer(unlzw(blocks(), min_code_size), dtype=np.uint8)
+        canvas[top : top + h, left : left + w] = palette[indices].reshape(h, w, 3)
+        frames.append(canvas.copy())
+    return frames
+
+
+class LzwTest(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        rng = random.Random(1)
+        cases: List[Tuple[bytes, int]] = [
+            (b"", 2),
+            (b"\x00", 2),
+            (b"\x01\x01\x01\x01\x01\x01\x01", 2),
+            (bytes(rng.randrange(4) for _ in range(5000)), 2),
+            # Long enough to fill the code table and start it again
+            (bytes(rng.randrange(256) for _ in range(20000)), 8),
+            (bytes(rng.randrange(3) for _ in range(100000)), 2),
+        ]
+        for data, min_code_size in cases:
+            with self.subTest(length=len(data), min_code_size=min_code_size):
+                self.assertEqual(unlzw(lzw(data, min_code_size), min_code_size), data)
+
+
+class AnimateTest(unittest.TestCase):
+    def test_gif_ends_on_the_full_pattern(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            for pattern in PATTERNS:
+                with self.subTest(pattern=pattern):
+                    module = importlib.import_module(f"tina.{pattern}")
+                    expected = render_shapes(module.shapes(), SCALE).pixels
+                    output = os.path.join(folder, f"{pattern}.gif")
+                    count = animate(pattern, output, SCALE, per_frame=3)
+                    frames = read_gif(output)
+                    # A blank first frame, then one per step that drew
+                    # something
+                    self.assertLessEqual(len(frames), count + 1)
+                    np.testing.assert_array_equal(frames[0], 255)
+                    np.testing.assert_array_equal(frames[-1], expected)
+
+    def test_png_frames(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            output = os.path.join(folder, "frames", "%03d.png")
+            params = {"bricks_in_row": 5}
+            count = animate("brickwall", output, SCALE, per_frame=2, params=params)
+            self.assertEqual(len(os.listdir(os.path.dirname(output))), count)
+            module = importlib.import_module("tina.brickwall")
+            expected = render_shapes(module.shapes(**params), SCALE).pixels
+            np.testing.assert_array_equal(read_png(output % (count - 1)), expected)
@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+
+from tina.cli import grid_values, parameters, render_batch, variants
+
+
+class GridValuesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.kinds = parameters("brickwall")
+
+    def test_int_range_includes_stop(self) -> None:
+        self.assertEqual(
+            grid_values(self.kinds, "bricks_in_row", "4:10:2"), [4, 6, 8, 10]
+        )
+        self.assertEqual(grid_values(self.kinds, "bricks_in_row", "4:7"), [4, 5, 6, 7])
+
+    def test_float_range_includes_stop(self) -> None:
+        # The example in the help; 0.1 steps would drift past 0.6 without the slack
+        self.assertEqual(
+            grid_values(self.kinds, "size", "400:800:200"), [400, 600, 800]
+        )
+        values = grid_values(self.kinds, "stagger_ratio", "0.2:0.6:0.1")
+        self.assertEqual(len(values), 5)
+        self.assertAlmostEqual(values[-1], 0.6)
+        self.assertTrue(all(isinstance(value, float) for value in values))
+
+    def test_lists(self) -> None:
+        self.assertEqual(grid_values(self.kinds, "bricks_in_row", "3,5,9"), [3, 5, 9])
+        kinds = parameters("dottywotty")
+        self.assertEqual(grid_values(kinds, "text", "A:B,C"), ["A:B", "C"])
+
+    def test_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            grid_values(self.kinds, "bricks_in_row", "10:4:-2")
+        with self.assertRaises(ValueError):
+            grid_values(self.kinds, "bricks", "1,2")
+
+
+class VariantsTest(unittest.TestCase):
+    def test_grid_crossed_with_fixed(self) -> None:
+        batch = variants(
+            "brickwall", ["size=300"], ["bricks_in_row=4,6", "scale=1:2"], None
+        )
+        self.assertEqual(
+            batch,
+            [
+                {"size": 300.0, "bricks_in_row": 4, "scale": 1.0},
+                {"size": 300.0, "bricks_in_row": 4, "scale": 2.0},
+                {"size": 300.0, "bricks_in_row": 6, "scale": 1.0},
+                {"size": 300.0, "bricks_in_row": 6, "scale": 2.0},
+            ],
+        )
+
+    def test_csv_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            table = os.path.join(folder, "variants.csv")
+            with open(table, "w") as f:
+                f.write("text,cell_count\nHI,30\nOK,\n")
+            batch = variants("dottywotty", ["dot_size=5"], [], table)
+        self.assertEqual(
+            batch,
+            [
+                {"dot_size": 5.0, "text": "HI", "cell_count": 30},
+                {"dot_size": 5.0, "text": "OK"},
+            ],
+        )
+
+    def test_bad_assignments(self) -> None:
+        with self.assertRaises(ValueError):
+            variants("brickwall", ["bricks_in_row"], [], None)
+        with self.assertRaises(ValueError):
+            variants("brickwall", ["bricks_in_row=many"], [], None)
+
+
+class RenderBatchTest(unittest.TestCase):
+    def test_creates_output_folders(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            jobs = [
+                (
+                    {"cell_count": count, "text": "HI", "size": 60},
+                    f"{folder}/out/{i}.png",
+                )
+                for i, count in enumerate((20, 30))
+            ]
+            jobs.append(
+                ({"cell_count": 20, "text": "HI", "size": 60}, f"{folder}/svg/0.svg")
+            )
+            self.assertEqual(render_batch("dottywotty", jobs, processes=2), 2)
+            self.assertEqual(sorted(os.listdir(f"{folder}/out")), ["0.png", "1.png"])
+            self.assertEqual(os.listdir(f"{folder}/svg"), ["0.svg"])
+
+    def test_invalid_variant_writes_nothing(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            jobs = [
+                ({"text": text, "size": 60}, f"{folder}/{i}.png")
+                for i, text in enumerate(("HI", "@"))
+            ]
+            with self.assertRaises(ValueError):
+                render_batch("dottywotty", jobs, processes=2)
+            self.assertEqual(os.listdir(folder), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+import numpy as np
+
+from tina import dottywotty
+from tina.glyphs import (
+    GLYPH_HEIGHT,
+    GLYPH_WIDTH,
+    coords_mask,
+    glyph,
+    text_block,
+    text_mask,
+)
+
+
+class TextMaskTest(unittest.TestCase):
+    def test_shape_scale_and_centre(self) -> None:
+        # HI is 7 x 11 font pixels; 38 free cells fit it three times over,
+        # centred with the odd cell left over below and to the right
+        mask = text_mask("HI", 40)
+        self.assertEqual(mask.shape, (40, 40))
+        self.assertEqual(mask.dtype, np.bool_)
+        expected = np.zeros((40, 40), dtype=bool)
+        expected[9:30, 3:36] = np.kron(text_block("HI"), np.ones((3, 3), dtype=bool))
+        np.testing.assert_array_equal(mask, expected[::-1])
+
+    def test_orientation(self) -> None:
+        # Indexed [y, x] with y up from the bottom: the L's foot is its
+        # lowest row and its stem is on the left
+        mask = text_mask("L", 9)
+        rows = np.flatnonzero(mask.any(axis=1))
+        np.testing.assert_array_equal(mask[rows[0], 2:7], True)
+        np.testing.assert_array_equal(mask[rows[-1], 2:7], [True] + [False] * 4)
+        np.testing.assert_array_equal(mask[::-1][1:8, 2:7], glyph("L"))
+
+    def test_lines(self) -> None:
+        block = text_block("AB\nC")
+        self.assertEqual(block.shape, (2 * GLYPH_HEIGHT + 1, 2 * GLYPH_WIDTH + 1))
+        np.testing.assert_array_equal(
+            block[GLYPH_HEIGHT + 1 :, :GLYPH_WIDTH], glyph("c")
+        )
+
+    def test_does_not_fit(self) -> None:
+        with self.assertRaisesRegex(ValueError, "does not fit"):
+            text_mask("HELLO", 20)
+        with self.assertRaisesRegex(ValueError, "does not fit"):
+            text_mask("HI", 40, scale=4)
+        with self.assertRaisesRegex(ValueError, "does not fit"):
+            text_mask("I", 8, margin=1)
+        with self.assertRaisesRegex(ValueError, "No glyph"):
+            text_mask("@", 40)
+
+    def test_coords_mask(self) -> None:
+        mask = coords_mask([(0, 0), (3, 1), (4, 0), (-1, 2)], 4)
+        self.assertEqual(list(zip(*np.nonzero(mask))), [(0, 0), (1, 3)])
+
+    def test_dots_skip_the_letters(self) -> None:
+        mask = dottywotty.letter_mask(30, "HI")
+        dots = dottywotty.dots(30, text="HI", size=300)
+        self.assertEqual(len(dots), 30 * 30 - mask.sum())
+        cells = (dots[:, :2] // 10).astype(int)
+        self.assertFalse(mask[cells[:, 1], cells[:, 0]].any())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import importlib
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+
+import numpy as np
+
+from tina.geometry import PATTERNS
+from tina.raster import Pixels, render, render_shapes
+from tina.tiles import render_tiled
+
+SCALE = 1.5
+
+
+def read_png(path: str) -> Pixels:
+    # Only what PngWriter produces: 8-bit RGB, every row with filter type 0
+    with open(path, "rb") as f:
+        data = f.read()
+    offset, width, height, chunks = 8, 0, 0, []
+    while offset < len(data):
+        (length,) = struct.unpack(">I", data[offset : offset + 4])
+        kind = data[offset + 4 : offset + 8]
+        body = data[offset + 8 : offset + 8 + length]
+        if kind == b"IHDR":
+            width, height = struct.unpack(">II", body[:8])
+        elif kind == b"IDAT":
+            chunks.append(body)
+        offset += length + 12
+    rows = np.frombuffer(zlib.decompress(b"".join(chunks)), dtype=np.uint8)
+    return rows.reshape(height, width * 3 + 1)[:, 1:].reshape(height, width, 3)
+
+
+class RenderingTest(unittest.TestCase):
+    def test_bulk_matches_turtle(self) -> None:
+        # Drawing the shapes in bulk gives exactly the turtle replay's pixels
+        for pattern in PATTERNS:
+            with self.subTest(pattern=pattern):
+                module = importlib.import_module(f"tina.{pattern}")
+                turtle = render(module.draw, module.size, module.size, SCALE)
+                bulk = render_shapes(module.shapes(), SCALE)
+                np.testing.assert_array_equal(bulk.pixels, turtle.pixels)
+
+    def test_tiles_match_single_canvas(self) -> None:
+        # Tiles smaller than the image, which does not divide into them evenly
+        with tempfile.TemporaryDirectory() as folder:
+            for pattern in PATTERNS:
+                module = importlib.import_module(f"tina.{pattern}")
+                expected = render_shapes(module.shapes(), SCALE).pixels
+                for name in ("tiles.npy", "tiles.png"):
+                    with self.subTest(pattern=pattern, output=name):
+                        output = os.path.join(folder, name)
+                        render_tiled(pattern, output, SCALE, tile=97, processes=2)
+                        if name.endswith(".npy"):
+                            pixels = np.load(output)
+                        else:
+                            pixels = read_png(output)
+                        np.testing.assert_array_equal(pixels, expected)
+
+    def test_tiles_with_parameters(self) -> None:
+        # Parameters, including the size, reach the workers
+        params = {"bricks_in_row": 7, "size": 300}
+        module = importlib.import_module("tina.brickwall")
+        expected = render_shapes(module.shapes(**params), SCALE).pixels
+        with tempfile.TemporaryDirectory() as folder:
+            output = os.path.join(folder, "wall.npy")
+            size = render_tiled("brickwall", output, SCALE, 128, 2, params)
+            self.assertEqual(size, (450, 450))
+            np.testing.assert_array_equal(np.load(output), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
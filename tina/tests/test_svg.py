@@ -0,0 +1,95 @@
+import io
+import re
+import unittest
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, List, Set, Tuple
+
+from tina.svg import write_svg
+
+SVG = "{http://www.w3.org/2000/svg}"
+XLINK = "{http://www.w3.org/1999/xlink}"
+
+Cells = Set[Tuple[int, int]]
+
+
+def svg_root(pattern: str, params: Dict[str, Any], tiled: bool) -> ET.Element:
+    f = io.StringIO()
+    write_svg(f, pattern, params, tiled)
+    return ET.fromstring(f.getvalue())
+
+
+def path_boxes(d: str) -> List[Tuple[float, float, float, float]]:
+    # (x, y, width, height) of each "M x y h w v h h -w z" rectangle
+    number = r"(-?[\d.]+)"
+    box = rf"M{number} {number}h{number}v{number}h-[\d.]+z"
+    return [
+        (float(x), float(y), float(w), float(h)) for x, y, w, h in re.findall(box, d)
+    ]
+
+
+def box_cells(box: Tuple[float, float, float, float], s: float) -> Cells:
+    x, y, w, h = (round(v / s) for v in box)
+    return {(i, j) for i in range(x, x + w) for j in range(y, y + h)}
+
+
+def used_cells(root: ET.Element, ids: Set[str], s: float, offset: float = 0) -> Cells:
+    # The cell of every <use> of one of the given definitions, placed offset
+    # cells into it
+    return {
+        (
+            round(float(use.get("x", 0)) / s - offset),
+            round(float(use.get("y", 0)) / s - offset),
+        )
+        for use in root.iter(f"{SVG}use")
+        if use.get(f"{XLINK}href", "")[1:] in ids
+    }
+
+
+class SvgTest(unittest.TestCase):
+    def test_big_chessboard_is_one_tile(self) -> None:
+        f = io.StringIO()
+        write_svg(f, "chessboard", {"squares_on_axis": 1000})
+        self.assertLess(len(f.getvalue().encode()), 1024)
+        self.assertNotIn("<use", f.getvalue())
+
+    def test_chessboard_tiles_cover_the_same_squares(self) -> None:
+        for n in (8, 9):
+            s = 600 / n
+            tiled = svg_root("chessboard", {"squares_on_axis": n}, True)
+            (tile,) = tiled.iter(f"{SVG}pattern")
+            black = [p for p in tile if p.get("fill") == "black"]
+            in_tile: Cells = set()
+            for path in black:
+                for box in path_boxes(path.get("d", "")):
+                    in_tile |= box_cells(box, s)
+            tiled_cells = {
+                (i, j) for i in range(n) for j in range(n) if (i % 2, j % 2) in in_tile
+            }
+
+            flat = svg_root("chessboard", {"squares_on_axis": n}, False)
+            ids = {
+                rect.get("id", "")
+                for rect in flat.iter(f"{SVG}rect")
+                if rect.get("fill") == "#000000"
+            }
+            self.assertEqual(used_cells(flat, ids, s), tiled_cells, n)
+            self.assertEqual(len(tiled_cells), n * n // 2)
+
+    def test_dots_are_masked_like_the_letters(self) -> None:
+        for n, text in ((12, None), (30, "HI")):
+            params = {"cell_count": n, "text": text}
+            s = 600 / n
+            tiled = svg_root("dottywotty", params, True)
+            (mask,) = tiled.iter(f"{SVG}mask")
+            holes: Cells = set()
+            for path in mask.iter(f"{SVG}path"):
+                for box in path_boxes(path.get("d", "")):
+                    holes |= box_cells(box, s)
+
+            # Dots are centred in their cells
+            flat = svg_root("dottywotty", params, False)
+            ids = {c.get("id", "") for c in flat.iter(f"{SVG}circle")}
+            dots = used_cells(flat, ids, s, offset=0.5)
+            every = {(i, j) for i in range(n) for j in range(n)}
+            self.assertTrue(holes)
+            self.assertEqual(dots, every - holes)
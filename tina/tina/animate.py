@@ -0,0 +1,155 @@
+#! /usr/bin/env python3
+
+import argparse
+import importlib
+import math
+import os
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from tina.geometry import PARAMETERS, PATTERNS, Array, Shapes, make_shapes
+from tina.raster import Canvas, Color, GifWriter, to_color, write_png
+
+# left, top, width, height in pixels, from the top left of the image
+Window = Tuple[int, int, int, int]
+
+
+def _in_order(values: Array) -> Array:
+    # The distinct values in the order they first appear
+    unique, first = np.unique(values, return_index=True)
+    ordered: Array = unique[np.argsort(first)]
+    return ordered
+
+
+def steps(shapes: Shapes) -> List[Shapes]:
+    # The shapes in the groups the turtle scripts draw them in: a row of
+    # rects or dots at a time, and circles one by one
+    size = shapes.size
+    groups = []
+    for y in _in_order(shapes.rects[:, 1]):
+        row = shapes.rects[:, 1] == y
+        groups.append(
+            make_shapes(size, rects=shapes.rects[row], fills=shapes.fills[row])
+        )
+    for circle in shapes.circles:
+        groups.append(make_shapes(size, circles=circle[None]))
+    for y in _in_order(shapes.dots[:, 1]):
+        groups.append(make_shapes(size, dots=shapes.dots[shapes.dots[:, 1] == y]))
+    return groups
+
+
+def join(groups: Sequence[Shapes]) -> Shapes:
+    return Shapes(
+        groups[0].size,
+        np.concatenate([g.rects for g in groups]),
+        np.concatenate([g.fills for g in groups]),
+        np.concatenate([g.circles for g in groups]),
+        np.concatenate([g.dots for g in groups]),
+    )
+
+
+def bounds(canvas: Canvas, shapes: Shapes) -> Optional[Window]:
+    # The pixels that drawing the shapes can change, with room for the pen
+    x, y, w, h = shapes.rects.T
+    cx, cy, r = shapes.circles.T
+    dx, dy, d = shapes.dots.T
+    boxes = np.concatenate(
+        [
+            np.column_stack([x, y, x + w, y + h]),
+            np.column_stack([cx - r, cy - r, cx + r, cy + r]),
+            np.column_stack([dx - d / 2, dy - d / 2, dx + d / 2, dy + d / 2]),
+        ]
+    )
+    if not len(boxes):
+        return None
+    pad = max(1, round(canvas.scale)) + 1
+    low = boxes[:, :2].min(axis=0) * canvas.scale
+    high = boxes[:, 2:].max(axis=0) * canvas.scale
+    left = max(math.floor(low[0]) - pad, 0)
+    bottom = max(math.floor(low[1]) - pad, 0)
+    right = min(math.ceil(high[0]) + pad, canvas.width)
+    top = min(math.ceil(high[1]) + pad, canvas.height)
+    if left >= right or bottom >= top:
+        return None
+    return left, canvas.height - top, right - left, top - bottom
+
+
+def palette(shapes: Shapes) -> List[Color]:
+    colors = {(255, 255, 255), (0, 0, 0)}
+    for fill in shapes.fills:
+        if not np.isnan(fill[0]):
+            colors.add(to_color(*fill))
+    return sorted(colors)
+
+
+def animate(
+    pattern: str,
+    output: str,
+    scale: float = 1.0,
+    per_frame: int = 1,
+    fps: float = 10,
+    params: Optional[Dict[str, Any]] = None,
+) -> int:
+    # Draws the pattern a few groups at a time onto one canvas, so each frame
+    # only draws its new shapes. A GIF stores just the part of each frame
+    # that changed; an output with a % format, like frames/%04d.png, gets
+    # one full PNG per frame
+    module = importlib.import_module(f"tina.{pattern}")
+    shapes = module.shapes(**(params or {}))
+    canvas = Canvas(shapes.size, shapes.size, scale)
+    groups = steps(shapes)
+    frames = [join(groups[i : i + per_frame]) for i in range(0, len(groups), per_frame)]
+
+    gif = None
+    is_gif = output.lower().endswith(".gif")
+    directory = os.path.dirname(output if is_gif else output % 0)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if is_gif:
+        gif = GifWriter(output, canvas.width, canvas.height, palette(shapes))
+        gif.write(canvas.pixels, round(100 / fps))
+    for i, frame in enumerate(frames):
+        canvas.draw_shapes(frame)
+        if gif is None:
+            write_png(output % i, canvas.pixels)
+            continue
+        window = bounds(canvas, frame)
+        if window is not None:
+            left, top, width, height = window
+            pixels = canvas.pixels[top : top + height, left : left + width]
+            gif.write(pixels, round(100 / fps), left, top)
+    if gif is not None:
+        gif.close()
+    return len(frames)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Export the construction of a tina pattern as frames."
+    )
+    parser.add_argument("pattern", choices=PATTERNS)
+    parser.add_argument(
+        "-o", "--output", help="GIF file or numbered PNGs, e.g. frames/%%04d.png"
+    )
+    parser.add_argument("--scale", type=float, default=1.0, help="pixels per unit")
+    parser.add_argument("--per-frame", type=int, default=1, help="rows per frame")
+    parser.add_argument("--fps", type=float, default=10, help="GIF frames per second")
+    parser.add_argument("--value", type=int, help="the pattern's main parameter")
+    args = parser.parse_args()
+
+    params = {}
+    if args.value is not None:
+        params[PARAMETERS[args.pattern][0]] = args.value
+    output = args.output or f"{args.pattern}.gif"
+    if not output.lower().endswith(".gif") and "%" not in output:
+        parser.error("the output must be a GIF or contain a % frame number")
+    started = time.perf_counter()
+    count = animate(args.pattern, output, args.scale, args.per_frame, args.fps, params)
+    elapsed = time.perf_counter() - started
+    print(f"{output}: {count} frames in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+#! /usr/bin/env python3
+
+import argparse
+import importlib
+import io
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from tina.geometry import PARAMETERS, PATTERNS, Shapes
+
+# Values of each pattern's main parameter to time, from the default upwards
+VALUES: Dict[str, List[int]] = {
+    "brickwall": [8, 32, 128],
+    "chessboard": [8, 64, 256],
+    "dottywotty": [20, 100, 200],
+    "main": [15, 60, 240],
+}
+
+Backend = Callable[[str, Dict[str, Any], float], None]
+
+
+class Unavailable(Exception):
+    # A backend that cannot run here, like the turtle without a display
+    pass
+
+
+def variant(pattern: str, value: int) -> Dict[str, Any]:
+    params: Dict[str, Any] = {PARAMETERS[pattern][0]: value}
+    if pattern == "dottywotty":
+        # Keep the dots two thirds of a cell wide as the grid grows
+        module = importlib.import_module("tina.dottywotty")
+        params["dot_size"] = module.size / value * 2 / 3
+    return params
+
+
+def shapes_for(pattern: str, params: Dict[str, Any]) -> Shapes:
+    shapes: Shapes = importlib.import_module(f"tina.{pattern}").shapes(**params)
+    return shapes
+
+
+def primitives(shapes: Shapes) -> int:
+    return len(shapes.rects) + len(shapes.circles) + len(shapes.dots)
+
+
+def run_raster(pattern: str, params: Dict[str, Any], scale: float) -> None:
+    from tina.raster import render_shapes
+
+    render_shapes(shapes_for(pattern, params), scale)
+
+
+def run_raster_turtle(pattern: str, params: Dict[str, Any], scale: float) -> None:
+    from tina.raster import render
+    from tina.screen import draw_shapes
+
+    shapes = shapes_for(pattern, params)
+    render(lambda t: draw_shapes(t, shapes), shapes.size, shapes.size, scale)
+
+
+def run_pygame(pattern: str, params: Dict[str, Any], scale: float) -> None:
+    from tina.pygame_backend import headless, render_surface
+
+    headless()
+    render_surface(shapes_for(pattern, params), scale)
+
+
+def run_svg(pattern: str, params: Dict[str, Any], scale: float) -> None:
+    from tina.svg import write_svg
+
+    write_svg(io.StringIO(), pattern, params)
+
+
+def run_turtle(pattern: str, params: Dict[str, Any], scale: float) -> None:
+    # The fast path: tracing off and one update; needs Tk and a display.
+    # tkinter is only imported here, so the other backends run without it
+    import tkinter
+    import turtle
+
+    from tina.screen import draw_shapes
+
+    shapes = shapes_for(pattern, params)
+    try:
+        screen = turtle.Screen()
+        screen.clear()
+        screen.setworldcoordinates(0, 0, shapes.size, shapes.size)
+        screen.tracer(0, 0)
+        t = turtle.Turtle()
+        t.hideturtle()
+        draw_shapes(t, shapes)
+        screen.update()
+    except tkinter.TclError as e:
+        raise Unavailable(e) from e
+
+
+BACKENDS: Dict[str, Backend] = {
+    "raster": run_raster,
+    "raster-turtle": run_raster_turtle,
+    "pygame": run_pygame,
+    "svg": run_svg,
+    "turtle": run_turtle,
+}
+
+
+def measure(
+    backend: Backend, pattern: str, params: Dict[str, Any], scale: float, repeat: int
+) -> Dict[str, Any]:
+    # Best wall time of repeat runs, and the peak of Python and NumPy
+    # allocations in one more run (SDL and Tk memory is not counted)
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        backend(pattern, params, scale)
+        times.append(time.perf_counter() - started)
+    tracemalloc.start()
+    backend(pattern, params, scale)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    count = primitives(shapes_for(pattern, params))
+    best = min(times)
+    return {
+        "seconds": best,
+        "primitives": count,
+        "primitives_per_second": count / best,
+        "peak_bytes": peak,
+    }
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        commit: Optional[str] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+    }
+
+
+def compare(results: List[Dict[str, Any]], path: str) -> None:
+    with open(path) as f:
+        before = {
+            (r["pattern"], r["value"], r["backend"]): r
+            for r in json.load(f)["results"]
+            if "seconds" in r
+        }
+    for r in results:
+        old = before.get((r["pattern"], r["value"], r["backend"]))
+        if old is not None and "seconds" in r:
+            print(
+                f"{r['pattern']:<11} {r['value']:>5} {r['backend']:<14}"
+                f" {old['seconds'] / r['seconds']:>6.2f}x faster"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the tina rendering backends.")
+    parser.add_argument("--patterns", nargs="+", choices=PATTERNS, default=PATTERNS)
+    parser.add_argument(
+        "--backends", nargs="+", choices=list(BACKENDS), default=list(BACKENDS)
+    )
+    parser.add_argument(
+        "--values", type=int, nargs="+", help="main parameter values for every pattern"
+    )
+    parser.add_argument("--scale", type=float, default=1.0, help="pixels per unit")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON results from an earlier run")
+    args = parser.parse_args()
+
+    results: List[Dict[str, Any]] = []
+    skipped = set()
+    for pattern in args.patterns:
+        for value in args.values or VALUES[pattern]:
+            params = variant(pattern, value)
+            for name in args.backends:
+                if name in skipped:
+                    continue
+                case: Dict[str, Any] = {
+                    "pattern": pattern,
+                    "value": value,
+                    "backend": name,
+                }
+                try:
+                    case.update(
+                        measure(
+                            BACKENDS[name], pattern, params, args.scale, args.repeat
+                        )
+                    )
+                except (ImportError, Unavailable) as e:  # no Tk, pygame or display
+                    print(f"Skipping {name}: {e}")
+                    skipped.add(name)
+                    continue
+                results.append(case)
+                print(
+                    f"{pattern:<11} {value:>5} {name:<14}"
+                    f" {case['seconds'] * 1e3:>9.1f} ms"
+                    f" {case['primitives_per_second']:>12,.0f} prims/s"
+                    f" {case['peak_bytes'] / 2**20:>8.1f} MB"
+                )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {"environment": environment(), "scale": args.scale, "results": results},
+                f,
+                indent=2,
+            )
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
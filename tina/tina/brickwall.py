@@ -1,6 +1,12 @@
 #! /usr/bin/env python3
 
-import turtle
+from typing import Any
+
+import numpy as np
+
+from tina.geometry import Array, Shapes, make_shapes
+from tina.pen import Pen
+from tina.screen import run
 
 # Global Variables
 size = 600
@@ -11,7 +17,7 @@ brick_height = size / bricks_in_col
 stagger_ratio = 0.7
 
 
-def draw_brick(t: turtle.Turtle, w: float, h: float) -> None:
+def draw_brick(t: Pen, w: float, h: float) -> None:
     current_heading = t.heading()
 
     for x in [(90, h), (0, w), (-90, h), (180, w)]:
@@ -21,7 +27,7 @@ def draw_brick(t: turtle.Turtle, w: float, h: float) -> None:
     t.setheading(current_heading)
 
 
-def draw_row(t: turtle.Turtle, w: float, h: float, row_index: int) -> None:
+def draw_row(t: Pen, w: float, h: float, row_index: int) -> None:
     brick_count = bricks_in_row
 
     is_odd = row_index % 2 == 1
@@ -44,21 +50,46 @@ def draw_row(t: turtle.Turtle, w: float, h: float, row_index: int) -> None:
     t.pendown()
 
 
-def main() -> None:
-    screen = turtle.Screen()
-    screen.setup(width=size, height=size, startx=0, starty=0)
-    screen.screensize(size, size)
-    w, h = screen.screensize()
-    screen.setworldcoordinates(0, 0, w, h)
-
-    t = turtle.Turtle()
-    t.shape("turtle")
-    t.speed(0)
-
+def bricks(
+    bricks_in_row: int = bricks_in_row,
+    bricks_in_col: int = bricks_in_col,
+    stagger_ratio: float = stagger_ratio,
+    size: float = size,
+) -> Array:
+    # x, y, width, height of every brick, row by row from the bottom left.
+    # Each row is cut at offset + k brick widths and clipped to the wall, so
+    # odd rows start with a stagger_ratio brick and end with the remainder;
+    # even rows have a zero-width brick at the end, which is dropped
+    brick_width = size / bricks_in_row
+    brick_height = size / bricks_in_col
+    rows = np.arange(bricks_in_col)
+    offsets = np.where(rows % 2 == 1, stagger_ratio, 1.0)
+    cuts = np.arange(bricks_in_row + 2) - 1 + offsets[:, None]
+    edges = np.clip(cuts * brick_width, 0, size)
+    widths = np.diff(edges, axis=1)
+    ys = np.broadcast_to(rows[:, None] * brick_height, widths.shape)
+    keep = widths > 0
+    return np.column_stack(
+        [
+            edges[:, :-1][keep],
+            ys[keep],
+            widths[keep],
+            np.full(keep.sum(), brick_height),
+        ]
+    )
+
+
+def shapes(**params: Any) -> Shapes:
+    return make_shapes(params.get("size", size), rects=bricks(**params))
+
+
+def draw(t: Pen) -> None:
     for row_index in range(bricks_in_col):
         draw_row(t, brick_width, brick_height, row_index)
 
-    turtle.done()
+
+def main() -> None:
+    run(draw, size)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,12 @@
 #! /usr/bin/env python3
 
-import turtle
+from typing import Any
+
+import numpy as np
+
+from tina.geometry import Array, Shapes, make_shapes
+from tina.pen import Pen
+from tina.screen import run
 
 # Global variables
 size = 600
@@ -8,7 +14,7 @@ squares_on_axis = 8
 length_of_square_side = size / squares_on_axis
 
 
-def draw_square(t: turtle.Turtle, side_length: float, is_white: bool) -> None:
+def draw_square(t: Pen, side_length: float, is_white: bool) -> None:
     current_heading = t.heading()
 
     t.begin_poly()
@@ -29,7 +35,7 @@ def draw_square(t: turtle.Turtle, side_length: float, is_white: bool) -> None:
     t.setheading(current_heading)
 
 
-def draw_row_of_squares(t: turtle.Turtle, side_length: float, row_index: int) -> None:
+def draw_row_of_squares(t: Pen, side_length: float, row_index: int) -> None:
     for column_index in range(squares_on_axis):
         is_white = column_index % 2 == row_index % 2
         draw_square(t, side_length, is_white)
@@ -40,21 +46,34 @@ def draw_row_of_squares(t: turtle.Turtle, side_length: float, row_index: int) ->
     t.pendown()
 
 
-def main() -> None:
-    screen = turtle.Screen()
-    screen.setup(width=size, height=size, startx=0, starty=0)
-    screen.screensize(size, size)
-    w, h = screen.screensize()
-    screen.setworldcoordinates(0, 0, w, h)
+def squares(
+    squares_on_axis: int = squares_on_axis, size: float = size
+) -> tuple[Array, Array]:
+    # x, y, width, height of every square, row by row from the bottom left,
+    # and its fill colour: white where the row and column have equal parity
+    length_of_square_side = size / squares_on_axis
+    rows, columns = np.divmod(np.arange(squares_on_axis**2), squares_on_axis)
+    side = np.full(len(rows), length_of_square_side)
+    rects = np.column_stack(
+        [columns * length_of_square_side, rows * length_of_square_side, side, side]
+    )
+    is_white = columns % 2 == rows % 2
+    fills = np.repeat(is_white.astype(np.float64)[:, None], 3, axis=1)
+    return rects, fills
+
 
-    t = turtle.Turtle()
-    t.shape("turtle")
-    t.speed(0)
+def shapes(**params: Any) -> Shapes:
+    rects, fills = squares(**params)
+    return make_shapes(params.get("size", size), rects=rects, fills=fills)
 
+
+def draw(t: Pen) -> None:
     for row_index in range(squares_on_axis):
         draw_row_of_squares(t, length_of_square_side, row_index)
 
-    turtle.done()
+
+def main() -> None:
+    run(draw, size)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,223 @@
+#! /usr/bin/env python3
+
+import argparse
+import csv
+import importlib
+import inspect
+import itertools
+import multiprocessing
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from tina.geometry import PATTERNS, Shapes
+from tina.raster import render_shapes
+from tina.screen import add_mode_arguments, draw_shapes, show
+from tina.svg import write_svg
+
+Params = Dict[str, Any]
+
+# The function behind each pattern's shapes(); its keywords are the parameters
+GENERATORS: Dict[str, str] = {
+    "brickwall": "bricks",
+    "chessboard": "squares",
+    "dottywotty": "dots",
+    "main": "circles",
+}
+
+
+def parameters(pattern: str) -> Dict[str, Callable[[str], Any]]:
+    # Every parameter of the pattern, and how to read its value from text
+    module = importlib.import_module(f"tina.{pattern}")
+    signature = inspect.signature(getattr(module, GENERATORS[pattern]))
+    return {
+        name: p.annotation if p.annotation in (int, float) else str
+        for name, p in signature.parameters.items()
+    }
+
+
+def parse(kinds: Dict[str, Callable[[str], Any]], name: str, text: str) -> Any:
+    if name not in kinds:
+        raise ValueError(f"unknown parameter {name!r} (expected {', '.join(kinds)})")
+    return kinds[name](text)
+
+
+def assignments(items: List[str]) -> List[Tuple[str, str]]:
+    pairs = []
+    for item in items:
+        name, sep, text = item.partition("=")
+        if not sep:
+            raise ValueError(f"expected name=value, got {item!r}")
+        pairs.append((name, text))
+    return pairs
+
+
+def grid_values(
+    kinds: Dict[str, Callable[[str], Any]], name: str, text: str
+) -> List[Any]:
+    # Comma separated values, or start:stop[:step] for numbers, stop included
+    kind = kinds.get(name)
+    if ":" not in text or kind not in (int, float):
+        return [parse(kinds, name, value) for value in text.split(",")]
+    start, stop, step = (kind(v) for v in (text.split(":") + ["1"])[:3])
+    if step <= 0:
+        raise ValueError(f"the step of {name}={text} must be positive")
+    # Half a step past the stop keeps it despite floating point rounding
+    return [kind(v) for v in np.arange(start, stop + step / 2, step).tolist()]
+
+
+def variants(
+    pattern: str, fixed: List[str], grid: List[str], table: Optional[str]
+) -> List[Params]:
+    # The rows of the CSV, or a single variant without one, crossed with
+    # every combination of the grid values. Fixed parameters apply to all,
+    # and scale may be set like any parameter
+    kinds = parameters(pattern)
+    kinds["scale"] = float
+    base = {name: parse(kinds, name, text) for name, text in assignments(fixed)}
+
+    rows: List[Params] = [{}]
+    if table is not None:
+        with open(table, newline="") as f:
+            rows = [
+                {name: parse(kinds, name, text) for name, text in row.items() if text}
+                for row in csv.DictReader(f)
+            ]
+    names = [name for name, _ in assignments(grid)]
+    axes = [grid_values(kinds, name, text) for name, text in assignments(grid)]
+    return [
+        {**base, **row, **dict(zip(names, values))}
+        for row in rows
+        for values in itertools.product(*axes)
+    ]
+
+
+def output_name(pattern: str, template: Optional[str], index: int, v: Params) -> str:
+    # The template is formatted with the pattern, the variant's index and its
+    # parameters, e.g. out/{pattern}-{bricks_in_row}.png
+    if template is None:
+        suffix = "".join(f"-{name}{value}" for name, value in v.items())
+        return f"{pattern}{suffix}.png"
+    return template.format(pattern=pattern, index=index, **v)
+
+
+def save(pattern: str, params: Params, shapes: Shapes, scale: float, out: str) -> None:
+    folder = os.path.dirname(out)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    if out.lower().endswith(".svg"):
+        with open(out, "w") as f:
+            write_svg(f, pattern, params)
+    else:
+        render_shapes(shapes, scale).save(out)
+
+
+Task = Tuple[str, Params, Shapes, List[Tuple[float, str]]]
+
+
+def _render(task: Task) -> List[str]:
+    # One geometry and every output that uses it: variants that differ only
+    # in scale or file format share their shapes
+    pattern, params, shapes, outputs = task
+    for scale, out in outputs:
+        save(pattern, params, shapes, scale, out)
+    return [out for _, out in outputs]
+
+
+def render_batch(
+    pattern: str,
+    jobs: List[Tuple[Params, str]],
+    scale: float = 1.0,
+    processes: Optional[int] = None,
+) -> int:
+    # Renders every (variant, output) pair headlessly, grouped by geometry,
+    # across a process pool; returns the number of distinct geometries.
+    # Every geometry is built before any file is written, so an invalid
+    # variant fails the whole batch up front
+    groups: Dict[Tuple[Any, ...], Tuple[Params, List[Tuple[float, str]]]] = {}
+    for v, out in jobs:
+        params = {k: value for k, value in v.items() if k != "scale"}
+        key = tuple(sorted(params.items()))
+        groups.setdefault(key, (params, []))[1].append((v.get("scale", scale), out))
+    module = importlib.import_module(f"tina.{pattern}")
+    tasks: List[Task] = [
+        (pattern, params, module.shapes(**params), outputs)
+        for params, outputs in groups.values()
+    ]
+
+    if len(tasks) == 1:
+        _render(tasks[0])
+        return 1
+    with multiprocessing.Pool(processes) as pool:
+        for _ in pool.imap_unordered(_render, tasks):
+            pass
+    return len(tasks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Draw or render a tina pattern with any of its parameters."
+    )
+    parser.add_argument("pattern", choices=PATTERNS)
+    parser.add_argument(
+        "params", nargs="*", metavar="name=value", help="e.g. bricks_in_row=12"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="PNG or SVG file; in a batch a template like {pattern}-{index}.png",
+    )
+    parser.add_argument("--scale", type=float, default=1.0, help="pixels per unit")
+    parser.add_argument(
+        "--grid",
+        nargs="+",
+        default=[],
+        metavar="name=values",
+        help="render every combination, e.g. cell_count=20,40 size=400:800:200",
+    )
+    parser.add_argument("--csv", help="render one variant per row of this CSV file")
+    parser.add_argument("--processes", type=int, help="worker processes")
+    add_mode_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        batch = variants(args.pattern, args.params, args.grid, args.csv)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    if args.output is None and not args.grid and args.csv is None:
+        # Without an output, draw the one variant in a turtle window
+        params = {k: v for k, v in batch[0].items() if k != "scale"}
+        try:
+            shapes = importlib.import_module(f"tina.{args.pattern}").shapes(**params)
+        except ValueError as e:
+            parser.error(str(e))
+        size = round(shapes.size)
+        show(lambda t: draw_shapes(t, shapes), size, args.animate, args.every)
+        return
+
+    try:
+        names = [
+            output_name(args.pattern, args.output, i, v) for i, v in enumerate(batch)
+        ]
+    except (KeyError, IndexError) as e:
+        parser.error(f"bad output template: {e}")
+    if len(set(names)) < len(names):
+        parser.error("several variants would write the same file")
+
+    started = time.perf_counter()
+    try:
+        built = render_batch(
+            args.pattern, list(zip(batch, names)), args.scale, args.processes
+        )
+    except ValueError as e:
+        # e.g. text with no glyph, or too long for the grid
+        parser.error(str(e))
+    elapsed = time.perf_counter() - started
+    print(f"{len(names)} files from {built} geometries in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
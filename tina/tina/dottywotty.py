@@ -1,10 +1,18 @@
 #! /usr/bin/env python3
-import turtle
+from typing import Any, Optional
+
+import numpy as np
+
+from tina.geometry import Array, Shapes, make_shapes
+from tina.glyphs import Mask, coords_mask, text_mask
+from tina.pen import Pen
+from tina.screen import run
 
 size = 600
 cell_count = 20
 length_of_cell_side = size / cell_count
 dot_size = 20
+text: Optional[str] = None  # None leaves the J
 
 
 def make_J():
@@ -42,52 +50,47 @@ def make_J():
 J_coords = make_J()
 
 
-def draw_cell(
-    t: turtle.Turtle, side_length: float, dot_size: int, pos: tuple[int, int]
-) -> None:
-    if pos in J_coords:
-        return
-
-    current_heading = t.heading()
-    current_position = t.position()
-
-    for heading in [90, 0]:
-        t.setheading(heading)
-        t.forward(side_length / 2)
+def letter_mask(cell_count: int = cell_count, text: Optional[str] = text) -> Mask:
+    # The cells left without a dot: the hand-built J by default, clipped to
+    # smaller grids, or text from the bitmap font centred in the grid
+    if text is None:
+        return coords_mask(J_coords, cell_count)
+    return text_mask(text, cell_count)
 
-    t.pendown()
-    t.dot(dot_size)
-    t.penup()
-    t.setheading(current_heading)
-    t.goto(current_position)
 
+def dots(
+    cell_count: int = cell_count,
+    dot_size: float = dot_size,
+    text: Optional[str] = text,
+    size: float = size,
+) -> Array:
+    # Centre x, centre y, diameter of a dot in every cell outside the letters,
+    # row by row from the bottom left
+    length_of_cell_side = size / cell_count
+    rows, columns = np.nonzero(~letter_mask(cell_count, text))
+    return np.column_stack(
+        [
+            (columns + 0.5) * length_of_cell_side,
+            (rows + 0.5) * length_of_cell_side,
+            np.full(len(rows), dot_size),
+        ]
+    ).astype(np.float64)
 
-def draw_row(
-    t: turtle.Turtle, side_length: float, dot_size: int, row_index: int
-) -> None:
-    for column_index in range(cell_count):
-        draw_cell(t, side_length, dot_size, (column_index, row_index))
-        t.forward(side_length)
 
-    t.goto(0, side_length * (row_index + 1))
+def shapes(**params: Any) -> Shapes:
+    return make_shapes(params.get("size", size), dots=dots(**params))
 
 
-def main() -> None:
-    screen = turtle.Screen()
-    screen.setup(width=size, height=size, startx=0, starty=0)
-    screen.screensize(size, size)
-    w, h = screen.screensize()
-    screen.setworldcoordinates(0, 0, w, h)
-
-    t = turtle.Turtle()
-    t.shape("turtle")
-    t.speed(0)
+def draw(t: Pen) -> None:
     t.penup()
 
-    for row_index in range(cell_count):
-        draw_row(t, length_of_cell_side, dot_size, row_index)
+    for x, y, diameter in dots():
+        t.goto(x, y)
+        t.dot(diameter)
 
-    turtle.done()
+
+def main() -> None:
+    run(draw, size)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,114 @@
+#! /usr/bin/env python3
+
+import argparse
+import importlib
+import math
+import time
+from typing import Dict, List, NamedTuple, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+Array = npt.NDArray[np.float64]
+
+PATTERNS = ("brickwall", "chessboard", "dottywotty", "main")
+
+# The main parameter of each pattern's shapes(), and its smallest value
+PARAMETERS: Dict[str, Tuple[str, int]] = {
+    "brickwall": ("bricks_in_row", 1),
+    "chessboard": ("squares_on_axis", 1),
+    "dottywotty": ("cell_count", 1),
+    "main": ("num_circles", 1),
+}
+
+
+class Shapes(NamedTuple):
+    # Everything a pattern draws, in world coordinates on a size x size square
+    # with (0, 0) at the bottom left. Outlines are black with a width of 1.
+    size: float
+    rects: Array  # (n, 4): x, y, width, height; outlined
+    fills: Array  # (n, 3): rgb in [0, 1] per rect, NaN where it is not filled
+    circles: Array  # (m, 3): centre x, centre y, radius; outlined
+    dots: Array  # (k, 3): centre x, centre y, diameter; filled black
+
+
+def make_shapes(
+    size: float,
+    rects: Array | None = None,
+    fills: Array | None = None,
+    circles: Array | None = None,
+    dots: Array | None = None,
+) -> Shapes:
+    rects = np.empty((0, 4)) if rects is None else np.asarray(rects, dtype=np.float64)
+    if fills is None:
+        fills = np.full((len(rects), 3), np.nan)
+    return Shapes(
+        size,
+        rects,
+        np.asarray(fills, dtype=np.float64),
+        np.empty((0, 3)) if circles is None else np.asarray(circles, dtype=np.float64),
+        np.empty((0, 3)) if dots is None else np.asarray(dots, dtype=np.float64),
+    )
+
+
+def load(pattern: str) -> Shapes:
+    module = importlib.import_module(f"tina.{pattern}")
+    result: Shapes = module.shapes()
+    return result
+
+
+def circle_steps(radius: float) -> int:
+    # The number of chords turtle.Turtle.circle uses for a full circle
+    return 1 + int(min(11 + abs(radius) / 6.0, 59.0))
+
+
+def circle_points(x: float, y: float, radius: float) -> Array:
+    # The polygon turtle draws: it starts at the bottom and every vertex lies
+    # on the circle
+    steps = circle_steps(radius)
+    angles = np.radians(-90 + np.arange(steps + 1) * (360 / steps))
+    return np.column_stack([x + radius * np.cos(angles), y + radius * np.sin(angles)])
+
+
+def segments(s: Shapes) -> Tuple[Array, Array]:
+    # Every outline as (start, end) pairs of points, rects first
+    x, y, w, h = s.rects.T
+    corners = np.stack(
+        [
+            np.column_stack([x, y]),
+            np.column_stack([x, y + h]),
+            np.column_stack([x + w, y + h]),
+            np.column_stack([x + w, y]),
+            np.column_stack([x, y]),
+        ],
+        axis=1,
+    )
+    starts: List[Array] = [corners[:, :-1].reshape(-1, 2)]
+    ends: List[Array] = [corners[:, 1:].reshape(-1, 2)]
+    for cx, cy, r in s.circles:
+        points = circle_points(cx, cy, r)
+        starts.append(points[:-1])
+        ends.append(points[1:])
+    return np.concatenate(starts), np.concatenate(ends)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Summarise each pattern's geometry.")
+    parser.add_argument("patterns", nargs="*", default=list(PATTERNS))
+    args = parser.parse_args()
+
+    for pattern in args.patterns:
+        module = importlib.import_module(f"tina.{pattern}")
+        started = time.perf_counter()
+        s = module.shapes()
+        elapsed = time.perf_counter() - started
+        filled = int((~np.isnan(s.fills[:, 0])).sum())
+        print(
+            f"{pattern:<11} {len(s.rects):>4} rects ({filled} filled)"
+            f" {len(s.circles):>4} circles {len(s.dots):>4} dots"
+            f" {math.ceil(elapsed * 1e6):>6} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#! /usr/bin/env python3
+
+import argparse
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+Mask = npt.NDArray[np.bool_]
+
+GLYPH_WIDTH = 5
+GLYPH_HEIGHT = 7
+
+# A 5 x 7 bitmap font, one row per word from the top down
+FONT: Dict[str, str] = {
+    "A": ".###. #...# #...# ##### #...# #...# #...#",
+    "B": "####. #...# #...# ####. #...# #...# ####.",
+    "C": ".###. #...# #.... #.... #.... #...# .###.",
+    "D": "####. #...# #...# #...# #...# #...# ####.",
+    "E": "##### #.... #.... ####. #.... #.... #####",
+    "F": "##### #.... #.... ####. #.... #.... #....",
+    "G": ".###. #...# #.... #.### #...# #...# .####",
+    "H": "#...# #...# #...# ##### #...# #...# #...#",
+    "I": ".###. ..#.. ..#.. ..#.. ..#.. ..#.. .###.",
+    "J": "..### ...#. ...#. ...#. ...#. #..#. .##..",
+    "K": "#...# #..#. #.#.. ##... #.#.. #..#. #...#",
+    "L": "#.... #.... #.... #.... #.... #.... #####",
+    "M": "#...# ##.## #.#.# #.#.# #...# #...# #...#",
+    "N": "#...# #...# ##..# #.#.# #..## #...# #...#",
+    "O": ".###. #...# #...# #...# #...# #...# .###.",
+    "P": "####. #...# #...# ####. #.... #.... #....",
+    "Q": ".###. #...# #...# #...# #.#.# #..#. .##.#",
+    "R": "####. #...# #...# ####. #.#.. #..#. #...#",
+    "S": ".#### #.... #.... .###. ....# ....# ####.",
+    "T": "##### ..#.. ..#.. ..#.. ..#.. ..#.. ..#..",
+    "U": "#...# #...# #...# #...# #...# #...# .###.",
+    "V": "#...# #...# #...# #...# #...# .#.#. ..#..",
+    "W": "#...# #...# #...# #.#.# #.#.# #.#.# .#.#.",
+    "X": "#...# #...# .#.#. ..#.. .#.#. #...# #...#",
+    "Y": "#...# #...# .#.#. ..#.. ..#.. ..#.. ..#..",
+    "Z": "##### ....# ...#. ..#.. .#... #.... #####",
+    "0": ".###. #...# #..## #.#.# ##..# #...# .###.",
+    "1": "..#.. .##.. ..#.. ..#.. ..#.. ..#.. .###.",
+    "2": ".###. #...# ....# ...#. ..#.. .#... #####",
+    "3": "####. ....# ....# .###. ....# ....# ####.",
+    "4": "...#. ..##. .#.#. #..#. ##### ...#. ...#.",
+    "5": "##### #.... ####. ....# ....# #...# .###.",
+    "6": "..##. .#... #.... ####. #...# #...# .###.",
+    "7": "##### ....# ...#. ..#.. .#... .#... .#...",
+    "8": ".###. #...# #...# .###. #...# #...# .###.",
+    "9": ".###. #...# #...# .#### ....# ...#. .##..",
+    " ": "..... ..... ..... ..... ..... ..... .....",
+    ".": "..... ..... ..... ..... ..... .##.. .##..",
+    ",": "..... ..... ..... ..... .##.. ..#.. .#...",
+    "!": "..#.. ..#.. ..#.. ..#.. ..#.. ..... ..#..",
+    "?": ".###. #...# ....# ...#. ..#.. ..... ..#..",
+    "-": "..... ..... ..... ##### ..... ..... .....",
+    "'": "..#.. ..#.. .#... ..... ..... ..... .....",
+    ":": "..... .##.. .##.. ..... .##.. .##.. .....",
+}
+
+GLYPHS: Dict[str, Mask] = {
+    char: np.array([[c == "#" for c in row] for row in rows.split()])
+    for char, rows in FONT.items()
+}
+
+
+def glyph(char: str) -> Mask:
+    key = char.upper()
+    if key not in GLYPHS:
+        raise ValueError(f"No glyph for {char!r}")
+    return GLYPHS[key]
+
+
+def text_block(text: str) -> Mask:
+    # The text at one cell per font pixel, top row first, with a column
+    # between letters and a row between lines
+    lines = text.upper().split("\n")
+    columns = max(len(line) for line in lines) * (GLYPH_WIDTH + 1) - 1
+    rows = len(lines) * (GLYPH_HEIGHT + 1) - 1
+    block = np.zeros((rows, max(columns, 0)), dtype=bool)
+    for i, line in enumerate(lines):
+        top = i * (GLYPH_HEIGHT + 1)
+        for j, char in enumerate(line):
+            left = j * (GLYPH_WIDTH + 1)
+            block[top : top + GLYPH_HEIGHT, left : left + GLYPH_WIDTH] = glyph(char)
+    return block
+
+
+def text_mask(
+    text: str, cell_count: int, margin: int = 1, scale: Optional[int] = None
+) -> Mask:
+    # A cell_count x cell_count mask indexed [y, x] with y up from the bottom,
+    # like the dot grid, with the text centred and scaled by the largest whole
+    # factor that leaves margin free cells around it
+    block = text_block(text)
+    room = cell_count - 2 * margin
+    if scale is None:
+        scale = min(room // max(block.shape[0], 1), room // max(block.shape[1], 1))
+    if scale < 1 or max(block.shape) * scale > room:
+        raise ValueError(f"{text!r} does not fit a {cell_count} x {cell_count} grid")
+    scaled = np.kron(block, np.ones((scale, scale), dtype=bool))
+
+    mask = np.zeros((cell_count, cell_count), dtype=bool)
+    top = (cell_count - scaled.shape[0]) // 2
+    left = (cell_count - scaled.shape[1]) // 2
+    mask[top : top + scaled.shape[0], left : left + scaled.shape[1]] = scaled
+    flipped: Mask = mask[::-1]
+    return flipped
+
+
+def coords_mask(coords: Iterable[Tuple[int, int]], cell_count: int) -> Mask:
+    # A mask from (x, y) cells, dropping any outside the grid
+    mask = np.zeros((cell_count, cell_count), dtype=bool)
+    for x, y in coords:
+        if 0 <= x < cell_count and 0 <= y < cell_count:
+            mask[y, x] = True
+    return mask
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Print a text mask.")
+    parser.add_argument("text")
+    parser.add_argument("--cells", type=int, default=40, help="grid size")
+    parser.add_argument("--margin", type=int, default=1, help="free cells around")
+    args = parser.parse_args()
+
+    mask = text_mask(args.text.replace("\\n", "\n"), args.cells, args.margin)
+    for row in mask[::-1]:
+        print("".join("#" if cell else "." for cell in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,11 @@
 import math
-import turtle
+from typing import Any
+
+import numpy as np
+
+from tina.geometry import Array, Shapes, make_shapes
+from tina.pen import Pen
+from tina.screen import run
 
 num_circles = 15
 size = 1000
@@ -7,7 +13,7 @@ length_hyp = math.sqrt(2 * math.pow(size, 2))
 radius = length_hyp / num_circles / 2
 
 
-def circle_centered(t: turtle.Turtle, r: float) -> None:
+def circle_centered(t: Pen, r: float) -> None:
     # preserve state
     pos = t.position()
     heading = t.heading()
@@ -28,7 +34,7 @@ def circle_centered(t: turtle.Turtle, r: float) -> None:
         t.pendown()
 
 
-def draw_circle_line(t: turtle.Turtle, r: float) -> None:
+def draw_circle_line(t: Pen, r: float) -> None:
     for _ in range(num_circles):
         t.penup()
         t.forward(r * 2)
@@ -36,17 +42,23 @@ def draw_circle_line(t: turtle.Turtle, r: float) -> None:
         circle_centered(t, r)
 
 
-def main() -> None:
-    screen = turtle.Screen()
-    screen.setup(width=size, height=size, startx=0, starty=0)
-    screen.screensize(size, size)
-    w, h = screen.screensize()
-    screen.setworldcoordinates(0, 0, w, h)
+def circles(num_circles: int = num_circles, size: float = size) -> Array:
+    # Centre x, centre y, radius of every circle: num_circles touching
+    # circles along each diagonal, starting from the corners (0, 0) and
+    # (0, size)
+    radius = math.sqrt(2 * math.pow(size, 2)) / num_circles / 2
+    offsets = (2 * np.arange(num_circles) + 1) * radius * math.cos(math.radians(45))
+    up = np.column_stack([offsets, offsets])
+    down = np.column_stack([offsets, size - offsets])
+    centres = np.concatenate([up, down])
+    return np.column_stack([centres, np.full(len(centres), radius)])
+
 
-    t = turtle.Turtle()
-    t.shape("turtle")
-    t.speed(0)
+def shapes(**params: Any) -> Shapes:
+    return make_shapes(params.get("size", size), circles=circles(**params))
 
+
+def draw(t: Pen) -> None:
     t.penup()
     t.goto(0, 0)
     t.setheading(45)
@@ -55,13 +67,15 @@ def main() -> None:
     draw_circle_line(t, radius)
 
     t.penup()
-    t.goto(0, h)
+    t.goto(0, size)
     t.setheading(-45)
     t.backward(radius)
 
     draw_circle_line(t, radius)
 
-    turtle.done()
+
+def main() -> None:
+    run(draw, size)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,7 @@
+import turtle
+from typing import Union
+
+from tina.raster import RasterTurtle
+
+# Anything the pattern scripts can draw with
+Pen = Union[turtle.Turtle, RasterTurtle]
@@ -0,0 +1,150 @@
+#! /usr/bin/env python3
+
+import argparse
+import importlib
+import os
+import time
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+import pygame
+
+from tina.geometry import PARAMETERS, PATTERNS, Shapes, circle_points
+
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+
+
+def headless() -> None:
+    # The dummy video driver lets display calls work without a screen; it
+    # has to be chosen before the display is initialised
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+
+
+def to_screen(
+    points: npt.NDArray[np.float64], surface: pygame.Surface, size: float
+) -> npt.NDArray[np.int64]:
+    # The pixel a point falls in, as the raster backend picks it: world y runs
+    # up from the bottom left, and lines along the far edges of the world land
+    # on the last row or column
+    width, height = surface.get_size()
+    scale = width / size
+    xs = np.floor(np.round(points[..., 0] * scale, 9)).clip(0, width - 1)
+    ys = np.floor(np.round(points[..., 1] * scale, 9)).clip(0, height - 1)
+    return np.stack([xs, height - 1 - ys], axis=-1).astype(np.int64)
+
+
+def draw_shapes(surface: pygame.Surface, shapes: Shapes) -> None:
+    # All coordinates are converted up front in NumPy, leaving one pygame
+    # call per primitive
+    surface.fill(WHITE)
+    size = shapes.size
+    scale = surface.get_width() / size
+    line_width = max(1, round(scale))
+
+    x, y, w, h = shapes.rects.T
+    corners = to_screen(
+        np.stack(
+            [
+                np.column_stack([x, y]),
+                np.column_stack([x, y + h]),
+                np.column_stack([x + w, y + h]),
+                np.column_stack([x + w, y]),
+            ],
+            axis=1,
+        ),
+        surface,
+        size,
+    )
+    filled = ~np.isnan(shapes.fills[:, 0])
+    for box, fill in zip(corners[filled], np.round(shapes.fills[filled] * 255)):
+        left, top = box[1]
+        right, bottom = box[3]
+        surface.fill(fill.astype(int).tolist(), (left, top, right - left, bottom - top))
+    for box in corners.tolist():
+        pygame.draw.lines(surface, BLACK, True, box, line_width)
+
+    for cx, cy, r in shapes.circles:
+        points = to_screen(circle_points(cx, cy, r), surface, size)
+        pygame.draw.lines(surface, BLACK, True, points.tolist(), line_width)
+
+    centres = to_screen(shapes.dots[:, :2], surface, size).tolist()
+    for centre, diameter in zip(centres, shapes.dots[:, 2] * scale):
+        pygame.draw.circle(surface, BLACK, centre, diameter / 2)
+
+
+def render_surface(shapes: Shapes, scale: float = 1.0) -> pygame.Surface:
+    side = max(1, round(shapes.size * scale))
+    surface = pygame.Surface((side, side))
+    draw_shapes(surface, shapes)
+    return surface
+
+
+def run(pattern: str, scale: float = 1.0, value: Optional[int] = None) -> None:
+    # Up/Right and Down/Left change the pattern's main parameter; the pattern is
+    # redrawn and flipped to the display once per change
+    module = importlib.import_module(f"tina.{pattern}")
+    name, lowest = PARAMETERS[pattern]
+    if value is None:
+        value = int(getattr(module, name))
+
+    pygame.init()
+    side = max(1, round(module.size * scale))
+    screen = pygame.display.set_mode((side, side))
+    clock = pygame.time.Clock()
+    dirty = True
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                return
+            if event.type == pygame.KEYDOWN:
+                if event.key in (pygame.K_ESCAPE, pygame.K_q):
+                    pygame.quit()
+                    return
+                if event.key in (pygame.K_UP, pygame.K_RIGHT):
+                    value += 1
+                    dirty = True
+                elif event.key in (pygame.K_DOWN, pygame.K_LEFT):
+                    value = max(lowest, value - 1)
+                    dirty = True
+
+        if dirty:
+            started = time.perf_counter()
+            draw_shapes(screen, module.shapes(**{name: value}))
+            pygame.display.flip()
+            elapsed = (time.perf_counter() - started) * 1e3
+            pygame.display.set_caption(f"{pattern}: {name}={value} ({elapsed:.1f} ms)")
+            dirty = False
+        clock.tick(60)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Draw a tina pattern with pygame.")
+    parser.add_argument("pattern", choices=PATTERNS)
+    parser.add_argument("--scale", type=float, default=1.0, help="pixels per unit")
+    parser.add_argument(
+        "--value", type=int, help="starting value of the pattern's parameter"
+    )
+    parser.add_argument(
+        "-o", "--output", help="render offscreen to this image instead of a window"
+    )
+    args = parser.parse_args()
+
+    if args.output is None:
+        run(args.pattern, args.scale, args.value)
+        return
+
+    headless()
+    module = importlib.import_module(f"tina.{args.pattern}")
+    params = {}
+    if args.value is not None:
+        params[PARAMETERS[args.pattern][0]] = args.value
+    surface = render_surface(module.shapes(**params), args.scale)
+    pygame.image.save(surface, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,607 @@
+#! /usr/bin/env python3
+
+import argparse
+import importlib
+import math
+import struct
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from tina.geometry import PATTERNS, Shapes, segments
+
+Color = Tuple[int, int, int]
+Point = Tuple[float, float]
+Pixels = npt.NDArray[np.uint8]
+
+NAMED_COLORS = {
+    "black": (0, 0, 0),
+    "white": (255, 255, 255),
+    "red": (255, 0, 0),
+    "green": (0, 255, 0),
+    "blue": (0, 0, 255),
+    "yellow": (255, 255, 0),
+    "orange": (255, 165, 0),
+    "purple": (160, 32, 240),
+    "gray": (190, 190, 190),
+    "grey": (190, 190, 190),
+}
+
+
+def to_color(*args: Any) -> Color:
+    # Accepts what turtle's color methods do: a name, "#rrggbb", or r, g, b
+    # floats in [0, 1] (turtle's default colormode), separately or as a tuple
+    spec = args[0] if len(args) == 1 else args
+    if isinstance(spec, str):
+        if spec.startswith("#") and len(spec) == 7:
+            return (int(spec[1:3], 16), int(spec[3:5], 16), int(spec[5:7], 16))
+        return NAMED_COLORS[spec.lower()]
+    r, g, b = spec
+    return (round(r * 255), round(g * 255), round(b * 255))
+
+
+class PngWriter:
+    # Writes an RGB PNG a band of rows at a time, so the whole image never has
+    # to be in memory
+    def __init__(self, path: str, width: int, height: int) -> None:
+        self.width = width
+        self.file = open(path, "wb")
+        self.compressor = zlib.compressobj(6)
+        self.file.write(b"\x89PNG\r\n\x1a\n")
+        header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+        self._chunk(b"IHDR", header)
+
+    def _chunk(self, kind: bytes, data: bytes) -> None:
+        body = kind + data
+        self.file.write(struct.pack(">I", len(data)) + body)
+        self.file.write(struct.pack(">I", zlib.crc32(body)))
+
+    def write(self, pixels: Pixels) -> None:
+        # A few MB at a time, each row prefixed with filter type 0
+        step = max(1, (1 << 22) // (self.width * 3 + 1))
+        for start in range(0, len(pixels), step):
+            block = pixels[start : start + step]
+            rows = np.zeros((len(block), self.width * 3 + 1), dtype=np.uint8)
+            rows[:, 1:] = block.reshape(len(block), self.width * 3)
+            data = self.compressor.compress(rows.tobytes())
+            if data:
+                self._chunk(b"IDAT", data)
+
+    def close(self) -> None:
+        self._chunk(b"IDAT", self.compressor.flush())
+        self._chunk(b"IEND", b"")
+        self.file.close()
+
+
+def lzw(indices: bytes, min_code_size: int) -> bytes:
+    # GIF's variable-width LZW; the table is keyed by (prefix code, byte)
+    clear = 1 << min_code_size
+    end = clear + 1
+    out = bytearray()
+    bits = 0
+    count = 0
+    code_size = min_code_size + 1
+
+    def emit(code: int) -> None:
+        nonlocal bits, count
+        bits |= code << count
+        count += code_size
+        while count >= 8:
+            out.append(bits & 0xFF)
+            bits >>= 8
+            count -= 8
+
+    table: Dict[Tuple[int, int], int] = {}
+    next_code = end + 1
+    emit(clear)
+    prefix = indices[0] if indices else -1
+    for byte in indices[1:]:
+        code = table.get((prefix, byte))
+        if code is not None:
+            prefix = code
+            continue
+        emit(prefix)
+        if next_code < 4096:
+            table[(prefix, byte)] = next_code
+            next_code += 1
+            # The decoder adds each code one step later, so it widens when
+            # the next free code is one past the current width
+            if next_code > 1 << code_size and code_size < 12:
+                code_size += 1
+        else:
+            emit(clear)
+            table = {}
+            next_code = end + 1
+            code_size = min_code_size + 1
+        prefix = byte
+    if prefix >= 0:
+        emit(prefix)
+    emit(end)
+    if count:
+        out.append(bits & 0xFF)
+    return bytes(out)
+
+
+class GifWriter:
+    # An animated GIF with a fixed palette. Each frame can cover just the
+    # part of the image that changed; earlier frames stay underneath it
+    def __init__(
+        self, path: str, width: int, height: int, palette: Sequence[Color]
+    ) -> None:
+        if not 1 <= len(palette) <= 256:
+            raise ValueError("A GIF palette holds 1 to 256 colours")
+        self.width = width
+        self.height = height
+        self.depth = max(1, (len(palette) - 1).bit_length())
+        colors = np.zeros((1 << self.depth, 3), dtype=np.uint8)
+        colors[: len(palette)] = palette
+        # Pixels are looked up by their packed 24-bit colour
+        keys = colors[: len(palette)].astype(np.int64) @ np.array([1 << 16, 1 << 8, 1])
+        self._order = np.argsort(keys)
+        self._keys = keys[self._order]
+
+        self.file = open(path, "wb")
+        self.file.write(b"GIF89a")
+        self.file.write(
+            struct.pack("<HHBBB", width, height, 0xF0 | (self.depth - 1), 0, 0)
+        )
+        self.file.write(colors.tobytes())
+        # Loop forever
+        self.file.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")
+
+    def write(
+        self, pixels: Pixels, delay: int = 10, left: int = 0, top: int = 0
+    ) -> None:
+        # delay is in hundredths of a second
+        height, width, _ = pixels.shape
+        keys = pixels.reshape(-1, 3).astype(np.int64) @ np.array([1 << 16, 1 << 8, 1])
+        found = np.searchsorted(self._keys, keys).clip(0, len(self._keys) - 1)
+        if not (self._keys[found] == keys).all():
+            raise ValueError("The frame has colours that are not in the palette")
+        indices = self._order[found].astype(np.uint8).tobytes()
+
+        self.file.write(struct.pack("<BBBBHBB", 0x21, 0xF9, 4, 1 << 2, delay, 0, 0))
+        self.file.write(b"\x2c" + struct.pack("<HHHHB", left, top, width, height, 0))
+        min_code_size = max(2, self.depth)
+        data = lzw(indices, min_code_size)
+        self.file.write(bytes([min_code_size]))
+        for start in range(0, len(data), 255):
+            block = data[start : start + 255]
+            self.file.write(bytes([len(block)]) + block)
+        self.file.write(b"\x00")
+
+    def close(self) -> None:
+        self.file.write(b"\x3b")
+        self.file.close()
+
+
+def write_png(path: str, pixels: Pixels) -> None:
+    height, width, _ = pixels.shape
+    writer = PngWriter(path, width, height)
+    writer.write(pixels)
+    writer.close()
+
+
+class Canvas:
+    def __init__(
+        self,
+        width: float,
+        height: float,
+        scale: float = 1.0,
+        background: Color = (255, 255, 255),
+        window: Optional[Tuple[int, int, int, int]] = None,
+    ) -> None:
+        # World coordinates run from (0, 0) at the bottom left, like
+        # setworldcoordinates(0, 0, width, height) in the turtle scripts.
+        # A window (left, top, width, height in pixels, from the top left)
+        # holds just that part of the image, for rendering it in tiles
+        self.scale = scale
+        self.width = max(1, round(width * scale))
+        self.height = max(1, round(height * scale))
+        self.left, self.top, columns, rows = window or (0, 0, self.width, self.height)
+        self.pixels: Pixels = np.empty((rows, columns, 3), dtype=np.uint8)
+        self.pixels[:] = background
+
+    def _to_pixels(
+        self, xs: npt.NDArray[np.float64], ys: npt.NDArray[np.float64]
+    ) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.bool_]]:
+        # Rounding drops the residue of sin/cos, e.g. x = -1e-14 after heading 270
+        px = np.round(xs * self.scale, 9)
+        py = np.round(ys * self.scale, 9)
+        # Lines along the far edges of the world still land on the last pixel
+        columns = np.where(px == self.width, self.width - 1, np.floor(px)).astype(
+            np.int64
+        )
+        rows = np.where(py == self.height, self.height - 1, np.floor(py)).astype(
+            np.int64
+        )
+        rows = self.height - 1 - rows - self.top
+        columns = columns - self.left
+        return columns, rows, self._inside(columns, rows)
+
+    def _inside(
+        self, columns: npt.NDArray[np.int64], rows: npt.NDArray[np.int64]
+    ) -> npt.NDArray[np.bool_]:
+        height, width = self.pixels.shape[:2]
+        inside: npt.NDArray[np.bool_] = (
+            (columns >= 0) & (columns < width) & (rows >= 0) & (rows < height)
+        )
+        return inside
+
+    def _clip(
+        self, left: int, right: int, bottom: int, top: int
+    ) -> Optional[Tuple[int, int, int, int]]:
+        # Pixel bounds, counted up from the bottom left of the image, clipped
+        # to the part of the image this canvas holds
+        height, width = self.pixels.shape[:2]
+        floor = self.height - self.top - height
+        left, right = max(left, self.left), min(right, self.left + width)
+        bottom, top = max(bottom, floor), min(top, floor + height)
+        if left >= right or bottom >= top:
+            return None
+        return left, right, bottom, top
+
+    def _region(self, left: int, right: int, bottom: int, top: int) -> Pixels:
+        ceiling = self.height - self.top
+        return self.pixels[
+            ceiling - top : ceiling - bottom, left - self.left : right - self.left
+        ]
+
+    def polyline(self, points: Sequence[Point], color: Color, width: float = 1) -> None:
+        if len(points) < 2:
+            return
+        path = np.asarray(points, dtype=np.float64)
+        self.lines(path[:-1], path[1:], color, width)
+
+    def lines(
+        self,
+        starts: npt.NDArray[np.float64],
+        ends: npt.NDArray[np.float64],
+        color: Color,
+        width: float = 1,
+    ) -> None:
+        size = max(1, round(width * self.scale))
+        steps = ends - starts
+        lengths = np.hypot(steps[:, 0], steps[:, 1]) * self.scale
+        samples = np.ceil(lengths).astype(np.int64) + 1
+
+        # Only the samples that can touch this canvas, with a margin for the
+        # pen width: clip each segment's parameter range to the canvas
+        height, columns = self.pixels.shape[:2]
+        floor = self.height - self.top - height
+        pad = size + 1
+        low = (np.array([self.left, floor]) - pad) / self.scale
+        high = (np.array([self.left + columns, floor + height]) + pad) / self.scale
+        t0 = np.zeros(len(starts))
+        t1 = np.ones(len(starts))
+        for axis in (0, 1):
+            d = steps[:, axis]
+            for p, q in (
+                (-d, starts[:, axis] - low[axis]),
+                (d, high[axis] - starts[:, axis]),
+            ):
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    r = q / p
+                t0 = np.where(p < 0, np.maximum(t0, r), t0)
+                t1 = np.where(p > 0, np.minimum(t1, r), t1)
+                t1 = np.where((p == 0) & (q < 0), -1.0, t1)
+        first = np.ceil(t0 * (samples - 1)).astype(np.int64)
+        last = np.floor(t1 * (samples - 1)).astype(np.int64)
+        counts = np.where(t0 <= t1, np.maximum(last - first + 1, 0), 0)
+
+        # One sample per pixel along every segment, for all segments at once
+        segment = np.repeat(np.arange(len(starts)), counts)
+        offsets = (
+            np.arange(counts.sum())
+            - np.repeat(np.cumsum(counts) - counts, counts)
+            + first[segment]
+        )
+        fractions = offsets / np.maximum(samples[segment] - 1, 1)
+        xs = starts[segment, 0] + steps[segment, 0] * fractions
+        ys = starts[segment, 1] + steps[segment, 1] * fractions
+        self._stamp(xs, ys, color, size)
+
+    def _stamp(
+        self,
+        xs: npt.NDArray[np.float64],
+        ys: npt.NDArray[np.float64],
+        color: Color,
+        size: int,
+    ) -> None:
+        columns, rows, _ = self._to_pixels(xs, ys)
+        low = -(size // 2)
+        for dy in range(low, low + size):
+            for dx in range(low, low + size):
+                c = columns + dx
+                r = rows + dy
+                inside = self._inside(c, r)
+                self.pixels[r[inside], c[inside]] = color
+
+    def polygon(self, points: Sequence[Point], color: Color) -> None:
+        if len(points) < 3:
+            return
+        vertices = np.asarray(points, dtype=np.float64) * self.scale
+        left, bottom = np.floor(vertices.min(axis=0)).astype(int)
+        right, top = np.ceil(vertices.max(axis=0)).astype(int)
+        bounds = self._clip(left, right, bottom, top)
+        if bounds is None:
+            return
+        left, right, bottom, top = bounds
+
+        # Even-odd rule at pixel centres, one edge at a time
+        xs = np.arange(left, right) + 0.5
+        ys = np.arange(bottom, top) + 0.5
+        gx, gy = np.meshgrid(xs, ys)
+        inside = np.zeros(gx.shape, dtype=bool)
+        x1, y1 = vertices[-1]
+        for x2, y2 in vertices:
+            if y1 != y2:
+                crosses = (y1 > gy) != (y2 > gy)
+                at_x = x1 + (gy - y1) * (x2 - x1) / (y2 - y1)
+                inside ^= crosses & (gx < at_x)
+            x1, y1 = x2, y2
+        self._region(*bounds)[inside[::-1]] = color
+
+    def disk(self, x: float, y: float, diameter: float, color: Color) -> None:
+        radius = diameter * self.scale / 2
+        cx, cy = x * self.scale, y * self.scale
+        bounds = self._clip(
+            int(math.floor(cx - radius)),
+            int(math.ceil(cx + radius)),
+            int(math.floor(cy - radius)),
+            int(math.ceil(cy + radius)),
+        )
+        if bounds is None:
+            return
+        left, right, bottom, top = bounds
+        xs = np.arange(left, right) + 0.5 - cx
+        ys = np.arange(bottom, top) + 0.5 - cy
+        inside = xs[None, :] ** 2 + ys[:, None] ** 2 <= radius**2
+        self._region(*bounds)[inside[::-1]] = color
+
+    def rect(self, x: float, y: float, w: float, h: float, color: Color) -> None:
+        # The pixels whose centres polygon() would find inside the rectangle
+        left, right = np.ceil(np.array([x, x + w]) * self.scale - 0.5).astype(int)
+        bottom, top = np.ceil(np.array([y, y + h]) * self.scale - 0.5).astype(int)
+        bounds = self._clip(left, right, bottom, top)
+        if bounds is not None:
+            self._region(*bounds)[:] = color
+
+    def draw_shapes(self, shapes: Shapes) -> None:
+        # Fills first, then every outline in one pass, then the dots
+        for (x, y, w, h), fill in zip(shapes.rects, shapes.fills):
+            if not np.isnan(fill[0]):
+                self.rect(x, y, w, h, to_color(*fill))
+        starts, ends = segments(shapes)
+        if len(starts):
+            self.lines(starts, ends, (0, 0, 0))
+        for x, y, diameter in shapes.dots:
+            self.disk(x, y, diameter, (0, 0, 0))
+
+    def save(self, path: str) -> None:
+        write_png(path, self.pixels)
+
+
+class RasterTurtle:
+    # The subset of turtle.Turtle the tina scripts use, drawing onto a Canvas.
+    # Pen strokes are queued and drawn in bulk; fills are painted under the
+    # outline drawn while filling, as Tk does.
+
+    def __init__(self, canvas: Canvas) -> None:
+        self.canvas = canvas
+        self._x = 0.0
+        self._y = 0.0
+        self._heading = 0.0
+        self._down = True
+        self._pencolor: Color = (0, 0, 0)
+        self._fillcolor: Color = (0, 0, 0)
+        self._pensize = 1.0
+        self._strokes: List[Tuple[Color, float, List[Point]]] = []
+        self._fill: Optional[List[Point]] = None
+
+    def position(self) -> Tuple[float, float]:
+        return (self._x, self._y)
+
+    pos = position
+
+    def heading(self) -> float:
+        return self._heading
+
+    def setheading(self, to_angle: float) -> None:
+        self._heading = to_angle % 360
+
+    seth = setheading
+
+    def left(self, angle: float) -> None:
+        self.setheading(self._heading + angle)
+
+    def right(self, angle: float) -> None:
+        self.setheading(self._heading - angle)
+
+    def forward(self, distance: float) -> None:
+        angle = math.radians(self._heading)
+        self._move(
+            self._x + distance * math.cos(angle), self._y + distance * math.sin(angle)
+        )
+
+    def backward(self, distance: float) -> None:
+        self.forward(-distance)
+
+    fd = forward
+    bk = backward
+
+    def goto(
+        self, x: Union[float, Tuple[float, float]], y: Optional[float] = None
+    ) -> None:
+        if isinstance(x, tuple):
+            x, y = x
+        self._move(float(x), float(self._y if y is None else y))
+
+    setpos = goto
+
+    def _move(self, x: float, y: float) -> None:
+        if self._down:
+            stroke = self._strokes[-1] if self._strokes else None
+            if (
+                stroke is not None
+                and stroke[0] == self._pencolor
+                and stroke[1] == self._pensize
+                and stroke[2][-1] == (self._x, self._y)
+            ):
+                stroke[2].append((x, y))
+            else:
+                self._strokes.append(
+                    (self._pencolor, self._pensize, [(self._x, self._y), (x, y)])
+                )
+        if self._fill is not None:
+            self._fill.append((x, y))
+        self._x, self._y = x, y
+
+    def penup(self) -> None:
+        self._down = False
+
+    def pendown(self) -> None:
+        self._down = True
+
+    pu = penup
+    pd = pendown
+
+    def isdown(self) -> bool:
+        return self._down
+
+    def pensize(self, width: Optional[float] = None) -> float:
+        if width is not None:
+            self._pensize = width
+        return self._pensize
+
+    width = pensize
+
+    def pencolor(self, *args: Any) -> Color:
+        if args:
+            self._pencolor = to_color(*args)
+        return self._pencolor
+
+    def fillcolor(self, *args: Any) -> Color:
+        if args:
+            self._fillcolor = to_color(*args)
+        return self._fillcolor
+
+    def color(self, *args: Any) -> Tuple[Color, Color]:
+        if len(args) == 2:
+            self.pencolor(args[0])
+            self.fillcolor(args[1])
+        elif args:
+            self.pencolor(*args)
+            self.fillcolor(*args)
+        return self._pencolor, self._fillcolor
+
+    def begin_fill(self) -> None:
+        self.flush()
+        self._fill = [(self._x, self._y)]
+
+    def end_fill(self) -> None:
+        if self._fill is not None:
+            self.canvas.polygon(self._fill, self._fillcolor)
+            self._fill = None
+        self.flush()
+
+    def filling(self) -> bool:
+        return self._fill is not None
+
+    def dot(self, size: Optional[float] = None, *color: Any) -> None:
+        if size is None:
+            size = max(self._pensize + 4, 2 * self._pensize)
+        fill = self._pencolor
+        if color:
+            fill = to_color(*color)
+        if self._fill is None:
+            self.flush()
+        self.canvas.disk(self._x, self._y, size, fill)
+
+    def circle(
+        self, radius: float, extent: Optional[float] = None, steps: Optional[int] = None
+    ) -> None:
+        # The same polygon turtle.Turtle.circle draws
+        if extent is None:
+            extent = 360
+        if steps is None:
+            fraction = abs(extent) / 360
+            steps = 1 + int(min(11 + abs(radius) / 6.0, 59.0) * fraction)
+        w = extent / steps
+        w2 = 0.5 * w
+        length = 2.0 * radius * math.sin(math.radians(w2))
+        if radius < 0:
+            length, w, w2 = -length, -w, -w2
+        self.left(w2)
+        for _ in range(steps):
+            self.forward(length)
+            self.left(w)
+        self.left(-w2)
+
+    def begin_poly(self) -> None:
+        pass
+
+    def end_poly(self) -> None:
+        pass
+
+    def speed(self, speed: Optional[int] = None) -> int:
+        return 0
+
+    def shape(self, name: Optional[str] = None) -> str:
+        return "classic"
+
+    def hideturtle(self) -> None:
+        pass
+
+    def showturtle(self) -> None:
+        pass
+
+    def flush(self) -> None:
+        for color, width, points in self._strokes:
+            self.canvas.polyline(points, color, width)
+        self._strokes = []
+
+
+def render(
+    draw: Callable[[RasterTurtle], None],
+    width: float,
+    height: float,
+    scale: float = 1.0,
+) -> Canvas:
+    canvas = Canvas(width, height, scale)
+    t = RasterTurtle(canvas)
+    draw(t)
+    t.flush()
+    return canvas
+
+
+def render_shapes(shapes: Shapes, scale: float = 1.0) -> Canvas:
+    canvas = Canvas(shapes.size, shapes.size, scale)
+    canvas.draw_shapes(shapes)
+    return canvas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render a tina pattern to a PNG.")
+    parser.add_argument("pattern", choices=PATTERNS)
+    parser.add_argument("-o", "--output", help="PNG file (default: <pattern>.png)")
+    parser.add_argument("--scale", type=float, default=1.0, help="pixels per unit")
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="draw the pattern's geometry arrays instead of replaying its turtle moves",
+    )
+    args = parser.parse_args()
+
+    module = importlib.import_module(f"tina.{args.pattern}")
+    if args.bulk:
+        canvas = render_shapes(module.shapes(), args.scale)
+    else:
+        canvas = render(module.draw, module.size, module.size, args.scale)
+    canvas.save(args.output or f"{args.pattern}.png")
+
+
+if __name__ == "__main__":
+    main()
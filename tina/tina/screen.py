@@ -0,0 +1,86 @@
+import argparse
+import turtle
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from tina.geometry import Shapes
+from tina.pen import Pen
+
+
+def add_mode_arguments(parser: argparse.ArgumentParser) -> None:
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--animate", action="store_true", help="animate every segment as it is drawn"
+    )
+    mode.add_argument(
+        "--every",
+        type=int,
+        metavar="N",
+        help="draw instantly, updating the screen every N drawing steps",
+    )
+
+
+def draw_shapes(t: Pen, shapes: Shapes) -> None:
+    # Any pattern's geometry through the turtle API: each rect traced from
+    # its bottom left corner like the scripts do, then circles, then dots
+    t.penup()
+    for (x, y, w, h), fill in zip(shapes.rects, shapes.fills):
+        t.goto(x, y)
+        filled = not np.isnan(fill[0])
+        if filled:
+            t.fillcolor(*(float(c) for c in fill))
+            t.begin_fill()
+        t.pendown()
+        for heading, length in ((90, h), (0, w), (-90, h), (180, w)):
+            t.setheading(heading)
+            t.forward(length)
+        if filled:
+            t.end_fill()
+        t.penup()
+    for x, y, r in shapes.circles:
+        t.goto(x, y - r)
+        t.setheading(0)
+        t.pendown()
+        t.circle(r)
+        t.penup()
+    for x, y, diameter in shapes.dots:
+        t.goto(x, y)
+        t.dot(diameter)
+    t.setheading(0)
+
+
+def show(
+    draw: Callable[[Pen], None],
+    size: int,
+    animate: bool = False,
+    every: Optional[int] = None,
+) -> None:
+    screen = turtle.Screen()
+    screen.setup(width=size, height=size, startx=0, starty=0)
+    screen.screensize(size, size)
+    w, h = screen.screensize()
+    screen.setworldcoordinates(0, 0, w, h)
+
+    # With tracing off, turtle queues the drawing on the canvas and only
+    # repaints on screen.update(); tracer(n) repaints on every n-th step
+    if not animate:
+        screen.tracer(every or 0, 0)
+
+    t = turtle.Turtle()
+    t.shape("turtle")
+    t.speed(0)
+
+    draw(t)
+
+    screen.update()
+    turtle.done()
+
+
+def run(
+    draw: Callable[[Pen], None], size: int, argv: Optional[List[str]] = None
+) -> None:
+    parser = argparse.ArgumentParser(description="Draw the pattern with turtle.")
+    add_mode_arguments(parser)
+    args = parser.parse_args(argv)
+    show(draw, size, args.animate, args.every)
@@ -0,0 +1,242 @@
+#! /usr/bin/env python3
+
+import argparse
+import importlib
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
+
+import numpy as np
+
+from tina import brickwall, chessboard, dottywotty
+from tina.geometry import PARAMETERS, PATTERNS, Array, Shapes
+
+
+def num(value: float) -> str:
+    text = f"{value:.4f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+class SvgWriter:
+    # Writes elements straight to the file as they are added. Everything goes
+    # inside a group that flips y, so shapes are written in world coordinates
+    # with (0, 0) at the bottom left, as the turtle scripts draw them
+    def __init__(self, file: TextIO, size: float) -> None:
+        self.file = file
+        self.size = size
+        self._open: List[str] = []
+        self.file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self.start(
+            "svg",
+            xmlns="http://www.w3.org/2000/svg",
+            xmlns__xlink="http://www.w3.org/1999/xlink",
+            width=size,
+            height=size,
+            viewBox=f"0 0 {num(size)} {num(size)}",
+        )
+        self.element("rect", width=size, height=size, fill="white")
+        self.start("g", transform=f"matrix(1 0 0 -1 0 {num(size)})")
+
+    def _tag(self, tag: str, attrs: Dict[str, Any]) -> str:
+        # Keyword arguments use _ for - and __ for :
+        parts = [tag]
+        for key, value in attrs.items():
+            name = key.replace("__", ":").replace("_", "-")
+            text = num(value) if isinstance(value, (int, float)) else str(value)
+            parts.append(f'{name}="{text}"')
+        return " ".join(parts)
+
+    def element(self, tag: str, **attrs: Any) -> None:
+        self.file.write(f"{'  ' * len(self._open)}<{self._tag(tag, attrs)}/>\n")
+
+    def start(self, tag: str, **attrs: Any) -> None:
+        self.file.write(f"{'  ' * len(self._open)}<{self._tag(tag, attrs)}>\n")
+        self._open.append(tag)
+
+    def end(self) -> None:
+        tag = self._open.pop()
+        self.file.write(f"{'  ' * len(self._open)}</{tag}>\n")
+
+    def close(self) -> None:
+        while self._open:
+            self.end()
+
+
+STROKE = {"stroke": "black", "stroke_width": 1}
+
+
+def fill_color(rgb: Array) -> str:
+    # NaN or negative components mean no fill
+    if not rgb[0] >= 0:
+        return "none"
+    r, g, b = np.round(rgb * 255).astype(int)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def write_shapes(out: SvgWriter, shapes: Shapes) -> None:
+    # Any pattern: one definition per distinct shape, then a <use> for every
+    # copy of it
+    out.start("defs")
+    uses: List[Tuple[str, Array]] = []
+    # NaN never equals itself, so unfilled rects are keyed with -1 instead
+    keys = np.column_stack([shapes.rects[:, 2:], np.nan_to_num(shapes.fills, nan=-1)])
+    unique, which = np.unique(keys, axis=0, return_inverse=True)
+    for i, (w, h, *rgb) in enumerate(unique):
+        fill = fill_color(np.array(rgb))
+        out.element("rect", id=f"r{i}", width=w, height=h, fill=fill, **STROKE)
+    uses += [(f"r{i}", xy) for i, xy in zip(which.ravel(), shapes.rects[:, :2])]
+
+    for kind, items, radii, style in (
+        ("c", shapes.circles, shapes.circles[:, 2], {"fill": "none", **STROKE}),
+        ("d", shapes.dots, shapes.dots[:, 2] / 2, {"fill": "black"}),
+    ):
+        unique, which = np.unique(radii, return_inverse=True)
+        for i, r in enumerate(unique):
+            out.element("circle", id=f"{kind}{i}", r=r, **style)
+        uses += [(f"{kind}{i}", xy) for i, xy in zip(which.ravel(), items[:, :2])]
+    out.end()
+
+    for ref, (x, y) in uses:
+        out.element("use", xlink__href=f"#{ref}", x=x, y=y)
+
+
+def write_tiled(
+    out: SvgWriter, name: str, width: float, height: float, draw: Callable[[], None]
+) -> None:
+    # Fills the whole pattern with a <pattern> tile of the given size whose
+    # contents draw() writes, then outlines the border
+    out.start("defs")
+    out.start(
+        "pattern", id=name, width=width, height=height, patternUnits="userSpaceOnUse"
+    )
+    draw()
+    out.end()
+    out.end()
+    out.element("rect", width=out.size, height=out.size, fill=f"url(#{name})")
+    out.element("rect", width=out.size, height=out.size, fill="none", **STROKE)
+
+
+def write_brickwall(
+    out: SvgWriter,
+    bricks_in_row: int = brickwall.bricks_in_row,
+    bricks_in_col: int = brickwall.bricks_in_col,
+    stagger_ratio: float = brickwall.stagger_ratio,
+) -> None:
+    # Two rows of mortar lines, the upper one offset by stagger_ratio; lines on
+    # both edges of the tile so each keeps its full width when clipped
+    w = out.size / bricks_in_row
+    h = out.size / bricks_in_col
+    s = stagger_ratio * w
+    path = (
+        f"M0 0H{num(w)}M0 {num(h)}H{num(w)}M0 {num(2 * h)}H{num(w)}"
+        f"M0 0V{num(h)}M{num(w)} 0V{num(h)}M{num(s)} {num(h)}V{num(2 * h)}"
+    )
+    write_tiled(out, "bricks", w, 2 * h, lambda: out.element("path", d=path, **STROKE))
+
+
+def write_chessboard(
+    out: SvgWriter, squares_on_axis: int = chessboard.squares_on_axis
+) -> None:
+    # Two white and two black squares, with the grid lines on top
+    s = out.size / squares_on_axis
+
+    def draw() -> None:
+        out.element("rect", width=2 * s, height=2 * s, fill="white")
+        square = f"h{num(s)}v{num(s)}h-{num(s)}z"
+        out.element("path", d=f"M{num(s)} 0{square}M0 {num(s)}{square}", fill="black")
+        lines = "".join(
+            f"M{num(k * s)} 0V{num(2 * s)}M0 {num(k * s)}H{num(2 * s)}"
+            for k in range(3)
+        )
+        out.element("path", d=lines, fill="none", **STROKE)
+
+    write_tiled(out, "board", 2 * s, 2 * s, draw)
+
+
+def write_dottywotty(
+    out: SvgWriter,
+    cell_count: int = dottywotty.cell_count,
+    dot_size: float = dottywotty.dot_size,
+    text: Optional[str] = dottywotty.text,
+) -> None:
+    # One dot per cell from a pattern, masked out over the letters; dots bigger
+    # than their cells would be clipped by the tile, so those are written one
+    # by one
+    s = out.size / cell_count
+    if dot_size > s:
+        params = {"cell_count": cell_count, "dot_size": dot_size, "text": text}
+        write_shapes(out, dottywotty.shapes(size=out.size, **params))
+        return
+
+    # The letters' cells as one rectangle per horizontal run
+    mask = dottywotty.letter_mask(cell_count, text)
+    edges = np.diff(np.pad(mask, ((0, 0), (1, 1))).astype(np.int8), axis=1)
+    starts = np.argwhere(edges == 1)
+    ends = np.argwhere(edges == -1)[:, 1]
+    holes = "".join(
+        f"M{num(x * s)} {num(y * s)}h{num(w)}v{num(s)}h-{num(w)}z"
+        for (y, x), w in zip(starts, (ends - starts[:, 1]) * s)
+    )
+    out.start("defs")
+    out.start("pattern", id="dots", width=s, height=s, patternUnits="userSpaceOnUse")
+    out.element("circle", cx=s / 2, cy=s / 2, r=dot_size / 2, fill="black")
+    out.end()
+    out.start("mask", id="j")
+    out.element("rect", width=out.size, height=out.size, fill="white")
+    if holes:
+        out.element("path", d=holes, fill="black")
+    out.end()
+    out.end()
+    out.element(
+        "rect", width=out.size, height=out.size, fill="url(#dots)", mask="url(#j)"
+    )
+
+
+WRITERS: Dict[str, Callable[..., None]] = {
+    "brickwall": write_brickwall,
+    "chessboard": write_chessboard,
+    "dottywotty": write_dottywotty,
+}
+
+
+def write_svg(
+    file: TextIO, pattern: str, params: Dict[str, Any], tiled: bool = True
+) -> None:
+    # Repeating patterns collapse to a <pattern> tile; anything else, or
+    # every pattern when tiled is False, is written as <defs> and <use>
+    module = importlib.import_module(f"tina.{pattern}")
+    out = SvgWriter(file, params.get("size", module.size))
+    if tiled and pattern in WRITERS:
+        WRITERS[pattern](out, **{k: v for k, v in params.items() if k != "size"})
+    else:
+        write_shapes(out, module.shapes(**params))
+    out.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write a tina pattern as SVG.")
+    parser.add_argument("pattern", choices=PATTERNS)
+    parser.add_argument("-o", "--output", help="SVG file (default: stdout)")
+    parser.add_argument("--value", type=int, help="the pattern's main parameter")
+    parser.add_argument(
+        "--no-tiles",
+        action="store_true",
+        help="write every shape as a <use> instead of a repeating <pattern>",
+    )
+    args = parser.parse_args()
+
+    params = {}
+    if args.value is not None:
+        params[PARAMETERS[args.pattern][0]] = args.value
+    started = time.perf_counter()
+    if args.output is None:
+        write_svg(sys.stdout, args.pattern, params, not args.no_tiles)
+        return
+    with open(args.output, "w") as f:
+        write_svg(f, args.pattern, params, not args.no_tiles)
+    elapsed = time.perf_counter() - started
+    print(f"{args.output}: {elapsed * 1e3:.1f} ms", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
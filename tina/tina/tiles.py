@@ -0,0 +1,161 @@
+#! /usr/bin/env python3
+
+import argparse
+import importlib
+import multiprocessing
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from tina.geometry import PATTERNS, Array, Shapes
+from tina.raster import Canvas, Pixels, PngWriter
+
+# left, top, width, height in pixels, from the top left of the image
+Window = Tuple[int, int, int, int]
+
+# Set in each worker process by _init
+_shapes: Optional[Shapes] = None
+_scale = 1.0
+_output: Optional[str] = None
+
+
+def band(width: int, height: int, tile: int, top: int) -> List[Window]:
+    # The tiles of the band of rows starting at top
+    rows = min(tile, height - top)
+    return [
+        (left, top, min(tile, width - left), rows) for left in range(0, width, tile)
+    ]
+
+
+def crop(shapes: Shapes, low: Tuple[float, float], high: Tuple[float, float]) -> Shapes:
+    # The shapes whose bounding boxes reach the world box from low to high
+    x, y, w, h = shapes.rects.T
+    rects = (x <= high[0]) & (x + w >= low[0]) & (y <= high[1]) & (y + h >= low[1])
+
+    def round_shapes(items: Array, radius: Array) -> npt.NDArray[np.bool_]:
+        cx, cy = items[:, 0], items[:, 1]
+        reach: npt.NDArray[np.bool_] = (
+            (cx - radius <= high[0])
+            & (cx + radius >= low[0])
+            & (cy - radius <= high[1])
+            & (cy + radius >= low[1])
+        )
+        return reach
+
+    circles = round_shapes(shapes.circles, shapes.circles[:, 2])
+    dots = round_shapes(shapes.dots, shapes.dots[:, 2] / 2)
+    return Shapes(
+        shapes.size,
+        shapes.rects[rects],
+        shapes.fills[rects],
+        shapes.circles[circles],
+        shapes.dots[dots],
+    )
+
+
+def render_tile(shapes: Shapes, scale: float, window: Window) -> Pixels:
+    canvas = Canvas(shapes.size, shapes.size, scale, window=window)
+    left, top, width, height = window
+    # A few pixels of margin keep the pen width of shapes just outside
+    margin = 2 + scale
+    low = ((left - margin) / scale, (canvas.height - top - height - margin) / scale)
+    high = ((left + width + margin) / scale, (canvas.height - top + margin) / scale)
+    canvas.draw_shapes(crop(shapes, low, high))
+    return canvas.pixels
+
+
+def _init(
+    pattern: str, params: Dict[str, Any], scale: float, output: Optional[str]
+) -> None:
+    global _shapes, _scale, _output
+    _shapes = importlib.import_module(f"tina.{pattern}").shapes(**params)
+    _scale = scale
+    _output = output
+
+
+def _render(window: Window) -> Tuple[Window, Optional[Pixels]]:
+    assert _shapes is not None
+    pixels = render_tile(_shapes, _scale, window)
+    if _output is None:
+        return window, pixels
+
+    # Write straight into the memory-mapped image rather than sending the
+    # pixels back to the parent
+    image = np.load(_output, mmap_mode="r+")
+    left, top, width, height = window
+    image[top : top + height, left : left + width] = pixels
+    image.flush()
+    return window, None
+
+
+def render_tiled(
+    pattern: str,
+    output: str,
+    scale: float = 1.0,
+    tile: int = 1024,
+    processes: Optional[int] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> Tuple[int, int]:
+    # Renders into a .npy file through a memory map, or streams a PNG a band
+    # of tiles at a time. Either way at most two bands of pixels are held in
+    # memory, whatever the size of the image
+    module = importlib.import_module(f"tina.{pattern}")
+    params = params or {}
+    side = max(1, round(params.get("size", module.size) * scale))
+
+    if output.endswith(".npy"):
+        # Creates the file; the workers open it again to write their tiles
+        np.lib.format.open_memmap(
+            output, mode="w+", dtype=np.uint8, shape=(side, side, 3)
+        ).flush()
+        with multiprocessing.Pool(
+            processes, _init, (pattern, params, scale, output)
+        ) as pool:
+            tiles = [
+                w for top in range(0, side, tile) for w in band(side, side, tile, top)
+            ]
+            for _ in pool.imap_unordered(_render, tiles):
+                pass
+        return side, side
+
+    writer = PngWriter(output, side, side)
+    with multiprocessing.Pool(processes, _init, (pattern, params, scale, None)) as pool:
+        pending = pool.map_async(_render, band(side, side, tile, 0))
+        for top in range(0, side, tile):
+            # Render the next band while this one is compressed and written
+            results = pending.get()
+            if top + tile < side:
+                pending = pool.map_async(_render, band(side, side, tile, top + tile))
+            rows = np.empty((results[0][0][3], side, 3), dtype=np.uint8)
+            for (left, _, width, _), pixels in results:
+                assert pixels is not None
+                rows[:, left : left + width] = pixels
+            writer.write(rows)
+    writer.close()
+    return side, side
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Render a tina pattern in tiles across a process pool."
+    )
+    parser.add_argument("pattern", choices=PATTERNS)
+    parser.add_argument("-o", "--output", help="PNG or .npy file (default: PNG)")
+    parser.add_argument("--scale", type=float, default=1.0, help="pixels per unit")
+    parser.add_argument("--tile", type=int, default=1024, help="tile side in pixels")
+    parser.add_argument("--processes", type=int, help="worker processes")
+    args = parser.parse_args()
+
+    output = args.output or f"{args.pattern}.png"
+    started = time.perf_counter()
+    width, height = render_tiled(
+        args.pattern, output, args.scale, args.tile, args.processes
+    )
+    elapsed = time.perf_counter() - started
+    print(f"{output}: {width}x{height} in {elapsed:.1f} s")
+
+
+if __name__ == "__main__":
+    main()